@@ -1,11 +1,54 @@
 import tkinter as tk
+import json
 import os
+import queue
 import subprocess
 import threading
+import time
 import sys
 
+from Parallelization_Problems.CLI import reproducible
+from Parallelization_Problems.Dashboard import PRESETS, Run, RunPool
+from Parallelization_Problems.Graph import WaitForGraph
+
 # Globální proces pro simulaci
 current_process = None
+STOP_TIMEOUT = 1.0  # Doba (v s), po kterou se čeká na kooperativní ukončení simulace, než je násilně ukončena
+STOP_POLL_INTERVAL = 50  # Interval (v ms), ve kterém se po zastavení kontroluje, zda simulace skončila
+MENU_WIDTH = 600
+MENU_HEIGHT = 480
+
+# Panel souběžných běhů
+run_pool = None  # Sdílený fond běhů (Dashboard.RunPool), vytváří se při otevření panelu
+DASHBOARD_WIDTH = 1200
+DASHBOARD_HEIGHT = 720
+PANEL_COLUMNS = 3
+MAX_LINES_PER_FRAME = 600  # Nejvyšší počet řádků výstupu vykreslených za snímek, dělí se spravedlivě mezi běhy
+MAX_PANEL_LINES = 300  # Panel uchovává jen posledních N řádků výstupu
+DEFAULT_RUNS = ("Deadlock (timeout)", "Livelock", "Starvation")
+VERDICT_COLORS = {"DEADLOCK": "#f44336", "LIVELOCK": "#FF9800", "VYHLADOVĚNÍ": "#9C27B0"}
+
+# Graf čekání
+FRAME_INTERVAL = 50  # Interval překreslení grafu v ms (20 snímků za sekundu)
+MAX_EVENTS_PER_FRAME = 5000  # Nejvyšší počet událostí zpracovaných v jednom snímku
+GRAPH_WIDTH = 580
+GRAPH_HEIGHT = 250
+NODE_SPACING = 40  # Vzdálenost sousedních uzlů v px
+NODE_RADIUS = 9
+PROCESS_COLUMNS = 8  # Procesy zabírají levou část plátna, prostředky pravou
+RESOURCE_COLUMNS = 5
+SIMULATION_SEED = 1  # Semínko běhů z GUI; opakovatelný scénář se stejnou konfigurací se přehraje z cache
+REPLAY_SPEEDS = {"1×": 1.0, "4×": 4.0, "okamžitě": 0.0}  # Rychlost přehrání událostí z cache
+COLORS = {
+    "process": "#2196F3",
+    "resource": "#4CAF50",
+    "cycle": "#f44336",
+    "deadlock": "#f44336",
+    "livelock": "#FF9800",
+    "starved": "#9C27B0",
+    "hold": "#555555",
+    "wait": "#FF9800",
+}
 
 def get_simulation_file(sim_type):
     """
@@ -20,6 +63,19 @@ def get_simulation_file(sim_type):
     return path
 
 
+def cache_options(sim_type):
+    """
+    Vrátí argumenty příkazové řádky pro cache výsledků, pokud výsledek scénáře určuje semínko
+    (viz CLI.reproducible). Vláknové scénáře závisí na plánování vláken, a proto se spouští vždy znovu.
+
+    Parametry:
+    sim_type (str): Typ simulace (např. "Deadlock", "Livelock", "Starvation").
+    """
+    if not reproducible(sim_type.lower(), "threads"):
+        return []
+    return ["--seed", str(SIMULATION_SEED), "--cache"]
+
+
 def show_simulation(sim_type, title):
     """
     Zobrazí obrazovku simulace s daným typem simulace a názvem.
@@ -48,34 +104,65 @@ def show_simulation(sim_type, title):
 
     tk.Button(button_frame, text="Spustit simulaci", command=lambda: simulate(sim_type, code_field), bg="#4CAF50", fg="white", font=("Arial", 12, "bold"), width=15)\
         .grid(row=0, column=0, padx=10)
-    tk.Button(button_frame, text="Zpět do menu", command=show_menu, bg="#f44336", fg="white", font=("Arial", 12, "bold"), width=15)\
+    tk.Button(button_frame, text="Graf čekání", command=lambda: show_graph(sim_type, title), bg="#2196F3", fg="white", font=("Arial", 12, "bold"), width=12)\
         .grid(row=0, column=1, padx=10)
+    tk.Button(button_frame, text="Zpět do menu", command=show_menu, bg="#f44336", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=2, padx=10)
+
+
+def stop_current_process():
+    """
+    Ukončí běžící simulaci bez čekání, takže hlavní vlákno GUI nezamrzne. Příkazová řádka na SIGTERM
+    běh kooperativně zruší (procesy uvolní prostředky a vlákna skončí během milisekund); pokud simulace
+    neskončí do STOP_TIMEOUT, ukončí ji násilně kill_if_running.
+    """
+    global current_process
+
+    if current_process and current_process.poll() is None:
+        current_process.terminate()
+        kill_if_running(current_process, time.monotonic() + STOP_TIMEOUT)
+    current_process = None
+
+
+def kill_if_running(process, deadline):
+    """
+    Každých STOP_POLL_INTERVAL ms zkontroluje, zda zastavená simulace skončila, a po termínu ji ukončí násilně.
+
+    Parametry:
+    process (subprocess.Popen): Zastavovaný proces simulace.
+    deadline (float): Termín (time.monotonic()) pro kooperativní ukončení.
+    """
+    if process.poll() is not None:
+        return
+    if time.monotonic() >= deadline:
+        process.kill()
+        return
+    root.after(STOP_POLL_INTERVAL, kill_if_running, process, deadline)
 
 
 def simulate(sim_type, code_field):
     """
-    Spustí vybranou simulaci a zobrazí výstup ve zvoleném textovém poli.
-    Pokud již simulace běží, ukončí ji před spuštěním nové.
+    Spustí vybranou simulaci přes příkazovou řádku (CLI.py) a zobrazí výstup ve zvoleném textovém poli:
+    průběh simulace a na konec záznam s výsledkem. Opakovatelný scénář se stejnou konfigurací
+    se přehraje z cache (viz cache_options). Pokud již simulace běží, ukončí ji před spuštěním nové.
 
     Parametry:
     sim_type (str): Typ simulace, kterou chcete spustit (např. "Deadlock", "Livelock", "Starvation").
     code_field (tk.Text): Textové pole pro zobrazení výstupu simulace.
     """
-    global current_process
-
     # Ukončí aktuální proces, pokud stále běží
-    if current_process and current_process.poll() is None:
-        current_process.terminate()
-        current_process = None
+    stop_current_process()
 
     code_field.delete("1.0", "end")
 
-    simulation_file = get_simulation_file(sim_type)
+    cli_file = get_simulation_file("CLI")
 
-    if not os.path.exists(simulation_file):
-        code_field.insert("end", f"Soubor {simulation_file} nebyl nalezen.\n")
+    if not os.path.exists(cli_file):
+        code_field.insert("end", f"Soubor {cli_file} nebyl nalezen.\n")
         return
 
+    command = ["python", cli_file, "--scenario", sim_type.lower(), "--verbose", *cache_options(sim_type)]
+
     def run_simulation():
         """
         Spustí simulaci v samostatném vlákně a zachytává její výstup.
@@ -83,10 +170,11 @@ def simulate(sim_type, code_field):
         global current_process
         try:
             current_process = subprocess.Popen(
-                ["python", simulation_file],
+                command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                encoding="utf-8"
             )
 
             def read_output(pipe, tag):
@@ -125,22 +213,434 @@ def simulate(sim_type, code_field):
     threading.Thread(target=run_simulation, daemon=True).start()
 
 
+class GraphView:
+    def __init__(self, canvas):
+        """
+        Inicializuje kreslení grafu čekání na plátno.
+
+        Události se pouze zapracují do modelu (WaitForGraph) a změněné prvky se zapamatují.
+        Překresluje se až metodou redraw, a to jen změněné uzly a hrany, takže i graf
+        se stovkami uzlů se obnovuje plynule.
+
+        Parametry:
+        canvas (tk.Canvas): Plátno, na které se graf kreslí.
+        """
+        self.canvas = canvas
+        self.graph = WaitForGraph()
+        self.items = {}  # Klíč uzlu nebo hrany -> id prvků na plátně
+        self.dirty = set()
+        self.run_id = 0
+
+    def reset(self):
+        """
+        Smaže graf před novým během simulace.
+        """
+        self.canvas.delete("all")
+        self.graph = WaitForGraph()
+        self.items.clear()
+        self.dirty.clear()
+        self.run_id += 1
+
+    def feed(self, event):
+        """
+        Zapracuje událost simulace do modelu bez překreslení.
+
+        Parametry:
+        event (dict): Událost ve formátu slovníku (viz Events.emit).
+        """
+        self.dirty |= self.graph.apply(event)
+
+    def redraw(self):
+        """
+        Překreslí prvky změněné od posledního snímku. Uzly se kreslí dříve než hrany,
+        aby hrany znaly polohu svých konců.
+        """
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, set()
+        new_nodes = False
+        for key in dirty:
+            if key[0] in ("p", "r"):
+                new_nodes |= self._draw_node(key)
+        for key in dirty:
+            if key[0] in ("hold", "wait"):
+                self._draw_edge(key)
+        if new_nodes:
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def position(self, key):
+        """
+        Vrátí pevnou polohu středu uzlu, takže přidání uzlu nikdy nepřesouvá ostatní.
+
+        Parametry:
+        key (tuple): Klíč uzlu ("p", proces) nebo ("r", prostředek).
+        """
+        if key[0] == "p":
+            index, columns, left = self.graph.processes[key[1]], PROCESS_COLUMNS, 0
+        else:
+            index, columns, left = self.graph.resources[key[1]], RESOURCE_COLUMNS, PROCESS_COLUMNS + 1
+        row, column = divmod(index, columns)
+        return (left + column) * NODE_SPACING + NODE_SPACING // 2, row * NODE_SPACING + NODE_SPACING // 2
+
+    def _node_color(self, key):
+        if key[0] == "r":
+            return COLORS["resource"]
+        if key[1] in self.graph.cycles:
+            return COLORS["cycle"]
+        return COLORS.get(self.graph.flags.get(key[1]), COLORS["process"])
+
+    def _draw_node(self, key):
+        color = self._node_color(key)
+        if key in self.items:
+            self.canvas.itemconfigure(self.items[key][0], fill=color)
+            return False
+
+        x, y = self.position(key)
+        r = NODE_RADIUS
+        if key[0] == "p":
+            shape = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, outline="")
+        else:
+            shape = self.canvas.create_rectangle(x - r, y - r, x + r, y + r, fill=color, outline="")
+        label = self.canvas.create_text(x, y + r + 5, text=key[1], font=("Arial", 6))
+        self.items[key] = (shape, label)
+        return True
+
+    def _draw_edge(self, key):
+        if key[0] == "hold":
+            source, target = key[1], self.graph.holders.get(key[1])
+            start, end = ("r", source), ("p", target)
+        else:
+            source, target = key[1], self.graph.waiting.get(key[1])
+            start, end = ("p", source), ("r", target)
+
+        item = self.items.get(key)
+        if target is None:
+            if item is not None:
+                self.canvas.delete(item[0])
+                del self.items[key]
+            return
+
+        coords = self._edge_coords(self.position(start), self.position(end))
+        in_cycle = self.graph.edge_in_cycle(key)
+        color = COLORS["cycle"] if in_cycle else COLORS[key[0]]
+        width = 2 if in_cycle else 1
+        if item is None:
+            line = self.canvas.create_line(*coords, arrow="last", fill=color, width=width,
+                                           dash=(3, 2) if key[0] == "wait" else ())
+            self.canvas.tag_lower(line)
+            self.items[key] = (line,)
+        else:
+            self.canvas.coords(item[0], *coords)
+            self.canvas.itemconfigure(item[0], fill=color, width=width)
+
+    @staticmethod
+    def _edge_coords(start, end):
+        # Šipka končí na okraji cílového uzlu, ne v jeho středu
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        length = max((dx * dx + dy * dy) ** 0.5, 1)
+        shift = NODE_RADIUS / length
+        return (start[0] + dx * shift, start[1] + dy * shift, end[0] - dx * shift, end[1] - dy * shift)
+
+
+def show_graph(sim_type, title):
+    """
+    Zobrazí obrazovku s živým grafem čekání pro daný typ simulace.
+
+    Parametry:
+    sim_type (str): Typ simulace (např. "Deadlock", "Livelock", "Starvation").
+    title (str): Název okna simulace.
+    """
+    for widget in root.winfo_children():
+        widget.destroy()
+
+    root.title(title)
+
+    tk.Label(root, text=f"{sim_type} - graf čekání", font=("Arial", 16, "bold"), bg="#f0f8ff").pack(pady=5)
+
+    # Plátno s posuvníkem pro grafy, které se na obrazovku nevejdou
+    canvas_frame = tk.Frame(root, bg="#f0f8ff")
+    canvas_frame.pack(padx=10)
+    canvas = tk.Canvas(canvas_frame, width=GRAPH_WIDTH - 20, height=GRAPH_HEIGHT, bg="white", highlightthickness=0)
+    scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
+    canvas.configure(yscrollcommand=scrollbar.set)
+    canvas.pack(side="left")
+    scrollbar.pack(side="right", fill="y")
+
+    status = tk.Label(root, text="○ proces  □ prostředek  červeně cyklus, fialově hladovění, oranžově livelock",
+                      font=("Arial", 9), bg="#f0f8ff")
+    status.pack(pady=5)
+
+    view = GraphView(canvas)
+    cacheable = bool(cache_options(sim_type))
+    use_cache = tk.BooleanVar(value=cacheable)
+    replay_speed = tk.StringVar(value="1×")
+
+    button_frame = tk.Frame(root, bg="#f0f8ff")
+    button_frame.pack(pady=5)
+
+    tk.Button(button_frame, text="Spustit simulaci", command=lambda: simulate_graph(sim_type, view, status, use_cache.get(), REPLAY_SPEEDS[replay_speed.get()]), bg="#4CAF50", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=0, padx=10)
+    tk.Button(button_frame, text="Zpět", command=lambda: show_simulation(sim_type, title), bg="#f44336", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=1, padx=10)
+    tk.Checkbutton(button_frame, text="Cache", variable=use_cache, bg="#f0f8ff",
+                   state="normal" if cacheable else "disabled")\
+        .grid(row=0, column=2)
+    tk.OptionMenu(button_frame, replay_speed, *REPLAY_SPEEDS)\
+        .grid(row=0, column=3)
+
+
+def simulate_graph(sim_type, view, status, use_cache=True, replay_speed=1.0):
+    """
+    Spustí simulaci přes příkazovou řádku s průběžným výpisem událostí a kreslí graf čekání.
+
+    Události čte vlákno do fronty; hlavní vlákno tkinteru frontu vybírá jednou za FRAME_INTERVAL,
+    takže i tisíce událostí za sekundu znamenají nejvýše jedno překreslení na snímek.
+    S cache se opakovaný běh opakovatelného scénáře nad stejnou konfigurací nepočítá znovu,
+    ale přehraje se jeho záznam (viz cache_options).
+
+    Parametry:
+    sim_type (str): Typ simulace (např. "Deadlock", "Livelock", "Starvation").
+    view (GraphView): Zobrazení grafu.
+    status (tk.Label): Popisek pro stav simulace.
+    use_cache (bool): Zda použít cache výsledků.
+    replay_speed (float): Rychlost přehrání záznamu z cache (0 = okamžitě).
+    """
+    global current_process
+
+    stop_current_process()
+
+    view.reset()
+    run_id = view.run_id
+    cli_file = get_simulation_file("CLI")
+    if not os.path.exists(cli_file):
+        status.configure(text=f"Soubor {cli_file} nebyl nalezen.")
+        return
+
+    command = ["python", cli_file, "--scenario", sim_type.lower(), "--events", "--format", "jsonl"]
+    if use_cache and cache_options(sim_type):
+        command += [*cache_options(sim_type), "--replay-speed", str(replay_speed)]
+
+    try:
+        current_process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8"
+        )
+    except Exception as e:
+        status.configure(text=f"Došlo k chybě: {e}")
+        return
+
+    events = queue.Queue()
+    state = {"cached": False}
+
+    def read_events(pipe):
+        """
+        Čte řádky JSON ze standardního výstupu simulace a vkládá je do fronty.
+        """
+        for line in iter(pipe.readline, ''):
+            try:
+                events.put(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+        pipe.close()
+        events.put(None)  # Konec simulace
+
+    threading.Thread(target=read_events, args=(current_process.stdout,), daemon=True).start()
+
+    def refresh():
+        """
+        Zpracuje události nashromážděné od posledního snímku a překreslí změněné prvky.
+        """
+        if not view.canvas.winfo_exists() or view.run_id != run_id:
+            return
+        finished = False
+        for _ in range(MAX_EVENTS_PER_FRAME):
+            try:
+                record = events.get_nowait()
+            except queue.Empty:
+                break
+            if record is None:
+                finished = True
+                break
+            if record.get("type") == "event":
+                view.feed(record)
+            else:
+                state["cached"] = state["cached"] or record.get("cached", False)
+        view.redraw()
+
+        graph = view.graph
+        text = (f"Procesy: {len(graph.processes)}, prostředky: {len(graph.resources)}, "
+                f"procesy v cyklu: {len(graph.cycles)}, verdikty: {len(graph.flags)}")
+        if finished:
+            text += " - přehráno z cache." if state["cached"] else " - simulace dokončena."
+        status.configure(text=text)
+        if not finished:
+            root.after(FRAME_INTERVAL, refresh)
+
+    root.after(FRAME_INTERVAL, refresh)
+
+
+class RunPanel:
+    def __init__(self, parent, run, index):
+        """
+        Inicializuje panel jednoho běhu s výstupem, dobou běhu a verdiktem.
+
+        Parametry:
+        parent (tk.Frame): Rámec, do kterého se panel vloží.
+        run (Run): Zobrazovaný běh.
+        index (int): Pořadí panelu (určuje řádek a sloupec mřížky).
+        """
+        self.run = run
+        self.frame = tk.LabelFrame(parent, text=run.name, font=("Arial", 11, "bold"), bg="#f0f8ff")
+        row, column = divmod(index, PANEL_COLUMNS)
+        self.frame.grid(row=row, column=column, padx=5, pady=5, sticky="n")
+
+        header = tk.Frame(self.frame, bg="#f0f8ff")
+        header.pack(fill="x")
+        self.status = tk.Label(header, font=("Arial", 9), bg="#f0f8ff", anchor="w")
+        self.status.pack(side="left", fill="x", expand=True)
+        tk.Button(header, text="Zastavit", command=run.stop, font=("Arial", 8)).pack(side="right")
+
+        self.output = tk.Text(self.frame, width=50, height=12, font=("Courier New", 8), wrap="word")
+        self.output.pack(padx=5, pady=5)
+        self.shown_dropped = 0
+
+    def append(self, lines):
+        """
+        Připíše řádky výstupu; starší řádky nad MAX_PANEL_LINES se smažou.
+
+        Parametry:
+        lines (list): Řádky výstupu.
+        """
+        if self.run.dropped > self.shown_dropped:
+            self.output.insert("end", f"... vynecháno {self.run.dropped - self.shown_dropped} řádků ...\n")
+            self.shown_dropped = self.run.dropped
+        self.output.insert("end", "".join(lines))
+        excess = int(self.output.index("end-1c").split(".")[0]) - MAX_PANEL_LINES
+        if excess > 0:
+            self.output.delete("1.0", f"{excess + 1}.0")
+        self.output.see("end")
+
+    def update(self):
+        """
+        Obnoví dobu běhu a verdikt.
+        """
+        elapsed = self.run.elapsed
+        verdict = self.run.verdict()
+        text = f"{elapsed:.1f} s | {verdict}" if elapsed is not None else verdict
+        color = next((c for key, c in VERDICT_COLORS.items() if verdict.startswith(key)), "black")
+        self.status.configure(text=text, fg=color)
+
+
+def stop_dashboard_runs():
+    """
+    Zastaví všechny běhy panelu souběžných běhů a ukončí sdílený fond.
+    """
+    global run_pool
+
+    if run_pool is not None:
+        run_pool.shutdown()
+    run_pool = None
+
+
+def show_dashboard():
+    """
+    Zobrazí panel souběžných běhů: vybrané scénáře a varianty konfigurace běží najednou
+    ve sdíleném fondu a každý má vlastní panel s výstupem, dobou běhu a verdiktem.
+
+    Výstup všech běhů vybírá jediná smyčka hlavního vlákna jednou za FRAME_INTERVAL a rozpočet
+    MAX_LINES_PER_FRAME dělí mezi běhy rovným dílem, takže výřečný běh nezdrží obnovu ostatních panelů.
+    """
+    global run_pool
+
+    stop_current_process()
+    stop_dashboard_runs()
+    run_pool = RunPool()
+    pool = run_pool
+
+    for widget in root.winfo_children():
+        widget.destroy()
+
+    root.title("Souběžné běhy")
+    center_window(root, DASHBOARD_WIDTH, DASHBOARD_HEIGHT)
+
+    tk.Label(root, text="Souběžné běhy", font=("Arial", 16, "bold"), bg="#f0f8ff").pack(pady=5)
+
+    # Výběr předvoleb
+    selection_frame = tk.Frame(root, bg="#f0f8ff")
+    selection_frame.pack()
+    selected = {}
+    for i, name in enumerate(PRESETS):
+        selected[name] = tk.BooleanVar(value=name in DEFAULT_RUNS)
+        tk.Checkbutton(selection_frame, text=name, variable=selected[name], bg="#f0f8ff")\
+            .grid(row=i // 4, column=i % 4, sticky="w", padx=5)
+
+    # Posouvatelná plocha s panely
+    area = tk.Frame(root, bg="#f0f8ff")
+    area.pack(fill="both", expand=True, padx=10, pady=5)
+    canvas = tk.Canvas(area, bg="#f0f8ff", highlightthickness=0)
+    scrollbar = tk.Scrollbar(area, orient="vertical", command=canvas.yview)
+    canvas.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+    canvas.pack(side="left", fill="both", expand=True)
+    panels_frame = tk.Frame(canvas, bg="#f0f8ff")
+    canvas.create_window((0, 0), window=panels_frame, anchor="nw")
+    panels_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    panels = []
+
+    cli_file = get_simulation_file("CLI")
+
+    def start_selected():
+        """
+        Zařadí vybrané předvolby do fondu a vytvoří jejich panely.
+        """
+        for name, variable in selected.items():
+            if variable.get():
+                command = ["python", cli_file, *PRESETS[name], "--format", "jsonl", "--verbose"]
+                run = pool.submit(Run(name, command))
+                panels.append(RunPanel(panels_frame, run, len(panels)))
+
+    button_frame = tk.Frame(root, bg="#f0f8ff")
+    button_frame.pack(pady=5)
+    tk.Button(button_frame, text="Spustit vybrané", command=start_selected, bg="#4CAF50", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=0, padx=10)
+    tk.Button(button_frame, text="Zastavit vše", command=pool.stop_all, bg="#FF9800", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=1, padx=10)
+    tk.Button(button_frame, text="Zpět do menu", command=show_menu, bg="#f44336", fg="white", font=("Arial", 12, "bold"), width=15)\
+        .grid(row=0, column=2, padx=10)
+
+    def refresh():
+        """
+        Vykreslí nový výstup všech běhů a obnoví doby běhu a verdikty.
+        """
+        if not panels_frame.winfo_exists() or run_pool is not pool:
+            return
+        by_run = {panel.run: panel for panel in panels}
+        for run, lines in pool.drain(MAX_LINES_PER_FRAME).items():
+            by_run[run].append(lines)
+        for panel in panels:
+            panel.update()
+        root.after(FRAME_INTERVAL, refresh)
+
+    root.after(FRAME_INTERVAL, refresh)
+
+
 def show_menu():
     """
     Zobrazí hlavní menu s tlačítky pro výběr typu simulace.
     Ukončí jakoukoli probíhající simulaci před návratem do menu.
     """
-    global current_process
-
-    # Ukončení aktuálního procesu při návratu do menu
-    if current_process and current_process.poll() is None:
-        current_process.terminate()
-        current_process = None
+    # Ukončení aktuálního procesu a souběžných běhů při návratu do menu
+    stop_current_process()
+    stop_dashboard_runs()
 
     for widget in root.winfo_children():
         widget.destroy()
 
     root.title("Parallelization Problems")
+    center_window(root, MENU_WIDTH, MENU_HEIGHT)
 
     menu_frame = tk.Frame(root, bg="#f0f8ff")
     menu_frame.pack(expand=True)
@@ -152,7 +652,8 @@ def show_menu():
     buttons = [
         ("Deadlock", lambda: show_simulation("Deadlock", "Deadlock Simulation")),
         ("Livelock", lambda: show_simulation("Livelock", "Livelock Simulation")),
-        ("Starvation", lambda: show_simulation("Starvation", "Starvation Simulation"))
+        ("Starvation", lambda: show_simulation("Starvation", "Starvation Simulation")),
+        ("Souběžné běhy", show_dashboard)
     ]
 
     button_frame = tk.Frame(menu_frame, bg="#f0f8ff")
@@ -179,11 +680,12 @@ def center_window(window, width, height):
     window.geometry(f"{width}x{height}+{x}+{y}")
 
 
-# Hlavní okno
-root = tk.Tk()
-center_window(root, 600, 400)
-root.configure(bg="#f0f8ff")
-root.resizable(False, False)
-show_menu()
+# Hlavní okno se vytváří až při spuštění, import modulu tedy nic nezobrazuje
+if __name__ == "__main__":
+    root = tk.Tk()
+    center_window(root, MENU_WIDTH, MENU_HEIGHT)
+    root.configure(bg="#f0f8ff")
+    root.resizable(False, False)
+    show_menu()
 
-root.mainloop()
+    root.mainloop()
@@ -0,0 +1,366 @@
+import csv
+import functools
+import sys
+import threading
+import time
+
+try:
+    from . import Cancellation
+    from .Workload import percentile
+except ImportError:
+    import Cancellation
+    from Workload import percentile
+
+POLL_INTERVAL = 1.0  # Původní pauza mezi pokusy o zamčení v sekundách
+DEFAULT_SPINS = 100  # Výchozí počet pokusů o zamčení před zablokováním
+MAX_SPINS = 10_000  # Horní mez adaptivního rozpočtu pokusů
+METRIC_LABELS = {  # Popisky os grafu bodu zlomu
+    "cpu_per_acquire": "CPU na zamčení (µs)",
+    "latency_mean": "Průměrná latence (µs)",
+    "latency_p99": "Latence p99 (µs)",
+}
+
+
+class PollingAcquire:
+    def __init__(self, interval=POLL_INTERVAL):
+        """
+        Inicializuje původní způsob zamykání: pokus o zamčení a pauza, dokud nevyprší časový limit.
+        Poslední pauza se zkrátí na zbytek limitu, takže limit kratší než pauza se dodrží.
+
+        :param interval: Pauza mezi pokusy v sekundách
+        :raises ValueError: Pokud pauza není kladné číslo
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Pauza mezi pokusy musí být kladné číslo.")
+        self.interval = interval
+
+    def acquire(self, lock, timeout=None, token=None):
+        """
+        Zamkne zámek.
+
+        :param lock: Zámek (threading.Lock)
+        :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+        :param token: Token zrušení běhu, nebo None
+        :return: True, pokud byl zámek získán, False po vypršení limitu
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            if lock.acquire(blocking=False):
+                return True
+            pause = self.interval
+            if deadline is not None:
+                pause = max(0.0, min(pause, deadline - time.monotonic()))
+            Cancellation.sleep(pause, token)
+        return False
+
+
+class SpinAcquire:
+    def __init__(self, pause=0.0):
+        """
+        Inicializuje čisté spinování: opakované pokusy o zamčení bez zablokování.
+
+        Instrukci PAUSE procesoru v Pythonu nahrazuje time.sleep(pause); i s nulovou pauzou
+        vlákno uvolní GIL, takže držitel zámku může pokračovat.
+
+        :param pause: Pauza mezi pokusy v sekundách
+        :raises ValueError: Pokud pauza je záporná
+        """
+        if not isinstance(pause, (int, float)) or pause < 0:
+            raise ValueError("Pauza mezi pokusy musí být nezáporné číslo.")
+        self.pause = pause
+
+    def acquire(self, lock, timeout=None, token=None):
+        """
+        Zamkne zámek.
+
+        :param lock: Zámek (threading.Lock)
+        :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+        :param token: Token zrušení běhu, nebo None
+        :return: True, pokud byl zámek získán, False po vypršení limitu
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if lock.acquire(blocking=False):
+                return True
+            Cancellation.check(token)
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.pause)
+
+
+class BlockingAcquire:
+    def acquire(self, lock, timeout=None, token=None):
+        """
+        Zamkne zámek blokujícím čekáním (vlákno se uspí, dokud zámek není volný).
+
+        :param lock: Zámek (threading.Lock)
+        :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+        :param token: Token zrušení běhu, nebo None
+        :return: True, pokud byl zámek získán, False po vypršení limitu
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        return Cancellation.acquire(lock, timeout, token)
+
+
+class HybridAcquire:
+    def __init__(self, spins=DEFAULT_SPINS, pause=0.0, adaptive=False, max_spins=MAX_SPINS):
+        """
+        Inicializuje hybridní zamykání: nejprve nejvýše spins pokusů o zamčení s pauzou,
+        poté zablokování do uvolnění zámku.
+
+        Adaptivní varianta si udržuje klouzavý průměr počtu pokusů, po kterých se zámek podařilo
+        získat, a rozpočet nastaví na jeho dvojnásobek. Neúspěšné spinování (zámek je držen dlouho)
+        odhad sníží na polovinu, takže u dlouhých kritických sekcí se vlákno brzy blokuje rovnou.
+
+        :param spins: Počáteční (u neadaptivní varianty pevný) počet pokusů před zablokováním
+        :param pause: Pauza mezi pokusy v sekundách (viz SpinAcquire)
+        :param adaptive: Pokud je True, rozpočet pokusů se přizpůsobuje
+        :param max_spins: Horní mez adaptivního rozpočtu
+        :raises ValueError: Pokud jsou parametry mimo povolený rozsah
+        """
+        if not isinstance(spins, int) or spins < 0:
+            raise ValueError("Počet pokusů musí být nezáporné celé číslo.")
+        if not isinstance(pause, (int, float)) or pause < 0:
+            raise ValueError("Pauza mezi pokusy musí být nezáporné číslo.")
+        if not isinstance(max_spins, int) or max_spins < max(spins, 1):
+            raise ValueError("Horní mez pokusů musí být celé číslo alespoň rovné počtu pokusů.")
+
+        self.spins = spins
+        self.pause = pause
+        self.adaptive = adaptive
+        self.max_spins = max_spins
+        self.estimate = float(spins) / 2  # Odhad počtu pokusů potřebných k zamčení
+        self.spin_hits = 0  # Počet zamčení během spinování
+        self.parks = 0  # Počet zablokování
+        self._lock = threading.Lock()
+
+    def acquire(self, lock, timeout=None, token=None):
+        """
+        Zamkne zámek.
+
+        :param lock: Zámek (threading.Lock)
+        :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+        :param token: Token zrušení běhu, nebo None
+        :return: True, pokud byl zámek získán, False po vypršení limitu
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        budget = self.spins
+        for attempt in range(1, budget + 1):
+            if lock.acquire(blocking=False):
+                self._observe(attempt, True)
+                return True
+            Cancellation.check(token)
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.pause)
+
+        self._observe(budget, False)
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return Cancellation.acquire(lock, remaining, token)
+
+    def _observe(self, attempts, spun):
+        """
+        Započítá výsledek spinování a u adaptivní varianty upraví rozpočet pokusů.
+        """
+        with self._lock:
+            if spun:
+                self.spin_hits += 1
+                self.estimate += (attempts - self.estimate) / 8
+            else:
+                self.parks += 1
+                self.estimate /= 2
+            if self.adaptive:
+                self.spins = min(self.max_spins, max(1, int(2 * self.estimate) + 1))
+
+
+# Název strategie -> továrna vytvářející instanci pro jeden prostředek
+STRATEGIES = {
+    "poll": PollingAcquire,
+    "spin": SpinAcquire,
+    "block": BlockingAcquire,
+    "hybrid": HybridAcquire,
+    "adaptive": functools.partial(HybridAcquire, adaptive=True),
+}
+
+
+def benchmark(strategies=("spin", "block", "hybrid", "adaptive"), holds=(0.0, 0.0001, 0.001, 0.01),
+              threads=(2, 4, 8), iterations=100):
+    """
+    Změří latenci a cenu v čase procesoru jednotlivých strategií v závislosti na době držení
+    zámku a počtu soupeřících vláken.
+
+    Každé vlákno iterations-krát zamkne sdílený zámek, drží jej hold sekund (time.sleep, tedy
+    bez GIL, jako kritická sekce čekající na I/O) a uvolní jej. Latence je doba od začátku
+    pokusu o zamčení po jeho získání, cena je čas procesoru vlákna (time.thread_time) strávený
+    v zamykání.
+
+    :param strategies: Názvy strategií (klíče STRATEGIES)
+    :param holds: Doby držení zámku v sekundách
+    :param threads: Počty soupeřících vláken
+    :param iterations: Počet zamčení na vlákno
+    :return: Seznam výsledků s klíči 'strategy', 'hold', 'threads', 'latency_mean', 'latency_p99',
+             'cpu_per_acquire' a 'throughput'
+    :raises ValueError: Pokud strategie neexistuje nebo parametry nejsou kladné
+    """
+    for name in strategies:
+        if name not in STRATEGIES:
+            raise ValueError(f"Neznámá strategie '{name}'. Podporované: {', '.join(STRATEGIES)}.")
+    if not isinstance(iterations, int) or iterations < 1:
+        raise ValueError("Počet zamčení musí být kladné celé číslo.")
+    if any(count < 1 for count in threads) or any(hold < 0 for hold in holds):
+        raise ValueError("Počet vláken musí být kladný a doba držení nezáporná.")
+
+    results = []
+    for count in threads:
+        for hold in holds:
+            for name in strategies:
+                results.append(_measure(name, hold, count, iterations))
+    return results
+
+
+def _measure(name, hold, count, iterations):
+    """
+    Provede jedno měření funkce benchmark.
+    """
+    strategy = STRATEGIES[name]()
+    lock = threading.Lock()
+    latencies = [[] for _ in range(count)]
+    cpu = [0.0] * count
+    barrier = threading.Barrier(count)
+
+    def worker(index):
+        barrier.wait()
+        for _ in range(iterations):
+            start, start_cpu = time.perf_counter(), time.thread_time()
+            strategy.acquire(lock)
+            latencies[index].append(time.perf_counter() - start)
+            cpu[index] += time.thread_time() - start_cpu
+            if hold:
+                time.sleep(hold)
+            lock.release()
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    start_time = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    samples = [latency for thread_latencies in latencies for latency in thread_latencies]
+    return {
+        "strategy": name,
+        "hold": hold,
+        "threads": count,
+        "latency_mean": sum(samples) / len(samples),
+        "latency_p99": percentile(samples, 99),
+        "cpu_per_acquire": sum(cpu) / len(samples),
+        "throughput": len(samples) / elapsed,
+    }
+
+
+def crossover(results, metric="cpu_per_acquire", spin="spin", block="block"):
+    """
+    Najde pro každý počet vláken nejkratší dobu držení, od které je blokující zamykání
+    v dané metrice levnější než spinování.
+
+    :param results: Výsledky funkce benchmark
+    :param metric: Porovnávaná metrika ('cpu_per_acquire', 'latency_mean' nebo 'latency_p99')
+    :param spin: Název spinující strategie
+    :param block: Název blokující strategie
+    :return: Slovník počet vláken -> doba držení v sekundách, nebo None, pokud spinování vyhrává vždy
+    """
+    table = {(r["threads"], r["hold"], r["strategy"]): r[metric] for r in results}
+    points = {}
+    for count in sorted({r["threads"] for r in results}):
+        points[count] = None
+        for hold in sorted({r["hold"] for r in results if r["threads"] == count}):
+            if (count, hold, spin) in table and (count, hold, block) in table \
+                    and table[(count, hold, block)] < table[(count, hold, spin)]:
+                points[count] = hold
+                break
+    return points
+
+
+def plot_crossover(results, path, metric="cpu_per_acquire"):
+    """
+    Vykreslí metriku strategií v závislosti na době držení (jeden graf pro každý počet vláken)
+    se svislou čarou v bodě zlomu (viz crossover) a uloží graf do souboru; formát určí přípona
+    (PNG, SVG, PDF). Vyžaduje volitelnou knihovnu matplotlib, která se načítá až zde, aby import
+    modulu simulace nezpomalil.
+
+    :param results: Výsledky funkce benchmark
+    :param path: Cesta k souboru grafu
+    :param metric: Vykreslená metrika (klíč METRIC_LABELS)
+    :raises ImportError: Pokud není nainstalována knihovna matplotlib
+    :raises ValueError: Pokud metrika není známá
+    """
+    if metric not in METRIC_LABELS:
+        raise ValueError(f"Neznámá metrika '{metric}'. Podporované: {', '.join(METRIC_LABELS)}.")
+    try:
+        from matplotlib.figure import Figure
+    except ImportError:
+        raise ImportError("Graf bodu zlomu vyžaduje knihovnu matplotlib (pip install matplotlib).") from None
+
+    counts = sorted({r["threads"] for r in results})
+    strategies = list(dict.fromkeys(r["strategy"] for r in results))
+    points = crossover(results, metric)
+    figure = Figure(figsize=(4 * len(counts), 3.5), layout="constrained")
+    for axes, count in zip(figure.subplots(1, len(counts), squeeze=False)[0], counts):
+        for name in strategies:
+            series = sorted((r["hold"], r[metric]) for r in results if r["threads"] == count and r["strategy"] == name)
+            axes.plot([hold * 1000 for hold, _ in series], [value * 1e6 for _, value in series], marker="o", label=name)
+        if points[count] is not None:
+            axes.axvline(points[count] * 1000, color="grey", linestyle="--", label="bod zlomu")
+        # Doba držení i cena se liší o řády a obsahují nulu, proto logaritmická osa s lineárním okolím nuly
+        axes.set_xscale("symlog", linthresh=0.1)
+        axes.set_yscale("symlog", linthresh=1)
+        axes.set_xlim(left=0)
+        axes.set_ylim(bottom=0)
+        axes.set_title(f"Vlákna: {count}")
+        axes.set_xlabel("Doba držení (ms)")
+        axes.set_ylabel(METRIC_LABELS[metric])
+        axes.legend(fontsize="small")
+    figure.savefig(path)
+
+
+def write_csv(results, path):
+    """
+    Zapíše výsledky funkce benchmark do souboru CSV (např. pro vykreslení grafu v tabulkovém procesoru).
+
+    :param results: Výsledky funkce benchmark
+    :param path: Cesta k souboru
+    """
+    fields = ["strategy", "hold", "threads", "latency_mean", "latency_p99", "cpu_per_acquire", "throughput"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark()
+        print(f"{'Vlákna':>7}{'Držení (ms)':>13}{'Strategie':>11}{'Latence (µs)':>14}{'p99 (µs)':>11}"
+              f"{'CPU/zamčení (µs)':>18}{'Zamčení/s':>11}")
+        for r in results:
+            print(f"{r['threads']:>7}{r['hold'] * 1000:>13.1f}{r['strategy']:>11}{r['latency_mean'] * 1e6:>14.1f}"
+                  f"{r['latency_p99'] * 1e6:>11.1f}{r['cpu_per_acquire'] * 1e6:>18.1f}{r['throughput']:>11.0f}")
+
+        print("\nDoba držení, od které je blokování levnější než spinování (čas procesoru):")
+        for count, hold in crossover(results).items():
+            text = "spinování vyhrává ve všech měřeních" if hold is None else f"{hold * 1000:.1f} ms"
+            print(f"  Vlákna {count}: {text}")
+
+        # Volitelné argumenty: soubor CSV s výsledky a soubor grafu bodu zlomu (vyžaduje matplotlib)
+        if len(sys.argv) > 1:
+            write_csv(results, sys.argv[1])
+            print(f"\nVýsledky uloženy do {sys.argv[1]}")
+        if len(sys.argv) > 2:
+            plot_crossover(results, sys.argv[2])
+            print(f"Graf uložen do {sys.argv[2]}")
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,422 @@
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+# Při spuštění jako skript (python CLI.py) není k dispozici balíček, proto se doplní cesta ke kořeni projektu
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+PACKAGE = __package__ or "src.Parallelization_Problems"
+
+DEFAULT_CONFIG = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "config", "config.json"))
+
+# Scénář -> (modul, výchozí sekce konfigurace)
+SCENARIOS = {
+    "deadlock": ("Deadlock", "deadlock_livelock"),
+    "livelock": ("Livelock", "deadlock_livelock"),
+    "starvation": ("Starvation", "starvation"),
+    "inversion": ("Starvation", "starvation"),
+    "workload": ("Workload", "starvation"),
+    "montecarlo": ("MonteCarlo", "deadlock_livelock"),
+}
+BACKENDS = ("threads", "sharded", "array")
+REPRODUCIBLE_SCENARIOS = ("montecarlo", "workload")  # Scénáře, jejichž vláknový běh řídí semínko (viz reproducible)
+ACQUISITIONS = ("poll", "spin", "block", "hybrid", "adaptive")  # Klíče Acquisition.STRATEGIES
+FORMATS = ("json", "jsonl")
+CANCEL_SIGNALS = ("SIGINT", "SIGTERM")  # Signály, které běh zruší kooperativně (SIGTERM posílá GUI)
+EXIT_CANCELLED = 130  # Návratový kód zrušeného běhu (jako po Ctrl+C v shellu)
+
+
+def load_config(config_file):
+    """
+    Načte konfiguraci ze zadané cesty.
+
+    :param config_file: Cesta ke konfiguračnímu souboru
+    :return: Načtená konfigurace ve formátu slovníku
+    :raises FileNotFoundError: Pokud soubor neexistuje
+    :raises ValueError: Pokud soubor obsahuje neplatný JSON
+    """
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Konfigurační soubor '{config_file}' nebyl nalezen.")
+    except json.JSONDecodeError:
+        raise ValueError(f"Chyba při dekódování JSON v konfiguračním souboru '{config_file}'.")
+
+
+def build_parser():
+    """
+    Vytvoří parser argumentů příkazové řádky.
+
+    :return: Instance argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="CLI.py",
+        description="Spuštění simulací problémů paralelizace bez grafického rozhraní.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="cesta ke konfiguračnímu souboru")
+    parser.add_argument("--scenario", required=True, choices=sorted(SCENARIOS), help="typ simulace")
+    parser.add_argument("--section", help="sekce konfigurace (výchozí podle scénáře)")
+    parser.add_argument("--backend", default="threads", choices=BACKENDS, help="způsob provedení simulace")
+    parser.add_argument("--workers", type=int,
+                        help="počet pracovních procesů pro backend sharded (výchozí počet jader)")
+    parser.add_argument("--seed", type=int, help="semínko generátoru náhodných čísel")
+    parser.add_argument("--repeat", type=int, default=1, help="počet opakování simulace")
+    parser.add_argument("--format", default="json", choices=FORMATS, help="formát výstupu")
+    parser.add_argument("--output", help="soubor pro výstup (výchozí standardní výstup)")
+    parser.add_argument("--strategy", default="timeout", help="strategie získávání prostředků (deadlock)")
+    parser.add_argument("--timeout", default="fixed", choices=("fixed", "adaptive"),
+                        help="politika časového limitu (deadlock, livelock, starvation)")
+    parser.add_argument("--acquisition", default="poll",
+                        choices=ACQUISITIONS,
+                        help="strategie zamykání prostředku (deadlock, livelock)")
+    parser.add_argument("--watchdog", action="store_true", help="detekovat livelock hlídačem pokroku (livelock)")
+    parser.add_argument("--hold-time", type=float, default=1.0, help="doba mezi zamčením prostředků (deadlock)")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="počet vzorků (montecarlo)")
+    parser.add_argument("--jitter", type=float, default=1.0, help="rozptyl časů startu v sekundách (montecarlo)")
+    parser.add_argument("--trace", help="soubor pro časovou osu ve formátu Chrome Trace Event (Perfetto)")
+    parser.add_argument("--events", action="store_true",
+                        help="průběžně vypisovat události simulace jako JSON Lines na standardní výstup")
+    parser.add_argument("--metrics-port", type=int,
+                        help="metriky ve formátu Prometheus na http://127.0.0.1:PORT/metrics (0 = volný port)")
+    parser.add_argument("--metrics-file", help="soubor pro průběžný snímek metrik ve formátu Prometheus")
+    parser.add_argument("--profile",
+                        help="soubor pro profil vláken ve formátu collapsed stacks (při více bězích s číslem běhu)")
+    parser.add_argument("--profile-interval", type=float, default=0.01, help="perioda vzorkování profilu v sekundách")
+    parser.add_argument("--cache", action="store_true",
+                        help="ukládat a znovu použít výsledky běhů se zadaným semínkem "
+                             "(jen scénáře montecarlo a workload nebo backend array)")
+    parser.add_argument("--cache-dir", help="adresář cache (výchozí ~/.cache/parallelization_problems)")
+    parser.add_argument("--replay-speed", type=float, default=0.0,
+                        help="rychlost přehrání událostí z cache s --events (0 = okamžitě)")
+    parser.add_argument("--verbose", action="store_true", help="vypisovat průběh simulace na standardní chybový výstup")
+    return parser
+
+
+def run_once(scenario, section, args, seed, token=None):
+    """
+    Provede jeden běh zvoleného scénáře a vrátí jeho výsledek.
+
+    :param scenario: Název scénáře (klíč SCENARIOS)
+    :param section: Sekce konfigurace pro scénář
+    :param args: Rozebrané argumenty příkazové řádky
+    :param seed: Semínko generátoru náhodných čísel (Monte Carlo, zátěž a backend 'array'), nebo None
+    :param token: Token zrušení běhu (vláknový backend), nebo None
+    :return: Výsledek scénáře ve formátu slovníku
+    """
+    module = importlib.import_module(f"{PACKAGE}.{SCENARIOS[scenario][0]}")
+
+    timeout_policy = None
+    if args.timeout == "adaptive":
+        timeout_policy = importlib.import_module(f"{PACKAGE}.Timeouts").AdaptiveTimeout
+
+    acquisition = importlib.import_module(f"{PACKAGE}.Acquisition").STRATEGIES[args.acquisition]
+
+    if scenario == "deadlock":
+        options = {"strategy": args.strategy, "hold_time": args.hold_time, "timeout_policy": timeout_policy,
+                   "acquisition": acquisition}
+    elif scenario == "livelock":
+        options = {"timeout_policy": timeout_policy, "watchdog": args.watchdog, "acquisition": acquisition}
+    else:
+        options = {"timeout_policy": timeout_policy}
+
+    if args.backend == "array":
+        if scenario != "deadlock" or args.strategy != "timeout":
+            raise ValueError("Backend 'array' podporuje pouze scénář 'deadlock' se strategií 'timeout'.")
+        compact = importlib.import_module(f"{PACKAGE}.Compact")
+        return compact.run_scenario(section, hold_time=args.hold_time, seed=seed)
+    if args.backend == "sharded":
+        shard = importlib.import_module(f"{PACKAGE}.Shard")
+        return shard.run_sharded(scenario, section, workers=args.workers, verbose=args.verbose, **options)
+    if scenario == "inversion":
+        return {"protocols": module.compare_protocols(section, token=token)}
+    if scenario == "montecarlo":
+        return module.estimate(section, samples=args.samples, hold=args.hold_time, jitter=args.jitter, seed=seed)
+    if scenario == "workload":
+        # Klíče JSON objektů musí být řetězce
+        return {"priorities": {str(k): v for k, v in module.run_workload(section, seed, token).items()}}
+    return module.run_scenario(section, token=token, **options)
+
+
+class EventWriter:
+    def __init__(self, stream):
+        """
+        Inicializuje posluchače, který každou událost simulace ihned zapíše jako jeden řádek JSON.
+        Řádky mají klíč 'type' s hodnotou 'event', čímž se odliší od záznamů s výsledky.
+
+        :param stream: Cílový textový proud
+        """
+        self.stream = stream
+        self._start = time.perf_counter()
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        """
+        Zapíše jednu událost simulace (viz Events.emit).
+
+        :param event: Událost ve formátu slovníku
+        """
+        record = {"type": "event", "t": round(event["ts"] - self._start, 6)}
+        record.update((key, value) for key, value in event.items() if key not in ("ts", "thread"))
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self.closed:
+                return
+            try:
+                self.stream.write(line)
+                self.stream.flush()
+            except (BrokenPipeError, ValueError):
+                # Čtenář (např. GUI) výstup zavřel; simulace doběhne bez dalších výpisů
+                self.closed = True
+
+
+def run(args, stream=None, token=None):
+    """
+    Provede všechna opakování simulace podle argumentů.
+
+    :param args: Rozebrané argumenty příkazové řádky
+    :param stream: Proud pro průběžné události (pouze s --events)
+    :param token: Token zrušení běhu; po zrušení se rozpracovaný běh ukončí a další se nespustí
+    :return: Seznam záznamů o jednotlivých bězích
+    :raises KeyError: Pokud konfigurace neobsahuje požadovanou sekci
+    """
+    config = load_config(args.config)
+    section_name = args.section or SCENARIOS[args.scenario][1]
+    if section_name not in config:
+        raise KeyError(f"Chybí sekce '{section_name}' v konfiguraci.")
+
+    with contextlib.ExitStack() as stack:
+        if args.trace:
+            trace = importlib.import_module(f"{PACKAGE}.Trace")
+            stack.enter_context(trace.tracing(args.trace))
+        if args.events:
+            events = importlib.import_module(f"{PACKAGE}.Events")
+            writer = EventWriter(stream if stream is not None else sys.stdout)
+            events.subscribe(writer)
+            stack.callback(events.unsubscribe, writer)
+        if args.metrics_port is not None or args.metrics_file:
+            metrics = importlib.import_module(f"{PACKAGE}.Metrics")
+            _, server = stack.enter_context(metrics.exporting(args.metrics_port, args.metrics_file))
+            if server is not None:
+                print(f"Metriky: {server.url}", file=sys.stderr, flush=True)
+        return _run_all(args, config[section_name], section_name, token)
+
+
+def _run_all(args, section, section_name, token=None):
+    """
+    Provede args.repeat běhů scénáře nad sekcí konfigurace.
+    """
+    cache = None
+    if args.cache and args.seed is not None:
+        cache_module = importlib.import_module(f"{PACKAGE}.Cache")
+        cache = cache_module.ResultCache(args.cache_dir or cache_module.DEFAULT_DIR)
+
+    records = []
+    for index in range(args.repeat):
+        if token is not None and token.cancelled:
+            break
+        seed = None if args.seed is None else args.seed + index
+        profile_path = profiling = None
+        if args.profile:
+            profiler_module = importlib.import_module(f"{PACKAGE}.Profiler")
+            profile_path = _profile_path(args.profile, index, args.repeat)
+            profiling = profiler_module.profiling(profile_path, args.profile_interval)
+        start_time = time.time()
+        with profiling or contextlib.nullcontext() as profiler:
+            if cache is None:
+                result, cached = run_once(args.scenario, section, args, seed, token), False
+            else:
+                result, cached = _run_cached(cache_module, cache, section, args, seed, token)
+        record = {
+            "scenario": args.scenario,
+            "section": section_name,
+            "backend": args.backend,
+            "seed": seed,
+            "run": index,
+            "wall_time": time.time() - start_time,
+            "cached": cached,
+            "cancelled": token is not None and token.cancelled,
+            "result": result,
+        }
+        if profiler is not None:
+            record["profile"] = {"file": profile_path, "samples": profiler.samples, "threads": profiler.summary()}
+        records.append(record)
+    return records
+
+
+def _profile_path(path, index, repeat):
+    """
+    Vrátí soubor profilu pro daný běh; při více bězích se před příponu vloží číslo běhu
+    (profile.folded -> profile.0.folded, profile.1.folded, ...).
+    """
+    if repeat == 1:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}.{index}{extension}"
+
+
+def _run_cached(cache_module, cache, section, args, seed, token=None):
+    """
+    Vrátí výsledek běhu z cache (a přehraje jeho události), nebo běh provede a uloží.
+    Zrušený běh se do cache neukládá.
+
+    :return: Dvojice (výsledek, True pokud pochází z cache)
+    """
+    options = {"backend": args.backend, "strategy": args.strategy, "timeout": args.timeout,
+               "watchdog": args.watchdog, "hold_time": args.hold_time, "samples": args.samples,
+               "jitter": args.jitter, "acquisition": args.acquisition}
+    key = cache_module.cache_key(section, args.scenario, seed, options)
+    entry = cache.get(key)
+    if entry is not None:
+        cache_module.replay(entry["events"], args.replay_speed)
+        return entry["result"], True
+
+    events = importlib.import_module(f"{PACKAGE}.Events")
+    recorder = cache_module.Recorder()
+    events.subscribe(recorder)
+    try:
+        result = run_once(args.scenario, section, args, seed, token)
+    finally:
+        events.unsubscribe(recorder)
+    if token is None or not token.cancelled:
+        cache.put(key, result, recorder.events)
+    return result, False
+
+
+def reproducible(scenario, backend):
+    """
+    Zjistí, zda výsledek běhu určuje jen konfigurace a semínko, takže jej lze uložit do cache.
+    Vláknové simulace deadlocku, livelocku, hladovění a inverze priorit náhodu nepoužívají a jejich
+    výsledek závisí na plánování vláken; uložený běh by byl jen jedním nahodilým průběhem.
+
+    :param scenario: Název scénáře (klíč SCENARIOS)
+    :param backend: Způsob provedení (klíč BACKENDS)
+    :return: True, pokud se běh se stejným semínkem opakuje
+    """
+    return backend == "array" or (backend == "threads" and scenario in REPRODUCIBLE_SCENARIOS)
+
+
+def honours_token(args):
+    """
+    Zjistí, zda zvolený způsob provedení běh průběžně kontroluje token zrušení.
+    Odhad Monte Carlo a backendy 'sharded' a 'array' token nedostávají; kooperativní zrušení
+    by u nich signál jen spolklo a běh by pokračoval až do konce.
+
+    :param args: Rozebrané argumenty příkazové řádky
+    :return: True, pokud lze běh zrušit tokenem
+    """
+    return args.backend == "threads" and args.scenario != "montecarlo"
+
+
+@contextlib.contextmanager
+def cancel_on_signals(token):
+    """
+    Po dobu bloku zruší běh při přijetí signálu SIGINT nebo SIGTERM místo okamžitého ukončení procesu,
+    takže procesy simulace uvolní prostředky a výsledky dosud provedených běhů se zapíší.
+    Mimo hlavní vlákno (kde obsluhu signálů nastavit nelze) blok nic nemění.
+
+    :param token: Token zrušení běhu
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handler(signum, frame):
+        token.cancel()
+
+    previous = {}
+    for name in CANCEL_SIGNALS:
+        if hasattr(signal, name):
+            signum = getattr(signal, name)
+            previous[signum] = signal.signal(signum, handler)
+    try:
+        yield
+    finally:
+        for signum, original in previous.items():
+            signal.signal(signum, original)
+
+
+def write_records(records, output_format, stream):
+    """
+    Zapíše záznamy jako jeden JSON dokument nebo jako JSON Lines (jeden záznam na řádek).
+
+    :param records: Seznam záznamů
+    :param output_format: 'json' nebo 'jsonl'
+    :param stream: Cílový textový proud
+    """
+    if output_format == "jsonl":
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        json.dump({"runs": records}, stream, ensure_ascii=False, indent=2)
+        stream.write("\n")
+
+
+def main(argv=None):
+    """
+    Vstupní bod příkazové řádky. Výpisy simulace jsou potlačeny (nebo s --verbose přesměrovány
+    na standardní chybový výstup), takže standardní výstup obsahuje pouze strojově čitelné výsledky.
+
+    Signály SIGINT a SIGTERM běh kooperativně zruší; zapíší se záznamy dosud provedených běhů
+    (rozpracovaný běh má 'cancelled': true) a návratový kód je EXIT_CANCELLED. Pro běhy, které token
+    zrušení nekontrolují (viz honours_token), zůstane výchozí obsluha signálů a běh se ukončí okamžitě.
+
+    :param argv: Argumenty příkazové řádky (výchozí sys.argv[1:])
+    :return: Návratový kód procesu
+    """
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1:
+        print("CHYBA: Počet opakování musí být kladné celé číslo.", file=sys.stderr)
+        return 2
+    if args.backend != "threads" and (args.events or args.trace or args.metrics_port is not None or args.metrics_file
+                                      or args.profile):
+        print(f"CHYBA: Backend '{args.backend}' neposkytuje průběžné události, časovou osu, metriky ani profil vláken.",
+              file=sys.stderr)
+        return 2
+    if args.profile_interval <= 0:
+        print("CHYBA: Perioda vzorkování musí být kladné číslo.", file=sys.stderr)
+        return 2
+    if args.workers is not None and args.workers < 1:
+        print("CHYBA: Počet pracovních procesů musí být kladné celé číslo.", file=sys.stderr)
+        return 2
+    if args.replay_speed < 0:
+        print("CHYBA: Rychlost přehrávání musí být nezáporné číslo.", file=sys.stderr)
+        return 2
+    if args.cache and args.seed is None:
+        print("CHYBA: Volba --cache vyžaduje --seed (běhy bez semínka nejsou opakovatelné).", file=sys.stderr)
+        return 2
+    if args.cache and not reproducible(args.scenario, args.backend):
+        print(f"CHYBA: Výsledek scénáře '{args.scenario}' s backendem '{args.backend}' závisí na plánování vláken; "
+              "volbu --cache lze použít jen se scénáři montecarlo a workload nebo s backendem array.",
+              file=sys.stderr)
+        return 2
+
+    cancellation = importlib.import_module(f"{PACKAGE}.Cancellation")
+    token = cancellation.CancellationToken()
+    stdout = sys.stdout
+    try:
+        with open(os.devnull, "w") as devnull:
+            signals = cancel_on_signals(token) if honours_token(args) else contextlib.nullcontext()
+            with contextlib.redirect_stdout(sys.stderr if args.verbose else devnull), signals:
+                records = run(args, stdout, token)
+    except Exception as e:
+        print(f"CHYBA: {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            write_records(records, args.format, f)
+    else:
+        write_records(records, args.format, stdout)
+        stdout.flush()
+    return EXIT_CANCELLED if token.cancelled else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
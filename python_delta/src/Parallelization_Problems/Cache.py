@@ -0,0 +1,202 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    from . import Events
+except ImportError:
+    import Events
+
+# Verze simulačního jádra; zvýšit při každé změně, která mění výsledky nebo průběh simulací,
+# jinak by cache vracela výsledky staré verze
+ENGINE_VERSION = "1"
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "parallelization_problems")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # Maximální velikost cache na disku
+SUFFIX = ".json.gz"
+
+
+def cache_key(section, scenario, seed, options=None):
+    """
+    Vrátí klíč cache pro běh simulace.
+
+    Konfigurace se normalizuje (seřazené klíče, bez bílých znaků), takže na formátování
+    ani pořadí klíčů v config.json nezáleží.
+
+    :param section: Sekce konfigurace, nad kterou simulace běží
+    :param scenario: Název scénáře
+    :param seed: Semínko generátoru náhodných čísel
+    :param options: Další volby ovlivňující výsledek (např. strategie nebo časový limit)
+    :return: Hexadecimální SHA-256 otisk
+    :raises ValueError: Pokud semínko chybí (běh bez semínka není opakovatelný)
+    """
+    if seed is None:
+        raise ValueError("Do cache lze ukládat pouze běhy se zadaným semínkem.")
+    payload = {"engine": ENGINE_VERSION, "scenario": scenario, "seed": seed,
+               "section": section, "options": options or {}}
+    normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializuje diskovou cache výsledků a záznamů událostí.
+
+        Každý záznam je jeden komprimovaný JSON soubor pojmenovaný podle klíče. Čas poslední
+        úpravy souboru slouží jako čas posledního použití; při překročení max_bytes se mažou
+        nejdéle nepoužité záznamy (LRU).
+
+        :param directory: Adresář cache
+        :param max_bytes: Maximální celková velikost záznamů v bajtech
+        :raises ValueError: Pokud max_bytes není kladné celé číslo
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("Velikost cache musí být kladné celé číslo.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Vrátí uložený záznam a označí jej jako právě použitý.
+
+        :param key: Klíč z cache_key
+        :return: Slovník s klíči 'result' a 'events', nebo None
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            # Chybějící nebo poškozený záznam se chová jako neúspěch
+            return None
+        return entry
+
+    def put(self, key, result, events=()):
+        """
+        Uloží výsledek a záznam událostí běhu. Zápis je atomický, takže souběžné čtení
+        nikdy neuvidí rozepsaný soubor.
+
+        :param key: Klíč z cache_key
+        :param result: Výsledek simulace (musí jít převést do JSON)
+        :param events: Záznam událostí (viz Recorder)
+        :return: True, pokud byl záznam uložen
+        """
+        data = gzip.compress(json.dumps({"result": result, "events": list(events)},
+                                        ensure_ascii=False, default=str).encode("utf-8"))
+        if len(data) > self.max_bytes:
+            return False
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, self._path(key))
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return False
+            self._evict()
+        return True
+
+    def size(self):
+        """
+        Vrátí celkovou velikost záznamů v bajtech.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """
+        Smaže všechny záznamy cache.
+        """
+        with self._lock:
+            for path, _, _ in self._entries():
+                os.remove(path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _entries(self):
+        """
+        Vrátí seznam (cesta, velikost, čas posledního použití) všech záznamů.
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class Recorder:
+    def __init__(self):
+        """
+        Inicializuje posluchače, který ukládá události běhu pro cache.
+        Místo absolutního času se ukládá odstup 't' od začátku záznamu v sekundách.
+        """
+        self.events = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        """
+        Uloží jednu událost simulace (viz Events.emit).
+
+        :param event: Událost ve formátu slovníku
+        """
+        record = {key: value for key, value in event.items() if key != "ts"}
+        record["t"] = round(event["ts"] - self._start, 6)
+        with self._lock:
+            self.events.append(record)
+
+
+def replay(events, speed=1.0, sink=None):
+    """
+    Přehraje uložený záznam událostí. Události dostanou nový čas 'ts', takže je zpracují
+    stejní posluchači jako při skutečném běhu (časová osa, graf čekání).
+
+    :param events: Záznam událostí (viz Recorder)
+    :param speed: Násobek rychlosti přehrávání; 0 přehraje vše okamžitě
+    :param sink: Příjemce událostí (výchozí všichni posluchači Events)
+    :raises ValueError: Pokud rychlost je záporná
+    """
+    if not isinstance(speed, (int, float)) or speed < 0:
+        raise ValueError("Rychlost přehrávání musí být nezáporné číslo.")
+    sink = sink or Events.publish
+    start = time.perf_counter()
+    for record in events:
+        if speed:
+            delay = record.get("t", 0) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        event = {key: value for key, value in record.items() if key != "t"}
+        event["ts"] = time.perf_counter()
+        sink(event)
@@ -0,0 +1,137 @@
+import threading
+import time
+
+POLL_INTERVAL = 0.01  # Nejdelší doba, než blokované zamykání zámku zaznamená zrušení (v sekundách)
+
+
+class Cancelled(BaseException):
+    """
+    Výjimka signalizující, že běh simulace byl zrušen.
+    Dědí z BaseException, aby ji nezachytily obecné bloky 'except Exception' v procesech simulací.
+    """
+
+
+class CancellationToken:
+    def __init__(self):
+        """
+        Inicializuje token pro kooperativní zrušení běhu simulace.
+
+        Token se předává prostředkům a procesům; všechna jejich čekání (uspání, zamykání,
+        čekání na podmínku) se po zrušení okamžitě ukončí výjimkou Cancelled.
+        """
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        """
+        True, pokud byl běh zrušen.
+        """
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+        Zruší běh: probudí všechna čekání a zavolá zaregistrované funkce. Opakované volání nic nedělá.
+        Funkce je bezpečné volat z obsluhy signálu i z jiného vlákna.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def check(self):
+        """
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        if self._event.is_set():
+            raise Cancelled()
+
+    def sleep(self, seconds):
+        """
+        Uspí volající vlákno; zrušení spánek okamžitě ukončí.
+
+        :param seconds: Doba spánku v sekundách
+        :raises Cancelled: Pokud byl běh zrušen před spánkem nebo během něj
+        """
+        if self._event.wait(seconds):
+            raise Cancelled()
+
+    def acquire(self, lock, timeout=None):
+        """
+        Zamkne zámek; čeká po krátkých úsecích, aby zrušení zaznamenalo nejpozději do POLL_INTERVAL.
+
+        :param lock: Zámek (threading.Lock)
+        :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+        :return: True, pokud byl zámek získán, False po vypršení limitu
+        :raises Cancelled: Pokud byl běh zrušen
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.check()
+            remaining = POLL_INTERVAL if deadline is None else min(POLL_INTERVAL, deadline - time.monotonic())
+            if remaining <= 0:
+                return lock.acquire(blocking=False)
+            if lock.acquire(timeout=remaining):
+                return True
+
+    def on_cancel(self, callback):
+        """
+        Zaregistruje funkci volanou při zrušení, např. pro probuzení čekání na threading.Condition.
+        Pokud už byl běh zrušen, funkce se zavolá ihned.
+
+        :param callback: Funkce bez argumentů
+        :return: Funkce, která registraci zruší
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        callback()
+        return lambda: None
+
+    def _unregister(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def sleep(seconds, token=None):
+    """
+    Uspí volající vlákno; s tokenem lze spánek zrušit.
+
+    :param seconds: Doba spánku v sekundách
+    :param token: CancellationToken, nebo None pro obyčejné time.sleep
+    :raises Cancelled: Pokud byl běh zrušen
+    """
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
+
+
+def acquire(lock, timeout=None, token=None):
+    """
+    Zamkne zámek; s tokenem lze čekání zrušit.
+
+    :param lock: Zámek (threading.Lock)
+    :param timeout: Časový limit v sekundách, nebo None pro čekání bez limitu
+    :param token: CancellationToken, nebo None pro obyčejné lock.acquire
+    :return: True, pokud byl zámek získán, False po vypršení limitu
+    :raises Cancelled: Pokud byl běh zrušen
+    """
+    if token is None:
+        return lock.acquire(timeout=-1 if timeout is None else timeout)
+    return token.acquire(lock, timeout)
+
+
+def check(token=None):
+    """
+    :param token: CancellationToken, nebo None
+    :raises Cancelled: Pokud byl běh zrušen
+    """
+    if token is not None:
+        token.check()
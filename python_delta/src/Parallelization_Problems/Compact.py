@@ -0,0 +1,399 @@
+import array
+import random
+import sys
+import time
+
+# Stavy procesu v tabulce (kódy v poli typu 'b')
+IDLE, WAIT_FIRST, HOLD, WAIT_SECOND, DONE, DEADLOCKED = range(6)
+STATE_NAMES = ("idle", "wait-first", "hold", "wait-second", "done", "deadlocked")
+NONE = -1  # Prázdný odkaz na proces nebo prostředek
+TICK = 0.1  # Délka jednoho kroku simulace v sekundách
+DEFAULT_TIMEOUT = 5  # Časový limit čekání v sekundách (jako Resource.acquire)
+
+
+class CompactTables:
+    def __init__(self, processes, resources, process_names=None, resource_names=None):
+        """
+        Inicializuje tabulky procesů a prostředků uložené po sloupcích v typovaných polích (modul array).
+
+        Proces zabírá několik desítek bajtů místo vlákna se zásobníkem a prostředek čtyři bajty
+        místo objektu se zámkem, takže se vejde i milion procesů. Názvy se ukládají jen tehdy,
+        pokud je zadá konfigurace; jinak se odvozují z indexu.
+
+        :param processes: Počet procesů
+        :param resources: Počet prostředků
+        :param process_names: Seznam názvů procesů, nebo None pro 'Process <index>'
+        :param resource_names: Seznam názvů prostředků, nebo None pro 'Resource <index>'
+        :raises ValueError: Pokud počty nejsou nezáporná celá čísla nebo nesedí délky seznamů názvů
+        """
+        if not isinstance(processes, int) or processes < 0 or not isinstance(resources, int) or resources < 0:
+            raise ValueError("Počty procesů a prostředků musí být nezáporná celá čísla.")
+        if process_names is not None and len(process_names) != processes:
+            raise ValueError("Počet názvů procesů neodpovídá počtu procesů.")
+        if resource_names is not None and len(resource_names) != resources:
+            raise ValueError("Počet názvů prostředků neodpovídá počtu prostředků.")
+
+        self.process_names = process_names
+        self.resource_names = resource_names
+        # Sloupce procesů
+        self.state = array.array('b', bytes(processes))
+        self.first = array.array('i', [NONE]) * processes  # Index prvního prostředku
+        self.second = array.array('i', [NONE]) * processes  # Index druhého prostředku
+        self.wait_target = array.array('i', [NONE]) * processes  # Prostředek, na který proces čeká
+        self.priority = array.array('i', [1]) * processes
+        self.start = array.array('i', bytes(4 * processes))  # Krok startu
+        self.deadline = array.array('i', bytes(4 * processes))  # Krok vypršení čekání nebo konce držení
+        self.attempts = array.array('i', bytes(4 * processes))  # Počet pokusů o zamčení
+        # Sloupce prostředků
+        self.holder = array.array('i', [NONE]) * resources
+
+    @classmethod
+    def from_section(cls, section):
+        """
+        Vytvoří tabulky ze sekce konfigurace ve formátu 'deadlock_livelock'.
+
+        :param section: Sekce konfigurace s klíči 'resources' a 'processes'
+        :return: Instance CompactTables
+        :raises KeyError: Pokud proces odkazuje na neexistující prostředek nebo chybí povinná pole
+        """
+        if 'resources' not in section or 'processes' not in section:
+            raise KeyError("Chybí 'resources' nebo 'processes' v sekci konfigurace.")
+        keys = list(section['resources'])
+        index = {key: i for i, key in enumerate(keys)}
+        tables = cls(len(section['processes']), len(keys),
+                     [p['name'] for p in section['processes']],
+                     [section['resources'][key]['name'] for key in keys])
+        for i, p in enumerate(section['processes']):
+            for column, key in ((tables.first, 'resource1'), (tables.second, 'resource2')):
+                if p[key] not in index:
+                    raise KeyError(f"Zdroj '{p[key]}' nebyl nalezen pro proces '{p['name']}'")
+                column[i] = index[p[key]]
+            tables.priority[i] = p.get('priority', 1)
+        return tables
+
+    @classmethod
+    def generate(cls, processes, resources, seed=None):
+        """
+        Vygeneruje tabulky, v nichž každý proces zamyká dva různé náhodné prostředky.
+        Na rozdíl od Shard.generate_section nevytváří slovníky konfigurace, takže zvládne i miliony procesů.
+
+        :param processes: Počet procesů
+        :param resources: Počet prostředků (alespoň 2)
+        :param seed: Semínko generátoru náhodných čísel
+        :return: Instance CompactTables
+        :raises ValueError: Pokud je prostředků méně než 2
+        """
+        if resources < 2:
+            raise ValueError("Prostředky musí být alespoň 2.")
+        rng = random.Random(seed)
+        tables = cls(processes, resources)
+        first, second, randrange = tables.first, tables.second, rng.randrange
+        for i in range(processes):
+            a = randrange(resources)
+            b = randrange(resources - 1)
+            first[i] = a
+            second[i] = b + 1 if b >= a else b
+        return tables
+
+    def __len__(self):
+        return len(self.state)
+
+    def nbytes(self):
+        """
+        Vrátí velikost sloupců v bajtech (bez seznamů názvů).
+
+        :return: Počet bajtů
+        """
+        columns = (self.state, self.first, self.second, self.wait_target, self.priority,
+                   self.start, self.deadline, self.attempts, self.holder)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def process(self, index):
+        """
+        Vrátí pohled na proces s rozhraním podobným Deadlock.Process.
+
+        :param index: Index procesu
+        :return: Instance ProcessView
+        """
+        if not 0 <= index < len(self.state):
+            raise IndexError("Index procesu je mimo rozsah.")
+        return ProcessView(self, index)
+
+    def resource(self, index):
+        """
+        Vrátí pohled na prostředek s rozhraním podobným Deadlock.Resource.
+
+        :param index: Index prostředku
+        :return: Instance ResourceView
+        """
+        if not 0 <= index < len(self.holder):
+            raise IndexError("Index prostředku je mimo rozsah.")
+        return ResourceView(self, index)
+
+    def process_name(self, index):
+        return self.process_names[index] if self.process_names is not None else f"Process {index}"
+
+    def resource_name(self, index):
+        return self.resource_names[index] if self.resource_names is not None else f"Resource {index}"
+
+
+class ProcessView:
+    __slots__ = ("_tables", "index")
+
+    def __init__(self, tables, index):
+        """
+        Inicializuje pohled na jeden řádek tabulky procesů. Pohled nic nekopíruje;
+        všechny vlastnosti čtou aktuální hodnoty z tabulek.
+
+        :param tables: Instance CompactTables
+        :param index: Index procesu
+        """
+        self._tables = tables
+        self.index = index
+
+    @property
+    def name(self):
+        return self._tables.process_name(self.index)
+
+    @property
+    def state(self):
+        return STATE_NAMES[self._tables.state[self.index]]
+
+    @property
+    def completed(self):
+        return self._tables.state[self.index] == DONE
+
+    @property
+    def deadlock_detected(self):
+        return self._tables.state[self.index] == DEADLOCKED
+
+    @property
+    def resource1(self):
+        return ResourceView(self._tables, self._tables.first[self.index])
+
+    @property
+    def resource2(self):
+        return ResourceView(self._tables, self._tables.second[self.index])
+
+    @property
+    def waiting_for(self):
+        target = self._tables.wait_target[self.index]
+        return None if target == NONE else ResourceView(self._tables, target)
+
+    @property
+    def priority(self):
+        return self._tables.priority[self.index]
+
+    @property
+    def attempts(self):
+        return self._tables.attempts[self.index]
+
+    def __repr__(self):
+        return f"ProcessView({self.name!r}, {self.state})"
+
+
+class ResourceView:
+    __slots__ = ("_tables", "index")
+
+    def __init__(self, tables, index):
+        """
+        Inicializuje pohled na jeden řádek tabulky prostředků.
+
+        :param tables: Instance CompactTables
+        :param index: Index prostředku
+        """
+        self._tables = tables
+        self.index = index
+
+    @property
+    def name(self):
+        return self._tables.resource_name(self.index)
+
+    @property
+    def holder(self):
+        holder = self._tables.holder[self.index]
+        return None if holder == NONE else ProcessView(self._tables, holder)
+
+    def locked(self):
+        return self._tables.holder[self.index] != NONE
+
+    def __repr__(self):
+        return f"ResourceView({self.name!r})"
+
+
+def simulate(tables, hold_ticks=10, timeout_ticks=50, release_on_finish=False, jitter_ticks=0, seed=None):
+    """
+    Simuluje procesy po krocích bez vláken; stav je pouze v tabulkách a smyčka kroku nevytváří objekty.
+
+    Proces zamkne první prostředek, drží jej hold_ticks kroků a poté čeká na druhý. Čeká-li na
+    prostředek déle než timeout_ticks kroků, je označen jako v deadlocku (jako strategie 'timeout'
+    v Deadlock). V jednom kroku se procesy vyhodnocují v pořadí indexů; volný prostředek získá první
+    z nich. Kroky, ve kterých se nic nemění, se přeskočí až k nejbližšímu vypršení nebo startu.
+
+    Cyklus čekání uzavře vždy proces, který začne čekat jako poslední; při zablokování proto proces
+    projde řetěz držitelů a jejich cílů čekání a najde-li sám sebe, započítá procesy cyklu. Řetěz
+    končí i u prostředku, který v tomto kroku uvolnil dřívější proces a čekající jej ještě nezískal.
+
+    :param tables: Instance CompactTables (stav procesů se přepíše)
+    :param hold_ticks: Počet kroků mezi zamčením prvního a druhého prostředku
+    :param timeout_ticks: Časový limit čekání v krocích
+    :param release_on_finish: Pokud je True, proces po dokončení nebo vypršení limitu uvolní prostředky
+    :param jitter_ticks: Starty procesů se rozloží rovnoměrně do kroků 0 až jitter_ticks
+    :param seed: Semínko generátoru náhodných čísel pro starty
+    :return: Slovník s počty dokončených procesů a procesů v deadlocku, procesů na cyklu čekání a počtem kroků
+    :raises ValueError: Pokud jsou parametry mimo povolený rozsah
+    """
+    if not isinstance(hold_ticks, int) or hold_ticks < 0:
+        raise ValueError("Doba držení musí být nezáporné celé číslo kroků.")
+    if not isinstance(timeout_ticks, int) or timeout_ticks < 1:
+        raise ValueError("Časový limit musí být kladné celé číslo kroků.")
+    if not isinstance(jitter_ticks, int) or jitter_ticks < 0:
+        raise ValueError("Rozptyl startů musí být nezáporné celé číslo kroků.")
+
+    state, first, second, wait_target = tables.state, tables.first, tables.second, tables.wait_target
+    start, deadline, attempts, holder = tables.start, tables.deadline, tables.attempts, tables.holder
+    n = len(state)
+    for i in range(len(holder)):
+        holder[i] = NONE
+    rng = random.Random(seed)
+    for i in range(n):
+        state[i] = IDLE
+        wait_target[i] = NONE
+        attempts[i] = 0
+        start[i] = rng.randint(0, jitter_ticks) if jitter_ticks else 0
+
+    active = array.array('i', range(n))
+    completed = deadlocked = cycle_processes = 0
+    tick = 0
+    while active:
+        remaining = array.array('i')
+        keep = remaining.append
+        progress = False
+        next_event = sys.maxsize
+        for p in active:
+            s = state[p]
+            entered = False
+            if s == IDLE:
+                if tick < start[p]:
+                    next_event = min(next_event, start[p])
+                    keep(p)
+                    continue
+                s = WAIT_FIRST
+                state[p] = s
+                wait_target[p] = first[p]
+                deadline[p] = tick + timeout_ticks
+                progress = entered = True
+            if s == HOLD:
+                if tick < deadline[p]:
+                    next_event = min(next_event, deadline[p])
+                    keep(p)
+                    continue
+                s = WAIT_SECOND
+                state[p] = s
+                wait_target[p] = second[p]
+                deadline[p] = tick + timeout_ticks
+                progress = entered = True
+
+            r = wait_target[p]
+            attempts[p] += 1
+            if holder[r] == NONE:
+                holder[r] = p
+                wait_target[p] = NONE
+                progress = True
+                if s == WAIT_FIRST:
+                    state[p] = HOLD
+                    deadline[p] = tick + hold_ticks
+                    next_event = min(next_event, deadline[p])
+                    keep(p)
+                else:
+                    state[p] = DONE
+                    completed += 1
+                    if release_on_finish:
+                        holder[first[p]] = NONE
+                        holder[r] = NONE
+            elif tick >= deadline[p]:
+                state[p] = DEADLOCKED
+                wait_target[p] = NONE
+                deadlocked += 1
+                progress = True
+                if release_on_finish and s == WAIT_SECOND:
+                    holder[first[p]] = NONE
+            else:
+                if entered:
+                    q, length = holder[r], 1
+                    while q != NONE and q != p and wait_target[q] != NONE and length <= n:
+                        q = holder[wait_target[q]]
+                        length += 1
+                    if q == p:
+                        cycle_processes += length
+                next_event = min(next_event, deadline[p])
+                keep(p)
+
+        active = remaining
+        tick = tick + 1 if progress else max(tick + 1, next_event)
+
+    return {
+        "completed": completed,
+        "deadlocked": deadlocked,
+        "cycle_processes": cycle_processes,
+        "ticks": tick,
+    }
+
+
+def run_scenario(section, hold_time=1, timeout=DEFAULT_TIMEOUT, release_on_finish=False, jitter=0.0, seed=None):
+    """
+    Spustí scénář deadlocku nad kompaktními tabulkami a vrátí metriky ve tvaru Deadlock.run_scenario
+    (strategie 'timeout').
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :param timeout: Časový limit čekání v sekundách
+    :param release_on_finish: Pokud je True, proces po dokončení nebo vypršení limitu uvolní prostředky
+    :param jitter: Rozptyl startů procesů v sekundách
+    :param seed: Semínko generátoru náhodných čísel
+    :return: Slovník s verdiktem, počty procesů, propustností a velikostí tabulek
+    """
+    tables = CompactTables.from_section(section)
+    return run_tables(tables, hold_time, timeout, release_on_finish, jitter, seed)
+
+
+def run_tables(tables, hold_time=1, timeout=DEFAULT_TIMEOUT, release_on_finish=False, jitter=0.0, seed=None):
+    """
+    Převede časy na kroky délky TICK, spustí simulate a výsledek převede do tvaru Deadlock.run_scenario.
+    Čas simulace (ticks * TICK) se vykazuje odděleně od skutečné doby výpočtu.
+
+    :return: Slovník s metrikami (viz run_scenario)
+    """
+    start_time = time.time()
+    result = simulate(tables, round(hold_time / TICK), max(1, round(timeout / TICK)), release_on_finish,
+                      round(jitter / TICK), seed)
+    elapsed = time.time() - start_time
+    simulated = result["ticks"] * TICK
+    completed, aborts = result["completed"], result["deadlocked"]
+    return {
+        "strategy": "timeout",
+        "deadlock_detected": aborts > 0,
+        "processes": len(tables),
+        "completed": completed,
+        "restarts": 0,
+        "aborts": aborts,
+        "abort_rate": aborts / (aborts + completed) if aborts + completed else 0.0,
+        "throughput": completed / simulated if simulated > 0 else 0.0,
+        "cycle_processes": result["cycle_processes"],
+        "simulated_time": simulated,
+        "table_bytes": tables.nbytes(),
+        "elapsed": elapsed,
+    }
+
+
+if __name__ == "__main__":
+    try:
+        processes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+        tables = CompactTables.generate(processes, processes // 2, seed=1)
+        result = run_tables(tables, hold_time=0.2, timeout=1, release_on_finish=True, jitter=5, seed=1)
+        print(f"Procesů: {processes}, velikost tabulek: {result['table_bytes'] / 2 ** 20:.1f} MB")
+        print(f"Dokončeno: {result['completed']}, v deadlocku: {result['aborts']}, "
+              f"na cyklu čekání: {result['cycle_processes']}")
+        print(f"Simulovaný čas: {result['simulated_time']:.1f} s, doba výpočtu: {result['elapsed']:.2f} s")
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,263 @@
+import argparse
+import contextlib
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+
+try:
+    from . import Acquisition, Deadlock, Shard, Timeouts
+    from .Workload import percentile
+except ImportError:
+    import Acquisition, Deadlock, Shard, Timeouts
+    from Workload import percentile
+
+DEFAULT_CONFIG = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "config", "config.json"))
+
+# Politiky řízení souběhu, které balíček podporuje (argumenty pro Deadlock.build_processes):
+#   timeout          - detekce vypršením pevného limitu, dokončený proces prostředky drží (původní chování)
+#   timeout-release  - detekce vypršením pevného limitu, dokončený proces prostředky uvolní
+#   adaptive-timeout - detekce vypršením limitu odvozeného z naměřených dob držení (Timeouts.AdaptiveTimeout)
+#   wait-die         - prevence: mladší proces čekající na staršího držitele se restartuje
+#   wound-wait       - prevence: starší proces zraní mladšího držitele
+POLICIES = {
+    "timeout": {"strategy": "timeout"},
+    "timeout-release": {"strategy": "timeout", "release_on_finish": True},
+    "adaptive-timeout": {"strategy": "timeout", "release_on_finish": True,
+                         "timeout_policy": Timeouts.AdaptiveTimeout},
+    "wait-die": {"strategy": "wait-die"},
+    "wound-wait": {"strategy": "wound-wait"},
+}
+DEFAULT_ACQUISITION = "poll"  # Původní zamykání prostředku: pokus o zamčení a pauza 1 s (Acquisition.PollingAcquire)
+DEFAULT_JITTER = 0.05  # Rozptyl startů procesů v sekundách; starty losuje semínko běhu
+FIELDS = ["policy", "acquisition", "runs", "completed", "throughput", "latency_mean", "latency_p95", "latency_p99", "aborts",
+          "restarts", "deadlocks", "cpu_time", "elapsed"]
+
+
+def run_policy(section, policy, hold_time=0.1, seed=None, acquisition=DEFAULT_ACQUISITION, jitter=DEFAULT_JITTER):
+    """
+    Provede jeden běh zátěže se zadanou politikou.
+    Semínko určuje zpoždění startu procesů, takže běhy se stejným semínkem mají pro všechny politiky
+    stejné pořadí startů a liší se jen politikou (a plánováním vláken).
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param policy: Název politiky (klíč POLICIES)
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :param seed: Semínko zpoždění startů, nebo None pro náhodná zpoždění
+    :param acquisition: Název strategie zamykání prostředků (klíč Acquisition.STRATEGIES)
+    :param jitter: Zpoždění startu procesu se losuje rovnoměrně z intervalu 0 až jitter sekund
+    :return: Slovník s počtem dokončených procesů, přerušení a restartů, verdiktem, dobou běhu,
+             spotřebovaným časem procesoru, zpožděními startů a latencemi dokončených procesů (od startu běhu)
+    :raises ValueError: Pokud politika nebo strategie zamykání není známá nebo je rozptyl záporný
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Neznámá politika '{policy}'. Podporované: {', '.join(POLICIES)}.")
+    if acquisition not in Acquisition.STRATEGIES:
+        raise ValueError(f"Neznámá strategie zamykání '{acquisition}'. "
+                         f"Podporované: {', '.join(Acquisition.STRATEGIES)}.")
+    if not isinstance(jitter, (int, float)) or jitter < 0:
+        raise ValueError("Rozptyl startů musí být nezáporné číslo.")
+    processes = Deadlock.build_processes(section, hold_time=hold_time,
+                                         acquisition=Acquisition.STRATEGIES[acquisition], **POLICIES[policy])
+    rng = random.Random(seed)
+    for process in processes:
+        process.start_delay = rng.uniform(0, jitter)
+
+    cpu_start = time.process_time()
+    start_time = time.time()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.time() - start_time
+    cpu_time = time.process_time() - cpu_start
+
+    completed = [process for process in processes if process.completed]
+    restarts = sum(process.restarts for process in processes)
+    return {
+        "policy": policy,
+        "acquisition": acquisition,
+        "seed": seed,
+        "start_delays": [process.start_delay for process in processes],
+        "completed": len(completed),
+        "aborts": restarts + sum(1 for process in processes if process.deadlock_detected),
+        "restarts": restarts,
+        "deadlock_detected": any(process.deadlock_detected for process in processes),
+        "elapsed": elapsed,
+        "cpu_time": cpu_time,
+        "latencies": sorted(process.finished_at - start_time for process in completed),
+    }
+
+
+def compare(section, policies=tuple(POLICIES), repetitions=3, seed=0, hold_time=0.1,
+            acquisitions=(DEFAULT_ACQUISITION,), jitter=DEFAULT_JITTER):
+    """
+    Spustí stejnou zátěž se všemi zadanými politikami a strategiemi zamykání a stejnými semínky.
+    Kombinace se v každém opakování střídají, takže pomalé změny zatížení počítače postihnou všechny stejně.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param policies: Názvy porovnávaných politik (klíče POLICIES)
+    :param repetitions: Počet opakování každé kombinace (opakování i má semínko seed + i)
+    :param seed: Semínko prvního opakování
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :param acquisitions: Názvy porovnávaných strategií zamykání (klíče Acquisition.STRATEGIES)
+    :param jitter: Rozptyl startů procesů v sekundách
+    :return: Dvojice (souhrn podle politik a strategií ve formátu summarize, seznam jednotlivých běhů)
+    :raises ValueError: Pokud je počet opakování menší než 1 nebo politika či strategie není známá
+    """
+    if repetitions < 1:
+        raise ValueError("Počet opakování musí být kladné celé číslo.")
+    unknown = [policy for policy in policies if policy not in POLICIES]
+    if unknown:
+        raise ValueError(f"Neznámá politika '{unknown[0]}'. Podporované: {', '.join(POLICIES)}.")
+    unknown = [acquisition for acquisition in acquisitions if acquisition not in Acquisition.STRATEGIES]
+    if unknown:
+        raise ValueError(f"Neznámá strategie zamykání '{unknown[0]}'. "
+                         f"Podporované: {', '.join(Acquisition.STRATEGIES)}.")
+
+    runs = []
+    for repetition in range(repetitions):
+        for acquisition in acquisitions:
+            for policy in policies:
+                runs.append(run_policy(section, policy, hold_time, seed + repetition, acquisition, jitter))
+    return summarize(runs, policies, acquisitions), runs
+
+
+def summarize(runs, policies, acquisitions=(DEFAULT_ACQUISITION,)):
+    """
+    Sloučí běhy každé dvojice politiky a strategie zamykání do jednoho řádku tabulky.
+    Propustnost je počet dokončených procesů za sekundu přes všechny běhy, percentily latence
+    se počítají ze všech dokončených procesů; ostatní hodnoty jsou průměry na jeden běh.
+
+    :param runs: Běhy ve formátu run_policy
+    :param policies: Pořadí politik ve výsledku
+    :param acquisitions: Pořadí strategií zamykání ve výsledku
+    :return: Seznam slovníků s klíči FIELDS
+    """
+    rows = []
+    for acquisition, policy in itertools.product(acquisitions, policies):
+        selected = [run for run in runs if run["policy"] == policy and run["acquisition"] == acquisition]
+        if not selected:
+            continue
+        count = len(selected)
+        latencies = sorted(latency for run in selected for latency in run["latencies"])
+        completed = sum(run["completed"] for run in selected)
+        elapsed = sum(run["elapsed"] for run in selected)
+        rows.append({
+            "policy": policy,
+            "acquisition": acquisition,
+            "runs": count,
+            "completed": completed / count,
+            "throughput": completed / elapsed if elapsed > 0 else 0.0,
+            "latency_mean": sum(latencies) / len(latencies) if latencies else None,
+            "latency_p95": percentile(latencies, 95),
+            "latency_p99": percentile(latencies, 99),
+            "aborts": sum(run["aborts"] for run in selected) / count,
+            "restarts": sum(run["restarts"] for run in selected) / count,
+            "deadlocks": sum(1 for run in selected if run["deadlock_detected"]),
+            "cpu_time": sum(run["cpu_time"] for run in selected) / count,
+            "elapsed": elapsed / count,
+        })
+    return rows
+
+
+def format_table(rows):
+    """
+    Vrátí souhrn politik jako textovou tabulku (časy v milisekundách).
+
+    :param rows: Výsledek funkce summarize
+    :return: Text tabulky
+    """
+    def ms(value):
+        return "-" if value is None else f"{value * 1000:.1f}"
+
+    lines = [f"{'Politika':<18}{'Zamykání':<10}{'Běhy':>6}{'Dokončeno':>11}{'Propustnost/s':>15}{'Latence (ms)':>14}"
+             f"{'p95 (ms)':>10}{'p99 (ms)':>10}{'Přerušení':>11}{'Restarty':>10}{'Deadlocky':>11}"
+             f"{'CPU (ms)':>10}{'Doba (s)':>10}"]
+    for r in rows:
+        lines.append(f"{r['policy']:<18}{r['acquisition']:<10}{r['runs']:>6}{r['completed']:>11.1f}{r['throughput']:>15.2f}"
+                     f"{ms(r['latency_mean']):>14}{ms(r['latency_p95']):>10}{ms(r['latency_p99']):>10}"
+                     f"{r['aborts']:>11.1f}{r['restarts']:>10.1f}{r['deadlocks']:>11}"
+                     f"{r['cpu_time'] * 1000:>10.1f}{r['elapsed']:>10.2f}")
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    """
+    Zapíše souhrn politik do souboru CSV (časy v sekundách).
+
+    :param rows: Výsledek funkce summarize
+    :param path: Cesta k souboru
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_parser():
+    """
+    Vytvoří parser argumentů porovnání politik.
+
+    :return: Instance argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="Compare.py",
+        description="Porovnání politik řízení souběhu a strategií zamykání na stejné zátěži se stejnými semínky.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="cesta ke konfiguračnímu souboru")
+    parser.add_argument("--section", default="deadlock_livelock", help="sekce konfigurace se zátěží")
+    parser.add_argument("--generate", type=int, metavar="SKUPINY",
+                        help="místo konfigurace vygenerovat zátěž s daným počtem skupin (Shard.generate_section)")
+    parser.add_argument("--policies", default=",".join(POLICIES),
+                        help="čárkou oddělené politiky (výchozí všechny)")
+    parser.add_argument("--acquisitions", default=DEFAULT_ACQUISITION,
+                        help=f"čárkou oddělené strategie zamykání ({', '.join(Acquisition.STRATEGIES)}; "
+                             f"výchozí {DEFAULT_ACQUISITION})")
+    parser.add_argument("--repetitions", type=int, default=3, help="počet opakování každé kombinace")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="semínko zpoždění startů prvního opakování (a generované zátěže)")
+    parser.add_argument("--hold-time", type=float, default=0.1, help="doba mezi zamčením prostředků v sekundách")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="rozptyl startů procesů v sekundách")
+    parser.add_argument("--csv", help="soubor CSV pro souhrn")
+    parser.add_argument("--verbose", action="store_true", help="vypisovat průběh simulací")
+    return parser
+
+
+def main(argv=None):
+    """
+    Vstupní bod porovnání politik: vypíše tabulku a volitelně zapíše CSV.
+
+    :param argv: Argumenty příkazové řádky (výchozí sys.argv[1:])
+    :return: Návratový kód procesu
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        if args.generate is not None:
+            section = Shard.generate_section(args.generate, seed=args.seed)
+        else:
+            config = Deadlock.load_config(args.config)
+            if args.section not in config:
+                raise KeyError(f"Chybí sekce '{args.section}' v konfiguraci.")
+            section = config[args.section]
+        policies = [policy.strip() for policy in args.policies.split(",") if policy.strip()]
+        acquisitions = [name.strip() for name in args.acquisitions.split(",") if name.strip()]
+
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(sys.stderr if args.verbose else devnull):
+                rows, _ = compare(section, policies, args.repetitions, args.seed, args.hold_time, acquisitions,
+                                  args.jitter)
+    except Exception as e:
+        print(f"CHYBA: {e}", file=sys.stderr)
+        return 1
+
+    print(format_table(rows))
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"\nVýsledky uloženy do {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
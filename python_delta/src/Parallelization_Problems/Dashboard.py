@@ -0,0 +1,261 @@
+import concurrent.futures
+import json
+import queue
+import subprocess
+import threading
+import time
+
+MAX_PARALLEL_RUNS = 4  # Velikost sdíleného fondu; další běhy čekají na volné místo
+QUEUE_SIZE = 500  # Nejvyšší počet nevykreslených řádků výstupu jednoho běhu; další řádky se zahodí
+STOP_TIMEOUT = 1.0  # Doba (v s), po kterou se čeká na kooperativní ukončení běhu, než je násilně ukončen
+
+# Předvolby běhů: název panelu -> argumenty příkazové řádky (CLI.py)
+PRESETS = {
+    "Deadlock (timeout)": ["--scenario", "deadlock"],
+    "Deadlock (wait-die)": ["--scenario", "deadlock", "--strategy", "wait-die"],
+    "Deadlock (wound-wait)": ["--scenario", "deadlock", "--strategy", "wound-wait"],
+    "Livelock": ["--scenario", "livelock"],
+    "Livelock (hlídač)": ["--scenario", "livelock", "--watchdog"],
+    "Starvation": ["--scenario", "starvation"],
+    "Inverze priorit": ["--scenario", "inversion"],
+}
+
+# Stavy běhu
+QUEUED, RUNNING, FINISHED, STOPPED = "queued", "running", "finished", "stopped"
+
+
+class Run:
+    def __init__(self, name, command):
+        """
+        Inicializuje jeden běh simulace zobrazovaný v samostatném panelu.
+
+        Výstup simulace čte vlákno fondu do omezené fronty, kterou vybírá hlavní vlákno GUI.
+        Když GUI nestíhá, řádky nad QUEUE_SIZE se zahodí a jen se spočítají (dropped), takže
+        výřečný běh nezahltí paměť ani ostatní panely a simulace se kvůli GUI nikdy nezdrží.
+        Záznam s výsledkem se do fronty nevkládá, a proto se nikdy neztratí.
+
+        :param name: Název běhu (popisek panelu)
+        :param command: Příkaz procesu simulace (seznam argumentů pro subprocess)
+        """
+        self.name = name
+        self.command = command
+        self.lines = queue.Queue(maxsize=QUEUE_SIZE)
+        self.dropped = 0  # Počet zahozených řádků výstupu
+        self.state = QUEUED
+        self.record = None  # Poslední záznam s výsledkem (JSON ze standardního výstupu)
+        self.returncode = None
+        self.error = None
+        self.started = None  # time.monotonic() při spuštění procesu
+        self.finished = None
+        self.process = None
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self):
+        """
+        Doba běhu v sekundách, nebo None, pokud běh ještě nezačal.
+        """
+        if self.started is None:
+            return None
+        return (self.finished if self.finished is not None else time.monotonic()) - self.started
+
+    @property
+    def done(self):
+        """
+        True, pokud běh skončil (dokončen, s chybou nebo zastaven).
+        """
+        return self.state in (FINISHED, STOPPED)
+
+    def execute(self):
+        """
+        Spustí proces simulace a čte jeho výstup až do konce (volá vlákno fondu).
+        Standardní chybový výstup (průběh simulace) jde do fronty řádků, standardní výstup obsahuje
+        záznamy s výsledky ve formátu JSON Lines.
+        """
+        with self._lock:
+            if self.state == STOPPED:
+                return  # Zastaven dřív, než se uvolnilo místo ve fondu
+            self.started = time.monotonic()
+            try:
+                self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                                text=True, encoding="utf-8", errors="replace")
+            except OSError as e:
+                self.error = str(e)
+                self.finished = time.monotonic()
+                self.state = FINISHED
+                return
+            self.state = RUNNING
+
+        reader = threading.Thread(target=self._read_output, args=(self.process.stderr,), daemon=True)
+        reader.start()
+        for line in iter(self.process.stdout.readline, ''):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                self._put(line)
+                continue
+            if isinstance(record, dict) and record.get("type") != "event":
+                self.record = record
+        self.process.stdout.close()
+        reader.join()
+        self.returncode = self.process.wait()
+        self.finished = time.monotonic()
+        with self._lock:
+            if self.state != STOPPED:
+                self.state = FINISHED
+
+    def _read_output(self, pipe):
+        for line in iter(pipe.readline, ''):
+            self._put(line)
+        pipe.close()
+
+    def _put(self, line):
+        try:
+            self.lines.put_nowait(line)
+        except queue.Full:
+            with self._lock:  # Čtou obě vlákna výstupu (stdout i stderr)
+                self.dropped += 1
+
+    def stop(self):
+        """
+        Zastaví běh bez čekání (volá hlavní vlákno GUI). Čekající běh se vůbec nespustí; běžící proces
+        dostane SIGTERM (příkazová řádka běh kooperativně zruší) a pokud neskončí do STOP_TIMEOUT,
+        časovač jej ukončí násilně. Na konec procesu čeká vlákno fondu v execute.
+        """
+        with self._lock:
+            if self.done:
+                return
+            self.state = STOPPED
+            process = self.process
+        if process is not None and process.poll() is None:
+            process.terminate()
+            timer = threading.Timer(STOP_TIMEOUT, self._kill, args=(process,))
+            timer.start()
+
+    @staticmethod
+    def _kill(process):
+        if process.poll() is None:
+            process.kill()
+
+    def take(self, limit):
+        """
+        Vybere z fronty nejvýše limit řádků výstupu (volá hlavní vlákno GUI).
+
+        :param limit: Nejvyšší počet řádků
+        :return: Seznam řádků
+        """
+        lines = []
+        while len(lines) < limit:
+            try:
+                lines.append(self.lines.get_nowait())
+            except queue.Empty:
+                break
+        return lines
+
+    def verdict(self):
+        """
+        Vrátí krátký popis výsledku běhu pro panel.
+
+        :return: Text verdiktu
+        """
+        if self.state == STOPPED:
+            return "zastaveno"
+        if self.state == QUEUED:
+            return "čeká na volné místo"
+        if self.state == RUNNING:
+            return "běží"
+        if self.error is not None:
+            return f"chyba: {self.error}"
+        if self.record is None:
+            return f"chyba (kód {self.returncode})" if self.returncode else "bez výsledku"
+        return verdict(self.record)
+
+
+def verdict(record):
+    """
+    Vrátí verdikt ze záznamu příkazové řádky (viz CLI.run).
+
+    :param record: Záznam o běhu s klíčem 'result'
+    :return: Text verdiktu
+    """
+    if record.get("cancelled"):
+        return "zrušeno"
+    result = record.get("result", {})
+    if result.get("deadlock_detected"):
+        return "DEADLOCK"
+    if result.get("livelock_detected"):
+        return "LIVELOCK"
+    if result.get("starvation_detected"):
+        return f"VYHLADOVĚNÍ ({', '.join(result.get('starved', []))})"
+    if "protocols" in result:
+        best = min(result["protocols"], key=lambda protocol: protocol["worst_wait"])
+        return f"nejkratší čekání: {best['protocol']} ({best['worst_wait']:.2f} s)"
+    return "bez problému"
+
+
+class RunPool:
+    def __init__(self, workers=MAX_PARALLEL_RUNS):
+        """
+        Inicializuje sdílený fond, ve kterém běží všechny simulace panelu.
+
+        :param workers: Nejvyšší počet současně běžících simulací
+        :raises ValueError: Pokud počet není kladné celé číslo
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Počet současných běhů musí být kladné celé číslo.")
+        self.workers = workers
+        self.runs = []
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers,
+                                                               thread_name_prefix="DashboardRun")
+
+    def submit(self, run):
+        """
+        Zařadí běh do fondu.
+
+        :param run: Instance Run
+        :return: Stejná instance Run
+        """
+        self.runs.append(run)
+        self._executor.submit(run.execute)
+        return run
+
+    def stop_all(self):
+        """
+        Zastaví všechny čekající i běžící běhy; všem procesům pošle SIGTERM naráz a na žádný nečeká.
+        """
+        for run in self.runs:
+            run.stop()
+
+    def shutdown(self):
+        """
+        Zastaví všechny běhy a ukončí vlákna fondu.
+        """
+        self.stop_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def drain(self, budget):
+        """
+        Spravedlivě rozdělí rozpočet řádků jednoho snímku mezi běhy.
+
+        Každý běh dostane stejný díl; díl, který běh nevyčerpal, se v dalších kolech rozdělí mezi běhy,
+        které mají ve frontě víc řádků. Výřečný běh proto nikdy neodsune aktualizace ostatních panelů.
+
+        :param budget: Nejvyšší celkový počet řádků za snímek
+        :return: Slovník běh -> seznam řádků (jen běhy s novými řádky)
+        """
+        result = {}
+        pending = [run for run in self.runs if not run.lines.empty()]
+        while pending and budget > 0:
+            share = max(1, budget // len(pending))
+            still_pending = []
+            for run in pending:
+                lines = run.take(min(share, budget))
+                if lines:
+                    result.setdefault(run, []).extend(lines)
+                    budget -= len(lines)
+                if len(lines) == share and not run.lines.empty():
+                    still_pending.append(run)
+                if budget <= 0:
+                    break
+            pending = still_pending
+        return result
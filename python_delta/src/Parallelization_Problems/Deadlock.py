@@ -1,86 +1,240 @@
 import threading
+import itertools
 import time
 import json
+import sys
+
+try:
+    from . import Acquisition, Cancellation, Events
+    from .Cancellation import Cancelled
+except ImportError:
+    import Acquisition, Cancellation, Events
+    from Cancellation import Cancelled
 
 output_lock = threading.Lock()  # Zámek pro synchronizaci výstupu
 
+# Podporované strategie získávání prostředků:
+#   timeout    - detekce deadlocku vypršením časového limitu (původní chování)
+#   wait-die   - starší proces čeká na mladšího držitele, mladší proces "umře" a restartuje se
+#   wound-wait - starší proces "zraní" mladšího držitele (ten uvolní prostředky), mladší proces čeká
+STRATEGIES = ("timeout", "wait-die", "wound-wait")
+
+_timestamps = itertools.count()  # Monotónní zdroj časových razítek procesů
+
+
+class AbortError(Exception):
+    """
+    Výjimka signalizující, že proces musí uvolnit prostředky a restartovat se
+    (strategie wait-die a wound-wait).
+    """
+
 
 class Resource:
-    def __init__(self, name):
+    def __init__(self, name, timeout_policy=None, acquisition=None):
         """
         Inicializuje objekt Resource se zadaným názvem.
 
         :param name: Název prostředku
-        :raises ValueError: Pokud název není typu string
+        :param timeout_policy: Politika časového limitu (např. Timeouts.AdaptiveTimeout), nebo None pro 5 sekund
+        :param acquisition: Strategie zamykání (např. Acquisition.HybridAcquire), nebo None pro pokusy po 1 sekundě
+        :raises ValueError: Pokud název není typu string, politika nemá metody timeout() a observe()
+                            nebo strategie zamykání nemá metodu acquire()
         """
         if not isinstance(name, str):
             raise ValueError("Název prostředku musí být řetězec.")
+        if timeout_policy is not None and not (hasattr(timeout_policy, "timeout") and hasattr(timeout_policy, "observe")):
+            raise ValueError("Politika časového limitu musí mít metody timeout() a observe().")
+        if acquisition is not None and not hasattr(acquisition, "acquire"):
+            raise ValueError("Strategie zamykání musí mít metodu acquire().")
         self.name = name
         self.lock = threading.Lock()
-
-    def acquire(self, process_name, timeout=5):
+        self.timeout_policy = timeout_policy
+        self.acquisition = acquisition if acquisition is not None else Acquisition.PollingAcquire()
+        self.waiting = 0  # Počet procesů čekajících v acquire()
+        self.acquired_at = None  # Čas posledního zamčení (pro měření doby držení)
+        self._waiting_lock = threading.Lock()
+        self.holder = None  # Proces, který prostředek aktuálně drží (strategie wait-die/wound-wait)
+
+    def acquire(self, process_name, timeout=None, token=None):
         """
         Pokusí se zamknout prostředek během zadaného timeoutu.
         Pokud se zámek nepodaří získat během timeoutu, vyvolá výjimku.
 
         :param process_name: Název procesu, který se pokouší zamknout prostředek
-        :param timeout: Čas (v sekundách) na pokus o zamčení (výchozí je 5 sekund)
+        :param timeout: Čas (v sekundách) na pokus o zamčení (výchozí podle politiky prostředku, jinak 5 sekund)
+        :param token: Token zrušení běhu (Cancellation.CancellationToken), nebo None
         :raises ValueError: Pokud název procesu není typu string
         :raises TimeoutError: Pokud se zámek nepodaří získat během timeoutu
+        :raises Cancelled: Pokud byl běh během čekání zrušen
         """
         if not isinstance(process_name, str):
             raise ValueError("Název procesu musí být řetězec.")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            acquired = self.lock.acquire(blocking=False)
-            if acquired:
+        if timeout is None:
+            timeout = self.timeout_policy.timeout(self.waiting) if self.timeout_policy else 5
+
+        Events.emit("wait", process_name, self.name)
+        with self._waiting_lock:
+            self.waiting += 1
+        try:
+            acquired = self.acquisition.acquire(self.lock, timeout, token)
+        finally:
+            with self._waiting_lock:
+                self.waiting -= 1
+        if acquired:
+            self.acquired_at = time.time()
+            Events.emit("acquired", process_name, self.name)
+            with output_lock:
+                print(f'{process_name}: {self.name} byl zamčen.')
+            return
+        Events.emit("timeout", process_name, self.name)
+        raise TimeoutError(f"{self.name}")
+
+    def acquire_ordered(self, process, poll_interval=0.05):
+        """
+        Zamkne prostředek podle časových razítek procesů (strategie wait-die nebo wound-wait).
+        Starší proces má menší časové razítko.
+
+        :param process: Proces, který se pokouší zamknout prostředek
+        :param poll_interval: Pauza (v sekundách) mezi pokusy o zamčení
+        :raises ValueError: Pokud proces nepoužívá strategii wait-die nebo wound-wait
+        :raises AbortError: Pokud se proces musí vzdát svých prostředků a restartovat se
+        :raises Cancelled: Pokud byl běh během čekání zrušen
+        """
+        if not isinstance(process, Process) or process.strategy == "timeout":
+            raise ValueError("Proces musí používat strategii 'wait-die' nebo 'wound-wait'.")
+
+        Events.emit("wait", process.name, self.name)
+        while True:
+            if process.wounded:
+                raise AbortError(f"{process.name} byl zraněn starším procesem.")
+
+            if self.lock.acquire(blocking=False):
+                self.holder = process
+                self.acquired_at = time.time()
+                Events.emit("acquired", process.name, self.name)
                 with output_lock:
-                    print(f'{process_name}: {self.name} byl zamčen.')
+                    print(f'{process.name}: {self.name} byl zamčen.')
                 return
 
-            time.sleep(1)  # Pauza před dalším pokusem
-        raise TimeoutError(f"{self.name}")
+            holder = self.holder
+            if holder is not None and holder is not process:
+                if process.strategy == "wait-die" and process.timestamp > holder.timestamp:
+                    raise AbortError(f"{process.name} je mladší než {holder.name} a umírá.")
+                if process.strategy == "wound-wait" and process.timestamp < holder.timestamp:
+                    holder.wounded = True
+
+            Cancellation.sleep(poll_interval, process.token)  # Pauza před dalším pokusem
+
+    def release(self, process_name=None):
+        """
+        Uvolní prostředek a zapomene jeho držitele.
+
+        :param process_name: Název uvolňujícího procesu, pokud prostředek nemá zaznamenaného držitele
+                             (strategie 'timeout')
+        :raises RuntimeError: Pokud prostředek není zamčen
+        """
+        if self.holder is not None:
+            Events.emit("released", self.holder.name, self.name)
+        elif process_name is not None:
+            Events.emit("released", process_name, self.name)
+        if self.timeout_policy is not None and self.acquired_at is not None:
+            self.timeout_policy.observe(time.time() - self.acquired_at)
+        self.acquired_at = None
+        self.holder = None
+        self.lock.release()
 
 
 class Process(threading.Thread):
-    def __init__(self, name, resource1, resource2):
+    def __init__(self, name, resource1, resource2, strategy="timeout", hold_time=1, start_delay=0,
+                 release_on_finish=False, token=None):
         """
         Inicializuje objekt Process představující proces, který se pokouší zamknout dva prostředky.
 
         :param name: Název procesu
         :param resource1: První prostředek
         :param resource2: Druhý prostředek
-        :raises ValueError: Pokud názvy prostředků nejsou instance třídy Resource
+        :param strategy: Strategie získávání prostředků ('timeout', 'wait-die' nebo 'wound-wait')
+        :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+        :param start_delay: Čas (v sekundách) před prvním pokusem o zamčení
+        :param release_on_finish: Pokud je True, proces se strategií 'timeout' po dokončení nebo vypršení
+                                  časového limitu uvolní držené prostředky (jinak je drží navždy)
+        :param token: Token zrušení běhu (Cancellation.CancellationToken), nebo None
+        :raises ValueError: Pokud názvy prostředků nejsou instance třídy Resource nebo je strategie neznámá
         """
         if not isinstance(name, str):
             raise ValueError("Název procesu musí být řetězec.")
         if not isinstance(resource1, Resource) or not isinstance(resource2, Resource):
             raise ValueError("Prostředky musí být instance třídy Resource.")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Neznámá strategie '{strategy}'. Podporované: {', '.join(STRATEGIES)}.")
+        if not isinstance(hold_time, (int, float)) or hold_time < 0:
+            raise ValueError("Doba držení musí být nezáporné číslo.")
+        if not isinstance(start_delay, (int, float)) or start_delay < 0:
+            raise ValueError("Zpoždění startu musí být nezáporné číslo.")
 
         threading.Thread.__init__(self)
         self.name = name
         self.resource1 = resource1
         self.resource2 = resource2
+        self.strategy = strategy
+        self.hold_time = hold_time
+        self.start_delay = start_delay
+        self.release_on_finish = release_on_finish
+        self.token = token
+        self.held = []  # Prostředky, které proces právě drží
+        self.timestamp = next(_timestamps)  # Časové razítko se při restartu nemění
+        self.wounded = False
+        self.restarts = 0
+        self.completed = False
+        self.finished_at = None  # Čas dokončení práce (time.time())
         self.deadlock_detected = False
+        self.cancelled = False
 
     def run(self):
         """
         Spustí proces, který se pokouší zamknout oba prostředky.
         Pokud dojde k deadlocku nebo jiné chybě, proces je označen jako neúspěšný.
+        Při zrušení běhu tokenem proces uvolní držené prostředky a okamžitě skončí.
+        """
+        try:
+            if self.start_delay:
+                Cancellation.sleep(self.start_delay, self.token)
+            if self.strategy != "timeout":
+                self._run_ordered()
+            else:
+                self._run_timeout()
+        except Cancelled:
+            self.cancelled = True
+            self.release_held()
+            with output_lock:
+                print(f'{self.name}: běh zrušen.')
+
+    def release_held(self):
+        """
+        Uvolní všechny prostředky, které proces drží (např. po zrušení běhu).
+        """
+        while self.held:
+            self.held.pop().release(self.name)
+
+    def _run_timeout(self):
+        """
+        Spustí proces se strategií timeout (deadlock je detekován vypršením časového limitu).
         """
         try:
             with output_lock:
                 print(f'{self.name}: pokus o zamknutí {self.resource1.name}')
-            self.resource1.acquire(self.name)  # Pokus o zamknutí prvního prostředku
+            self.resource1.acquire(self.name, token=self.token)  # Pokus o zamknutí prvního prostředku
+            self.held.append(self.resource1)
             with output_lock:
                 print(f'{self.name}: zamčen {self.resource1.name}')
 
-            time.sleep(1)  # Simulace čekání na druhý prostředek
+            Cancellation.sleep(self.hold_time, self.token)  # Simulace čekání na druhý prostředek
 
             with output_lock:
                 print(f'{self.name}: pokus o zamknutí {self.resource2.name}')
-            self.resource2.acquire(self.name)  # Pokus o zamknutí druhého prostředku
+            self.resource2.acquire(self.name, token=self.token)  # Pokus o zamknutí druhého prostředku
+            self.held.append(self.resource2)
             with output_lock:
                 print(f'{self.name}: zamčen {self.resource2.name}')
         except TimeoutError as e:
@@ -91,17 +245,66 @@ class Process(threading.Thread):
                 elif self.resource2.lock.locked():
                     print(f"  Důvod: {self.resource1.name} byl již zamčen.")
 
+            Events.emit("deadlock", self.name)
             self.deadlock_detected = True
+            self._release_held()
             return
         except Exception as e:
             with output_lock:
                 print(f"\nNeočekávaná chyba v procesu {self.name}: {e}")
             self.deadlock_detected = True
+            self._release_held()
             return
 
+        self.completed = True
+        self.finished_at = time.time()
+        self._release_held()
         with output_lock:
             print(f'{self.name} dokončil práci.')
 
+    def _release_held(self):
+        """
+        Uvolní prostředky držené ve strategii 'timeout', pokud je zapnuto release_on_finish.
+        """
+        if self.release_on_finish:
+            self.release_held()
+
+    def _run_ordered(self):
+        """
+        Spustí proces se strategií wait-die nebo wound-wait.
+        Při přerušení proces uvolní držené prostředky, počká a zkusí to znovu se stejným
+        časovým razítkem, takže časem se stane nejstarším procesem a práci dokončí.
+        Po dokončení práce proces oba prostředky uvolní.
+        """
+        while True:
+            try:
+                for resource in (self.resource1, self.resource2):
+                    with output_lock:
+                        print(f'{self.name}: pokus o zamknutí {resource.name}')
+                    resource.acquire_ordered(self)
+                    self.held.append(resource)
+                    if resource is self.resource1:
+                        Cancellation.sleep(self.hold_time, self.token)  # Simulace čekání na druhý prostředek
+                if self.wounded:
+                    raise AbortError(f"{self.name} byl zraněn starším procesem.")
+            except AbortError as e:
+                self.release_held()
+                self.wounded = False
+                self.restarts += 1
+                Events.emit("restart", self.name, reason=str(e))
+                with output_lock:
+                    print(f'{self.name}: restart č. {self.restarts} ({e})')
+                Cancellation.sleep(0.1 * min(self.restarts, 10), self.token)  # Pauza před restartem
+                continue
+
+            self.release_held()
+            break
+
+        self.completed = True
+        self.finished_at = time.time()
+        with output_lock:
+            print(f'{self.name} dokončil práci (restarty: {self.restarts}).')
+
 
 
 def load_config(config_file):
@@ -126,50 +329,130 @@ def load_config(config_file):
 
 
 
+def build_processes(section, strategy="timeout", hold_time=1, timeout_policy=None, token=None, acquisition=None,
+                    release_on_finish=False):
+    """
+    Vytvoří prostředky a procesy podle sekce konfigurace ve formátu 'deadlock_livelock'.
+
+    :param section: Sekce konfigurace s klíči 'resources' a 'processes'
+    :param strategy: Strategie získávání prostředků pro všechny procesy
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :param timeout_policy: Třída politiky časového limitu vytvořená pro každý prostředek, nebo None
+    :param token: Token zrušení běhu sdílený všemi procesy, nebo None
+    :param acquisition: Třída (továrna) strategie zamykání vytvořená pro každý prostředek, nebo None
+    :param release_on_finish: Pokud je True, procesy se strategií 'timeout' po dokončení prostředky uvolní
+    :return: Seznam nespuštěných procesů
+    :raises KeyError: Pokud v konfiguraci chybí povinná pole
+    :raises ValueError: Pokud proces odkazuje na neexistující prostředek
+    """
+    if 'resources' not in section or 'processes' not in section:
+        raise KeyError("Chybí 'resources' nebo 'processes' v sekci 'deadlock_livelock' v konfiguraci.")
+
+    # Vytvoření resources na základě konfigurace
+    resources = {}
+    for key, value in section['resources'].items():
+        if 'name' not in value:
+            raise KeyError(f"Chybí 'name' pro prostředek '{key}' v konfiguraci.")
+        resources[key] = Resource(value['name'], timeout_policy() if timeout_policy else None,
+                                  acquisition() if acquisition else None)
+
+    # Vytvoření procesů na základě konfigurace
+    processes = []
+    for p in section['processes']:
+        if 'name' not in p or 'resource1' not in p or 'resource2' not in p:
+            raise KeyError(f"Chybí povinná pole pro proces: 'name', 'resource1' nebo 'resource2'.")
+        resource1 = resources.get(p['resource1'])
+        resource2 = resources.get(p['resource2'])
+        if not resource1 or not resource2:
+            raise ValueError(f"Prostředky pro proces '{p['name']}' nejsou správně definovány.")
+        processes.append(Process(p['name'], resource1, resource2, strategy=strategy, hold_time=hold_time,
+                                 release_on_finish=release_on_finish, token=token))
+    return processes
+
+
+def run_scenario(section, strategy="timeout", hold_time=1, timeout_policy=None, token=None, acquisition=None):
+    """
+    Spustí scénář se zadanou strategií a vrátí jeho metriky.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param strategy: Strategie získávání prostředků ('timeout', 'wait-die' nebo 'wound-wait')
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :param timeout_policy: Třída politiky časového limitu vytvořená pro každý prostředek, nebo None
+    :param token: Token zrušení běhu, nebo None
+    :param acquisition: Třída (továrna) strategie zamykání vytvořená pro každý prostředek, nebo None
+    :return: Slovník s verdiktem, počtem dokončených a přerušených procesů, mírou přerušení a propustností
+    """
+    processes = build_processes(section, strategy, hold_time, timeout_policy, token, acquisition)
+
+    start_time = time.time()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.time() - start_time
+    if token is not None and token.cancelled:
+        # Procesy se strategií timeout, které skončily deadlockem, své prostředky drží i po skončení vlákna
+        for process in processes:
+            process.release_held()
+
+    completed = sum(1 for process in processes if process.completed)
+    restarts = sum(process.restarts for process in processes)
+    aborts = restarts + sum(1 for process in processes if process.deadlock_detected)
+    return {
+        "strategy": strategy,
+        "deadlock_detected": any(process.deadlock_detected for process in processes),
+        "processes": len(processes),
+        "completed": completed,
+        "restarts": restarts,
+        "aborts": aborts,
+        "abort_rate": aborts / (aborts + completed) if aborts + completed else 0.0,
+        "throughput": completed / elapsed if elapsed > 0 else 0.0,
+        "elapsed": elapsed,
+    }
+
+
+def compare_strategies(section, strategies=STRATEGIES, hold_time=1):
+    """
+    Spustí stejný scénář postupně se všemi zadanými strategiemi.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param strategies: Strategie, které se mají porovnat
+    :param hold_time: Čas (v sekundách) mezi zamčením prvního a druhého prostředku
+    :return: Seznam metrik (viz run_scenario) v pořadí strategií
+    """
+    return [run_scenario(section, strategy, hold_time) for strategy in strategies]
+
+
 if __name__ == "__main__":
     try:
         config = load_config('../config/config.json')
 
-        # Vytvoření prostředků na základě konfigurace
-        if 'deadlock_livelock' not in config:
-            raise KeyError("Chybí sekce 'deadlock_livelock' v konfiguraci.")
-
-        if 'resources' not in config['deadlock_livelock'] or 'processes' not in config['deadlock_livelock']:
-            raise KeyError("Chybí 'resources' nebo 'processes' v sekci 'deadlock_livelock' v konfiguraci.")
-
-        # Vytvoření resources na základě konfigurace
-        resources = {}
-        for key, value in config['deadlock_livelock']['resources'].items():
-            if 'name' not in value:
-                raise KeyError(f"Chybí 'name' pro prostředek '{key}' v konfiguraci.")
-            resources[key] = Resource(value['name'])
-
-        # Vytvoření procesů na základě konfigurace
-        processes = []
-        for p in config['deadlock_livelock']['processes']:
-            if 'name' not in p or 'resource1' not in p or 'resource2' not in p:
-                raise KeyError(f"Chybí povinná pole pro proces: 'name', 'resource1' nebo 'resource2'.")
-            resource1 = resources.get(p['resource1'])
-            resource2 = resources.get(p['resource2'])
-            if not resource1 or not resource2:
-                raise ValueError(f"Prostředky pro proces '{p['name']}' nejsou správně definovány.")
-            process = Process(p['name'], resource1, resource2)
-            processes.append(process)
-
+        # Volitelné argumenty: strategie (nebo 'compare') a název sekce konfigurace
+        strategy = sys.argv[1] if len(sys.argv) > 1 else "timeout"
+        section_name = sys.argv[2] if len(sys.argv) > 2 else 'deadlock_livelock'
 
-        for process in processes:
-            process.start()
-
-        for process in processes:
-            process.join()
+        # Vytvoření prostředků na základě konfigurace
+        if section_name not in config:
+            raise KeyError(f"Chybí sekce '{section_name}' v konfiguraci.")
 
-        if any(process.deadlock_detected for process in processes):
+        if strategy == "compare":
+            results = compare_strategies(config[section_name])
             with output_lock:
-                print(
-                    "\nDEADLOCK DETEKOVÁN: Systém narazil na situaci deadlocku, kdy se procesy navzájem blokovaly.")
+                print(f"\n{'Strategie':<12}{'Dokončeno':>10}{'Restarty':>10}{'Míra přerušení':>16}{'Propustnost/s':>15}")
+                for r in results:
+                    print(f"{r['strategy']:<12}{r['completed']:>10}{r['restarts']:>10}"
+                          f"{r['abort_rate']:>16.2f}{r['throughput']:>15.2f}")
         else:
-            with output_lock:
-                print("\nDeadlock nebyl detekován. Všechny procesy byly úspěšně dokončeny.")
+            result = run_scenario(config[section_name], strategy)
+            if result["deadlock_detected"]:
+                with output_lock:
+                    print(
+                        "\nDEADLOCK DETEKOVÁN: Systém narazil na situaci deadlocku, kdy se procesy navzájem blokovaly.")
+            else:
+                with output_lock:
+                    print("\nDeadlock nebyl detekován. Všechny procesy byly úspěšně dokončeny.")
+                    if result["restarts"]:
+                        print(f"Počet restartů ({strategy}): {result['restarts']}")
 
     except Exception as e:
         with output_lock:
@@ -0,0 +1,86 @@
+import threading
+import time
+
+# Druhy událostí, které simulace vysílají:
+#   wait      - proces začal čekat na prostředek
+#   acquired  - proces prostředek získal
+#   released  - proces prostředek uvolnil
+#   timeout   - čekání na prostředek vypršelo
+#   restart   - proces se vzdal prostředků a začíná znovu (wait-die, wound-wait)
+#   backoff   - proces po neúspěšném pokusu ustoupil (livelock)
+#   deadlock, livelock, starved - verdikty simulace
+KINDS = ("wait", "acquired", "released", "timeout", "restart", "backoff", "deadlock", "livelock", "starved")
+
+_sinks = ()  # Přihlášení posluchači; n-tice se při změně nahrazuje celá, čtení proto nepotřebuje zámek
+_sinks_lock = threading.Lock()
+
+
+def subscribe(sink):
+    """
+    Přihlásí posluchače událostí.
+
+    :param sink: Volatelný objekt, který dostane každou událost jako slovník
+    :raises ValueError: Pokud posluchač není volatelný
+    """
+    global _sinks
+    if not callable(sink):
+        raise ValueError("Posluchač událostí musí být volatelný objekt.")
+    with _sinks_lock:
+        _sinks = _sinks + (sink,)
+
+
+def unsubscribe(sink):
+    """
+    Odhlásí posluchače událostí. Neznámý posluchač je ignorován.
+
+    :param sink: Dříve přihlášený posluchač
+    """
+    global _sinks
+    with _sinks_lock:
+        _sinks = tuple(s for s in _sinks if s != sink)
+
+
+def enabled():
+    """
+    Vrátí True, pokud je přihlášen alespoň jeden posluchač.
+    """
+    return bool(_sinks)
+
+
+def emit(kind, process=None, resource=None, **data):
+    """
+    Pošle událost všem přihlášeným posluchačům. Bez posluchačů nic nedělá,
+    takže volání v simulacích nemá měřitelnou režii.
+
+    :param kind: Druh události (viz KINDS)
+    :param process: Název procesu, kterého se událost týká
+    :param resource: Název prostředku, kterého se událost týká
+    :param data: Další údaje události
+    """
+    sinks = _sinks
+    if not sinks:
+        return
+
+    thread = threading.current_thread()
+    event = {
+        "kind": kind,
+        "ts": time.perf_counter(),
+        "thread": thread.ident,
+        "thread_name": thread.name,
+        "process": process if process is not None else thread.name,
+        "resource": resource,
+    }
+    if data:
+        event.update(data)
+    for sink in sinks:
+        sink(event)
+
+
+def publish(event):
+    """
+    Pošle posluchačům již sestavenou událost, např. při přehrávání záznamu z cache.
+
+    :param event: Událost ve formátu slovníku (viz emit)
+    """
+    for sink in _sinks:
+        sink(event)
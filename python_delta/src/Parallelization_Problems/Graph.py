@@ -0,0 +1,129 @@
+FLAGS = ("deadlock", "livelock", "starved")  # Verdikty, kterými se označují uzly procesů
+
+
+class WaitForGraph:
+    def __init__(self):
+        """
+        Inicializuje graf čekání (wait-for graph) sestavovaný průběžně z událostí simulace.
+
+        Uzly jsou procesy a prostředky, hrany jsou držení (prostředek -> proces) a čekání
+        (proces -> prostředek). Metoda apply vrací pouze klíče změněných prvků, takže
+        zobrazení může překreslovat inkrementálně:
+            ("p", proces), ("r", prostředek) - uzly
+            ("hold", prostředek), ("wait", proces) - hrany
+        """
+        self.processes = {}  # Název procesu -> pořadí, ve kterém se objevil
+        self.resources = {}  # Název prostředku -> pořadí, ve kterém se objevil
+        self.holders = {}  # Prostředek -> proces, který jej drží
+        self.waiting = {}  # Proces -> prostředek, na který čeká
+        self.flags = {}  # Proces -> verdikt (viz FLAGS)
+        self.cycles = {}  # Proces -> množina procesů cyklu, jehož je součástí
+
+    def apply(self, event):
+        """
+        Zapracuje jednu událost simulace (viz Events.emit).
+
+        :param event: Událost ve formátu slovníku s klíči 'kind', 'process' a 'resource'
+        :return: Množina klíčů změněných uzlů a hran
+        """
+        kind = event.get("kind")
+        process = event.get("process")
+        resource = event.get("resource")
+        dirty = set()
+        if process is not None:
+            self._add_process(process, dirty)
+        if resource is not None:
+            self._add_resource(resource, dirty)
+
+        if kind == "wait" and process is not None and resource is not None:
+            self.waiting[process] = resource
+            dirty.add(("wait", process))
+            self._detect_cycle(process, dirty)
+        elif kind == "acquired" and resource is not None:
+            self._stop_waiting(process, dirty)
+            previous = self.holders.get(resource)
+            if previous is not None:
+                self._break_cycle(previous, dirty)
+            self.holders[resource] = process
+            dirty.add(("hold", resource))
+            # Nový držitel může uzavřít cyklus procesů, které na prostředek čekají
+            for waiter, target in list(self.waiting.items()):
+                if target == resource:
+                    self._detect_cycle(waiter, dirty)
+        elif kind == "released" and resource is not None:
+            holder = self.holders.pop(resource, None)
+            if holder is not None:
+                self._break_cycle(holder, dirty)
+            dirty.add(("hold", resource))
+        elif kind in ("timeout", "restart"):
+            self._stop_waiting(process, dirty)
+        elif kind in FLAGS and process is not None:
+            self.flags[process] = kind
+            dirty.add(("p", process))
+        return dirty
+
+    def edge_in_cycle(self, key):
+        """
+        Vrátí True, pokud hrana leží na cyklu čekání.
+
+        :param key: Klíč hrany ("hold", prostředek) nebo ("wait", proces)
+        """
+        if key[0] == "wait":
+            return key[1] in self.cycles
+        holder = self.holders.get(key[1])
+        if holder not in self.cycles:
+            return False
+        return any(self.waiting.get(p) == key[1] for p in self.cycles[holder])
+
+    def _add_process(self, name, dirty):
+        if name not in self.processes:
+            self.processes[name] = len(self.processes)
+            dirty.add(("p", name))
+
+    def _add_resource(self, name, dirty):
+        if name not in self.resources:
+            self.resources[name] = len(self.resources)
+            dirty.add(("r", name))
+
+    def _stop_waiting(self, process, dirty):
+        if self.waiting.pop(process, None) is not None:
+            dirty.add(("wait", process))
+            self._break_cycle(process, dirty)
+
+    def _detect_cycle(self, start, dirty):
+        """
+        Projde řetězec čekání od procesu start. Každý proces čeká nejvýše na jeden prostředek
+        a každý prostředek má nejvýše jednoho držitele, takže stačí jít po jediné cestě.
+        """
+        path = []
+        seen = set()
+        process = start
+        while process is not None and process not in seen:
+            seen.add(process)
+            path.append(process)
+            resource = self.waiting.get(process)
+            process = self.holders.get(resource) if resource is not None else None
+
+        if process is None or process not in path:
+            return
+        cycle = frozenset(path[path.index(process):])
+        if all(self.cycles.get(p) == cycle for p in cycle):
+            return
+        for member in cycle:
+            self.cycles[member] = cycle
+            self._mark_incident(member, dirty)
+
+    def _break_cycle(self, process, dirty):
+        cycle = self.cycles.get(process)
+        if cycle is None:
+            return
+        for member in cycle:
+            self.cycles.pop(member, None)
+            self._mark_incident(member, dirty)
+
+    def _mark_incident(self, process, dirty):
+        dirty.add(("p", process))
+        dirty.add(("wait", process))
+        for resource, holder in self.holders.items():
+            if holder == process:
+                dirty.add(("hold", resource))
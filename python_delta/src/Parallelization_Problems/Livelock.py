@@ -1,60 +1,175 @@
 import threading
+import collections
 import time
 import json
+import sys
+
+try:
+    from . import Acquisition, Cancellation, Events
+    from .Cancellation import Cancelled
+except ImportError:
+    import Acquisition, Cancellation, Events
+    from Cancellation import Cancelled
 
 output_lock = threading.Lock()  # Zámek pro synchronizaci výstupu
 
 
 # Třída reprezentující zdroje, které budou zamykány
 class Resource:
-    def __init__(self, name):
+    def __init__(self, name, timeout_policy=None, acquisition=None):
         """
         Inicializuje objekt Resource se zadaným názvem.
 
         :param name: Název zdroje
-        :raises ValueError: Pokud název není řetězec nebo je prázdný
+        :param timeout_policy: Politika časového limitu (např. Timeouts.AdaptiveTimeout), nebo None pro 5 sekund
+        :param acquisition: Strategie zamykání (např. Acquisition.HybridAcquire), nebo None pro pokusy po 1 sekundě
+        :raises ValueError: Pokud název není řetězec nebo je prázdný, politika nemá metody timeout() a observe()
+                            nebo strategie zamykání nemá metodu acquire()
         """
         if not isinstance(name, str):
             raise ValueError("Název zdroje musí být řetězec.")
         if len(name) == 0:
             raise ValueError("Název zdroje nesmí být prázdný.")
+        if timeout_policy is not None and not (hasattr(timeout_policy, "timeout") and hasattr(timeout_policy, "observe")):
+            raise ValueError("Politika časového limitu musí mít metody timeout() a observe().")
+        if acquisition is not None and not hasattr(acquisition, "acquire"):
+            raise ValueError("Strategie zamykání musí mít metodu acquire().")
         self.name = name
         self.lock = threading.Lock()  # Zámek pro synchronizaci přístupu
+        self.timeout_policy = timeout_policy
+        self.acquisition = acquisition if acquisition is not None else Acquisition.PollingAcquire()
+        self.waiting = 0  # Počet procesů čekajících v acquire()
+        self.acquired_at = None  # Čas posledního zamčení (pro měření doby držení)
+        self._waiting_lock = threading.Lock()
 
-    def acquire(self, process_name, timeout=5):
+    def acquire(self, process_name, timeout=None, token=None):
         """
         Pokusí se zamknout zdroj v rámci zadaného časového limitu.
         Pokud zámek nelze získat včas, vyvolá výjimku.
 
         :param process_name: Název procesu, který se pokouší zdroj zamknout
-        :param timeout: Čas (v sekundách) pro pokus o zamknutí (výchozí 5 sekund)
+        :param timeout: Čas (v sekundách) pro pokus o zamknutí (výchozí podle politiky zdroje, jinak 5 sekund)
+        :param token: Token zrušení běhu (Cancellation.CancellationToken), nebo None
         :raises ValueError: Pokud název procesu není řetězec nebo je prázdný
         :raises TimeoutError: Pokud zámek nelze získat během časového limitu
+        :raises Cancelled: Pokud byl běh během čekání zrušen
         """
         if not isinstance(process_name, str):
             raise ValueError("Název procesu musí být řetězec.")
         if len(process_name) == 0:
             raise ValueError("Název procesu nesmí být prázdný.")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            acquired = self.lock.acquire(blocking=False)
-            if acquired:
-                return True
+        if timeout is None:
+            timeout = self.timeout_policy.timeout(self.waiting) if self.timeout_policy else 5
 
-            time.sleep(1)  # Pauza před dalším pokusem
+        Events.emit("wait", process_name, self.name)
+        with self._waiting_lock:
+            self.waiting += 1
+        try:
+            acquired = self.acquisition.acquire(self.lock, timeout, token)
+        finally:
+            with self._waiting_lock:
+                self.waiting -= 1
+        if acquired:
+            self.acquired_at = time.time()
+            Events.emit("acquired", process_name, self.name)
+            return True
+        Events.emit("timeout", process_name, self.name)
         raise TimeoutError(f"Timeout: Proces '{process_name}' nemohl zamknout '{self.name}'")  # Výjimka při timeoutu
 
+    def release(self, process_name=None):
+        """
+        Uvolní zámek zdroje.
+
+        :param process_name: Název procesu, který zdroj uvolňuje
+        :raises RuntimeError: Pokud zdroj není zamčen
+        """
+        Events.emit("released", process_name, self.name)
+        if self.timeout_policy is not None and self.acquired_at is not None:
+            self.timeout_policy.observe(time.time() - self.acquired_at)
+        self.acquired_at = None
+        self.lock.release()
+
+
+# Třída hlídající pokrok procesů (detekce livelocku)
+class Watchdog(threading.Thread):
+    def __init__(self, interval=0.5, window=10.0, min_changes=5):
+        """
+        Inicializuje hlídače pokroku sdíleného všemi procesy.
+
+        Hlídač v pravidelných intervalech čte u každého procesu čítač pokroku a čítač změn stavu.
+        Livelock je ohlášen, jakmile proces v klouzavém okně provedl alespoň min_changes změn stavu,
+        ale jeho pokrok se nezměnil. Procesy pouze zvyšují vlastní čítače, takže hlídač
+        do jejich zamykání a uvolňování nepřidává žádnou synchronizaci.
+
+        :param interval: Perioda vzorkování v sekundách
+        :param window: Délka klouzavého okna v sekundách
+        :param min_changes: Počet změn stavu bez pokroku, od kterého jde o livelock
+        :raises ValueError: Pokud parametry nejsou kladné nebo je okno kratší než perioda
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Perioda vzorkování musí být kladné číslo.")
+        if not isinstance(window, (int, float)) or window < interval:
+            raise ValueError("Okno musí být alespoň tak dlouhé jako perioda vzorkování.")
+        if not isinstance(min_changes, int) or min_changes < 1:
+            raise ValueError("Počet změn stavu musí být kladné celé číslo.")
+
+        threading.Thread.__init__(self, name="Watchdog", daemon=True)
+        self.interval = interval
+        self.window = window
+        self.min_changes = min_changes
+        self.processes = []
+        self.detections = {}  # Název procesu -> čas detekce od spuštění hlídače
+        self._stopped = threading.Event()
+
+    def register(self, process):
+        """
+        Přidá proces mezi hlídané.
+
+        :param process: Proces s čítači 'progress' a 'state_changes'
+        """
+        self.processes.append(process)
+
+    def stop(self):
+        """
+        Ukončí hlídání.
+        """
+        self._stopped.set()
+
+    def run(self):
+        """
+        Vzorkuje čítače hlídaných procesů, dokud není hlídač zastaven.
+        """
+        start_time = time.time()
+        history = {}
+        while not self._stopped.wait(self.interval):
+            now = time.time()
+            for process in list(self.processes):
+                if process.completed or process.livelock_detected:
+                    continue
+                samples = history.setdefault(process.name, collections.deque())
+                samples.append((now, process.progress, process.state_changes))
+                while now - samples[0][0] > self.window:
+                    samples.popleft()
+
+                _, progress, changes = samples[0]
+                if process.progress == progress and process.state_changes - changes >= self.min_changes:
+                    self.detections[process.name] = now - start_time
+                    process.livelock_detected = True
+                    Events.emit("livelock", process.name, changes=process.state_changes - changes)
+
 
 # Třída reprezentující procesy, které budou pracovat se zdroji
 class Process(threading.Thread):
-    def __init__(self, name, resource1, resource2):
+    def __init__(self, name, resource1, resource2, watchdog=None, token=None):
         """
         Inicializuje objekt Process se zadanými zdroji.
 
         :param name: Název procesu
         :param resource1: První zdroj k zamknutí
         :param resource2: Druhý zdroj k zamknutí
+        :param watchdog: Hlídač pokroku; bez něj je livelock ohlášen po třech neúspěšných pokusech
+        :param token: Token zrušení běhu (Cancellation.CancellationToken), nebo None
         :raises ValueError: Pokud název procesu není řetězec nebo zdroje nejsou instancemi třídy Resource
         """
         if not isinstance(name, str):
@@ -63,42 +178,83 @@ class Process(threading.Thread):
             raise ValueError("Název procesu nesmí být prázdný.")
         if not isinstance(resource1, Resource) or not isinstance(resource2, Resource):
             raise ValueError("Zdroje musí být instance třídy Resource.")
+        if watchdog is not None and not isinstance(watchdog, Watchdog):
+            raise ValueError("Hlídač musí být instance třídy Watchdog.")
 
         threading.Thread.__init__(self)
         self.name = name
         self.resource1 = resource1
         self.resource2 = resource2
         self.livelock_detected = False  # Stav detekce livelocku
+        self.completed = False
+        self.progress = 0  # Čítač dokončené práce
+        self.state_changes = 0  # Čítač změn stavu (pokus, zamčení, ústup)
+        self.watchdog = watchdog
+        self.token = token
+        self.held = []  # Zdroje, které proces právě drží
+        self.cancelled = False
+        if watchdog is not None:
+            watchdog.register(self)
 
     def run(self):
         """
         Spustí proces, který se pokusí zamknout oba zdroje.
-        Pokud je detekován livelock (opakované neúspěšné pokusy), bude označen.
+        Pokud je detekován livelock (opakované neúspěšné pokusy nebo hlídačem), bude označen.
+        Při zrušení běhu tokenem proces uvolní držené zdroje a okamžitě skončí.
+        """
+        try:
+            self._run()
+        except Cancelled:
+            self.cancelled = True
+            self.release_held()
+            with output_lock:
+                print(f'{self.name}: běh zrušen.')
+
+    def release_held(self):
+        """
+        Uvolní všechny zdroje, které proces drží (např. po zrušení běhu).
+        """
+        while self.held:
+            self.held.pop().release(self.name)
+
+    def _run(self):
+        """
+        Opakuje pokusy o zamknutí obou zdrojů až do dokončení nebo detekce livelocku.
         """
         attempts = 0
-        while attempts < 3:  # Pár pokusů
+        while attempts < 3 or self.watchdog is not None:  # Pár pokusů, s hlídačem až do detekce
+            if self.livelock_detected:
+                break
+            self.state_changes += 1
             with output_lock:
                 print(f'{self.name}: pokus o zamknutí {self.resource1.name}')
             try:
-                if self.resource1.acquire(self.name):  # Pokus o zamknutí prvního zdroje
+                if self.resource1.acquire(self.name, token=self.token):  # Pokus o zamknutí prvního zdroje
+                    self.held.append(self.resource1)
+                    self.state_changes += 1
                     with output_lock:
                         print(f'{self.name}: zamknul {self.resource1.name}')
 
-                    time.sleep(1)  # Simulace čekání na druhý zdroj
+                    Cancellation.sleep(1, self.token)  # Simulace čekání na druhý zdroj
 
+                    self.state_changes += 1
                     with output_lock:
                         print(f'{self.name}: pokus o zamknutí {self.resource2.name}')
                     try:
-                        if self.resource2.acquire(self.name):  # Pokus o zamknutí druhého zdroje
+                        if self.resource2.acquire(self.name, token=self.token):  # Pokus o zamknutí druhého zdroje
+                            self.held.append(self.resource2)
                             with output_lock:
                                 print(f'{self.name}: zamknul {self.resource2.name}')
+                            self.progress += 1
+                            self.completed = True
                             break  # Dokončení práce
                         else:
                             raise Exception(f"{self.name}: nepodařilo se zamknout {self.resource2.name}")
                     except TimeoutError as e:
                         with output_lock:
                             print(e)
-                        self.resource1.lock.release()  # Uvolnění prvního zdroje
+                        self.held.remove(self.resource1)
+                        self.resource1.release(self.name)  # Uvolnění prvního zdroje
             except TimeoutError as e:
                 with output_lock:
                     print(e)
@@ -107,13 +263,19 @@ class Process(threading.Thread):
                     print(f"{self.name}: Chyba: {e}")
 
             attempts += 1
-            time.sleep(0.5)  # Pauza před dalším pokusem
+            self.state_changes += 1
+            Events.emit("backoff", self.name, attempt=attempts)
+            Cancellation.sleep(0.5, self.token)  # Pauza před dalším pokusem
 
         # Detekce livelocku pouze při opakovaných neúspěšných pokusech
-        if attempts == 3:
+        if self.watchdog is None and attempts == 3:
             with output_lock:
                 print(f'{self.name}: Livelock detekován!')
+            Events.emit("livelock", self.name)
             self.livelock_detected = True  # Označení detekce livelocku
+        elif self.livelock_detected:
+            with output_lock:
+                print(f'{self.name}: Livelock detekován hlídačem pokroku!')
 
 
 def load_config(config_file):
@@ -134,41 +296,91 @@ def load_config(config_file):
         raise ValueError(f"Chyba při dekódování JSON v konfiguračním souboru '{config_file}'.")
 
 
-if __name__ == "__main__":
-    try:
-        config = load_config('../config/config.json')
+def build_processes(section, timeout_policy=None, watchdog=None, token=None, acquisition=None):
+    """
+    Vytvoří zdroje a procesy podle sekce konfigurace ve formátu 'deadlock_livelock'.
+    Chybně definované zdroje a procesy jsou vypsány a přeskočeny.
 
-        # Vytvoření resources na základě konfigurace
-        resources = {}
-        for key, value in config['deadlock_livelock']['resources'].items():
-            try:
-                resources[key] = Resource(value['name'])
-            except ValueError as e:
-                with output_lock:
-                    print(f"Chyba při vytváření zdroje '{key}': {e}")
+    :param section: Sekce konfigurace s klíči 'resources' a 'processes'
+    :param timeout_policy: Třída politiky časového limitu vytvořená pro každý zdroj, nebo None
+    :param watchdog: Hlídač pokroku sdílený všemi procesy, nebo None
+    :param token: Token zrušení běhu sdílený všemi procesy, nebo None
+    :param acquisition: Třída (továrna) strategie zamykání vytvořená pro každý zdroj, nebo None
+    :return: Seznam nespuštěných procesů
+    """
+    # Vytvoření resources na základě konfigurace
+    resources = {}
+    for key, value in section['resources'].items():
+        try:
+            resources[key] = Resource(value['name'], timeout_policy() if timeout_policy else None,
+                                      acquisition() if acquisition else None)
+        except ValueError as e:
+            with output_lock:
+                print(f"Chyba při vytváření zdroje '{key}': {e}")
 
-        # Vytvoření procesů na základě konfigurace
-        processes = []
-        for p in config['deadlock_livelock']['processes']:
-            try:
-                resource1 = resources[p['resource1']]
-                resource2 = resources[p['resource2']]
-                process = Process(p['name'], resource1, resource2)
-                processes.append(process)
-            except KeyError as e:
-                with output_lock:
-                    print(f"Chyba: Zdroj '{e}' nebyl nalezen pro proces '{p['name']}'")
-            except ValueError as e:
-                with output_lock:
-                    print(f"Chyba: {e}")
+    # Vytvoření procesů na základě konfigurace
+    processes = []
+    for p in section['processes']:
+        try:
+            resource1 = resources[p['resource1']]
+            resource2 = resources[p['resource2']]
+            process = Process(p['name'], resource1, resource2, watchdog, token)
+            processes.append(process)
+        except KeyError as e:
+            with output_lock:
+                print(f"Chyba: Zdroj '{e}' nebyl nalezen pro proces '{p['name']}'")
+        except ValueError as e:
+            with output_lock:
+                print(f"Chyba: {e}")
+    return processes
 
-        for process in processes:
-            process.start()
 
+def run_scenario(section, timeout_policy=None, watchdog=False, token=None, acquisition=None):
+    """
+    Spustí scénář livelocku a vrátí jeho výsledek.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param timeout_policy: Třída politiky časového limitu vytvořená pro každý zdroj, nebo None
+    :param watchdog: Pokud je True, livelock detekuje hlídač pokroku místo počtu pokusů
+    :param token: Token zrušení běhu, nebo None
+    :param acquisition: Třída (továrna) strategie zamykání vytvořená pro každý zdroj, nebo None
+    :return: Slovník s verdiktem, seznamem procesů s detekovaným livelockem, časy detekce a dobou běhu
+    """
+    monitor = Watchdog() if watchdog else None
+    processes = build_processes(section, timeout_policy, monitor, token, acquisition)
+
+    start_time = time.time()
+    if monitor is not None:
+        monitor.start()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    if monitor is not None:
+        monitor.stop()
+        monitor.join()
+    if token is not None and token.cancelled:
+        # Dokončené procesy drží oba zdroje i po skončení vlákna
         for process in processes:
-            process.join()
+            process.release_held()
+
+    return {
+        "livelock_detected": any(process.livelock_detected for process in processes),
+        "processes": len(processes),
+        "livelocked": [process.name for process in processes if process.livelock_detected],
+        "detections": monitor.detections if monitor is not None else {},
+        "elapsed": time.time() - start_time,
+    }
+
+
+if __name__ == "__main__":
+    try:
+        config = load_config('../config/config.json')
+
+        # Volitelný argument 'watchdog' zapne detekci livelocku hlídačem pokroku
+        result = run_scenario(config['deadlock_livelock'], watchdog=len(sys.argv) > 1 and sys.argv[1] == "watchdog")
 
-        if any(process.livelock_detected for process in processes):
+        if result["livelock_detected"]:
             with output_lock:
                 print(
                     "\nLIVELOCK DETEKOVÁN: Oba procesy se pokoušely získat zdroje, opakovaně je uvolňovaly a zkoušely znovu bez pokroku.")
@@ -0,0 +1,402 @@
+import bisect
+import contextlib
+import http.server
+import os
+import sys
+import tempfile
+import threading
+
+try:
+    from . import Events
+except ImportError:
+    import Events
+
+PREFIX = "parallelization"  # Předpona názvů metrik
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0)  # Horní meze histogramu doby čekání (s)
+VERDICTS = ("deadlock", "livelock", "starved")
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"  # Textový formát Prometheus
+SNAPSHOT_INTERVAL = 5.0  # Perioda zápisu snímku do souboru v sekundách
+
+
+class _Shard:
+    __slots__ = ("acquired", "timeouts", "blocked", "buckets", "wait_sum", "pending", "verdicts", "restarts",
+                 "backoffs")
+
+    def __init__(self):
+        self.acquired = {}  # Prostředek -> počet získání
+        self.timeouts = {}  # Prostředek -> počet vypršení čekání
+        self.blocked = {}  # Prostředek -> počet právě čekajících vláken tohoto shardu
+        self.buckets = {}  # Prostředek -> počty čekání v intervalech histogramu (poslední je +Inf)
+        self.wait_sum = {}  # Prostředek -> součet dob čekání
+        self.pending = {}  # (proces, prostředek) -> čas začátku čekání
+        self.verdicts = dict.fromkeys(VERDICTS, 0)
+        self.restarts = 0
+        self.backoffs = 0
+
+
+class MetricsCollector:
+    def __init__(self, buckets=BUCKETS):
+        """
+        Inicializuje sběrač metrik z událostí simulace (posluchač pro Events.subscribe).
+
+        Každé vlákno simulace zapisuje pouze do vlastního shardu, takže zpracování události nepotřebuje
+        zámek a nesoupeří s ostatními vlákny ani se čtením. Čtení (snapshot) sloučí kopie slovníků všech
+        shardů; kopie slovníku proběhne pod GIL atomicky, čtenář proto vidí konzistentní, nejvýše o jednu
+        událost starý stav každého shardu. Zámek se bere jen při prvním zápisu nového vlákna a při čtení.
+        Shard skončeného vlákna čtení přičte k souhrnu a odebere, takže počet shardů neroste s počtem
+        vláken (např. s novým fondem pracovních vláken pro každý běh).
+
+        :param buckets: Rostoucí horní meze intervalů histogramu doby čekání v sekundách
+        :raises ValueError: Pokud meze nejsou kladné a rostoucí
+        """
+        if not buckets or any(b <= 0 for b in buckets) or list(buckets) != sorted(set(buckets)):
+            raise ValueError("Meze histogramu musí být kladné a rostoucí.")
+        self.bucket_bounds = tuple(buckets)
+        self.holders = {}  # Prostředek -> proces, který jej drží (jednotlivé zápisy jsou atomické)
+        self._local = threading.local()
+        self._shards = ()  # Dvojice (vlákno, shard); n-tice se při změně nahrazuje celá
+        self._retired = _Shard()  # Součet shardů skončených vláken (bez čekajících, vlákno už nečeká)
+        self._shards_lock = threading.Lock()
+
+    def __call__(self, event):
+        """
+        Započítá jednu událost simulace (viz Events.emit).
+
+        :param event: Událost ve formátu slovníku
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+
+        kind = event["kind"]
+        resource = event.get("resource")
+        if kind == "wait":
+            shard.pending[(event["process"], resource)] = event["ts"]
+            shard.blocked[resource] = shard.blocked.get(resource, 0) + 1
+        elif kind == "acquired":
+            start = shard.pending.pop((event["process"], resource), None)
+            if start is not None:
+                shard.blocked[resource] -= 1
+                self._observe(shard, resource, event["ts"] - start)
+            shard.acquired[resource] = shard.acquired.get(resource, 0) + 1
+            self.holders[resource] = event["process"]
+        elif kind == "timeout":
+            if shard.pending.pop((event["process"], resource), None) is not None:
+                shard.blocked[resource] -= 1
+            shard.timeouts[resource] = shard.timeouts.get(resource, 0) + 1
+        elif kind == "released":
+            self.holders.pop(resource, None)
+        elif kind in shard.verdicts:
+            shard.verdicts[kind] += 1
+        elif kind == "restart":
+            shard.restarts += 1
+            # Proces opustil rozpracované čekání (wait-die, wound-wait) bez události timeout
+            for key in [key for key in shard.pending if key[0] == event["process"]]:
+                del shard.pending[key]
+                shard.blocked[key[1]] -= 1
+        elif kind == "backoff":
+            shard.backoffs += 1
+
+    def _new_shard(self):
+        """
+        Vytvoří shard pro volající vlákno a zaregistruje jej pro čtení.
+        """
+        shard = _Shard()
+        self._local.shard = shard
+        with self._shards_lock:
+            self._shards = self._shards + ((threading.current_thread(), shard),)
+        return shard
+
+    def _retire_finished(self):
+        """
+        Přičte shardy skončených vláken k souhrnu a odebere je (volá se pod zámkem shardů).
+        Skončené vlákno už do shardu nezapisuje, takže sloučení nesoupeří se zápisem.
+        """
+        live = tuple(entry for entry in self._shards if entry[0].is_alive())
+        if len(live) == len(self._shards):
+            return
+        retired = self._retired
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                continue
+            for target, source in ((retired.acquired, shard.acquired), (retired.timeouts, shard.timeouts),
+                                   (retired.wait_sum, shard.wait_sum)):
+                for resource, value in source.items():
+                    target[resource] = target.get(resource, 0) + value
+            for resource, counts in shard.buckets.items():
+                total = retired.buckets.setdefault(resource, [0] * len(counts))
+                for index, value in enumerate(counts):
+                    total[index] += value
+            for kind, value in shard.verdicts.items():
+                retired.verdicts[kind] += value
+            retired.restarts += shard.restarts
+            retired.backoffs += shard.backoffs
+        self._shards = live
+
+    def _observe(self, shard, resource, wait):
+        """
+        Započítá dobu čekání do histogramu prostředku.
+        """
+        counts = shard.buckets.get(resource)
+        if counts is None:
+            counts = shard.buckets[resource] = [0] * (len(self.bucket_bounds) + 1)
+        counts[bisect.bisect_left(self.bucket_bounds, wait)] += 1
+        shard.wait_sum[resource] = shard.wait_sum.get(resource, 0.0) + wait
+
+    def snapshot(self):
+        """
+        Sloučí shardy všech vláken do jednoho stavu.
+
+        :return: Slovník s klíči 'acquired', 'timeouts', 'blocked', 'histograms' (prostředek -> kumulativní
+                 počty, součet a počet), 'holders', 'verdicts', 'restarts' a 'backoffs'
+        """
+        acquired, timeouts, blocked, histograms = {}, {}, {}, {}
+        verdicts = dict.fromkeys(VERDICTS, 0)
+        restarts = backoffs = 0
+        # Zámek brání tomu, aby souběžná čtení (server a zápis snímku) započetla skončené vlákno dvakrát
+        with self._shards_lock:
+            self._retire_finished()
+            shards = (self._retired,) + tuple(shard for _, shard in self._shards)
+            for shard in shards:
+                for target, source in ((acquired, shard.acquired), (timeouts, shard.timeouts),
+                                       (blocked, shard.blocked)):
+                    for resource, value in source.copy().items():
+                        target[resource] = target.get(resource, 0) + value
+                wait_sum = shard.wait_sum.copy()
+                for resource, counts in shard.buckets.copy().items():
+                    histogram = histograms.setdefault(
+                        resource, {"counts": [0] * len(counts), "sum": 0.0, "count": 0})
+                    for index, value in enumerate(counts[:]):
+                        histogram["counts"][index] += value
+                    histogram["sum"] += wait_sum.get(resource, 0.0)
+                for kind, value in shard.verdicts.copy().items():
+                    verdicts[kind] += value
+                restarts += shard.restarts
+                backoffs += shard.backoffs
+
+        for histogram in histograms.values():
+            total = 0
+            for index, value in enumerate(histogram["counts"]):
+                total += value
+                histogram["counts"][index] = total  # Prometheus vyžaduje kumulativní počty
+            histogram["count"] = total
+        return {
+            "acquired": acquired,
+            "timeouts": timeouts,
+            "blocked": blocked,
+            "histograms": histograms,
+            "holders": self.holders.copy(),
+            "verdicts": verdicts,
+            "restarts": restarts,
+            "backoffs": backoffs,
+        }
+
+    def render(self):
+        """
+        Vrátí metriky v textovém formátu Prometheus.
+
+        :return: Text metrik
+        """
+        state = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+                lines.append(f"{PREFIX}_{name}{suffix}{{{label_text}}} {_number(value)}" if label_text
+                             else f"{PREFIX}_{name}{suffix} {_number(value)}")
+
+        metric("acquire_total", "counter", "Počet získání prostředku.",
+               [("", [("resource", r)], v) for r, v in sorted(state["acquired"].items(), key=_key)])
+        metric("timeout_total", "counter", "Počet vypršení čekání na prostředek.",
+               [("", [("resource", r)], v) for r, v in sorted(state["timeouts"].items(), key=_key)])
+        metric("blocked_threads", "gauge", "Počet vláken právě čekajících na prostředek.",
+               [("", [("resource", r)], v) for r, v in sorted(state["blocked"].items(), key=_key)])
+        metric("holder", "gauge", "Proces, který prostředek právě drží (hodnota 1).",
+               [("", [("resource", r), ("process", p)], 1) for r, p in sorted(state["holders"].items(), key=_key)])
+
+        samples = []
+        for resource, histogram in sorted(state["histograms"].items(), key=_key):
+            bounds = [_number(b) for b in self.bucket_bounds] + ["+Inf"]
+            for bound, count in zip(bounds, histogram["counts"]):
+                samples.append(("_bucket", [("resource", resource), ("le", bound)], count))
+            samples.append(("_sum", [("resource", resource)], histogram["sum"]))
+            samples.append(("_count", [("resource", resource)], histogram["count"]))
+        metric("wait_seconds", "histogram", "Doba čekání na získání prostředku v sekundách.", samples)
+
+        metric("verdict_total", "counter", "Počet verdiktů simulací (deadlock, livelock, vyhladovění).",
+               [("", [("kind", kind)], value) for kind, value in state["verdicts"].items()])
+        metric("restart_total", "counter", "Počet restartů procesů (wait-die, wound-wait).",
+               [("", [], state["restarts"])])
+        metric("backoff_total", "counter", "Počet ústupů procesů (livelock).", [("", [], state["backoffs"])])
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path):
+        """
+        Atomicky zapíše metriky v textovém formátu Prometheus do souboru
+        (vhodné např. pro textfile collector node_exporteru).
+
+        :param path: Cesta k souboru
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def _escape(value):
+    """
+    Escapuje hodnotu štítku podle textového formátu Prometheus.
+    """
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value):
+    """
+    Převede číslo na text; celá čísla bez desetinné části.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _key(item):
+    """
+    Klíč řazení, který snese i prostředek None.
+    """
+    return str(item[0])
+
+
+class MetricsServer:
+    def __init__(self, collector, host="127.0.0.1", port=0):
+        """
+        Inicializuje lokální HTTP server, který na cestě /metrics vrací metriky ve formátu Prometheus.
+        Server běží v samostatném vlákně a metriky čte pouze ze snímku sběrače, takže simulaci nezdržuje.
+
+        :param collector: Instance MetricsCollector
+        :param host: Adresa, na které server naslouchá (výchozí pouze místní počítač)
+        :param port: Port, nebo 0 pro libovolný volný port
+        """
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = collector.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Standardní výstup patří výsledkům simulace
+
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="MetricsServer", daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        """
+        Spustí obsluhu požadavků.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Zastaví server a uvolní port.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+
+class SnapshotWriter(threading.Thread):
+    def __init__(self, collector, path, interval=SNAPSHOT_INTERVAL):
+        """
+        Inicializuje vlákno, které periodicky zapisuje metriky do souboru.
+
+        :param collector: Instance MetricsCollector
+        :param path: Cesta k souboru
+        :param interval: Perioda zápisu v sekundách
+        :raises ValueError: Pokud perioda není kladné číslo
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Perioda zápisu musí být kladné číslo.")
+        threading.Thread.__init__(self, name="SnapshotWriter", daemon=True)
+        self.collector = collector
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        """
+        Zapisuje snímek, dokud není vlákno zastaveno.
+        """
+        while not self._stopped.wait(self.interval):
+            self.collector.write_snapshot(self.path)
+
+    def stop(self):
+        """
+        Zastaví vlákno a zapíše poslední snímek.
+        """
+        self._stopped.set()
+        self.join()
+        self.collector.write_snapshot(self.path)
+
+
+@contextlib.contextmanager
+def exporting(port=None, path=None, interval=SNAPSHOT_INTERVAL, host="127.0.0.1"):
+    """
+    Po dobu bloku sbírá metriky z událostí simulace a zpřístupní je přes HTTP, do souboru, nebo obojí.
+
+    :param port: Port HTTP serveru (0 = libovolný volný), nebo None bez serveru
+    :param path: Cesta k souboru se snímkem, nebo None bez souboru
+    :param interval: Perioda zápisu snímku v sekundách
+    :param host: Adresa HTTP serveru
+    :return: Dvojice (MetricsCollector, MetricsServer nebo None)
+    """
+    collector = MetricsCollector()
+    server = MetricsServer(collector, host, port) if port is not None else None
+    writer = SnapshotWriter(collector, path, interval) if path is not None else None
+    Events.subscribe(collector)
+    if server is not None:
+        server.start()
+    if writer is not None:
+        writer.start()
+    try:
+        yield collector, server
+    finally:
+        Events.unsubscribe(collector)
+        if writer is not None:
+            writer.stop()
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    try:
+        try:
+            from . import Deadlock
+        except ImportError:
+            import Deadlock
+
+        config = Deadlock.load_config('../config/config.json')
+        port = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+        with exporting(port=port) as (collector, server):
+            print(f"Metriky: {server.url}")
+            Deadlock.run_scenario(config['deadlock_livelock'], strategy="wound-wait", hold_time=0.5)
+            print(collector.render())
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,340 @@
+import contextlib
+import math
+import os
+import json
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy je volitelná závislost potřebná jen pro tento modul
+    np = None
+
+try:
+    from . import Deadlock
+    from .Timeouts import FixedTimeout
+except ImportError:
+    import Deadlock
+    from Timeouts import FixedTimeout
+
+CHUNK_SIZE = 250_000  # Počet vzorků zpracovaných najednou (omezuje paměť)
+Z_95 = 1.959963984540054  # Kvantil normálního rozdělení pro 95% interval spolehlivosti
+
+# Fáze procesu ve vektorové simulaci
+_FIRST, _SECOND, _FINISH = 0, 1, 2
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Monte Carlo odhad vyžaduje knihovnu NumPy (pip install numpy).")
+
+
+def wilson_interval(successes, trials, z=Z_95):
+    """
+    Vrátí Wilsonův interval spolehlivosti pro pravděpodobnost úspěchu.
+    Na rozdíl od normální aproximace dává smysluplné meze i pro pravděpodobnosti blízké 0 a 1.
+
+    :param successes: Počet úspěchů
+    :param trials: Počet pokusů
+    :param z: Kvantil normálního rozdělení
+    :return: Dvojice (dolní mez, horní mez)
+    :raises ValueError: Pokud počty nejsou v povoleném rozsahu
+    """
+    if trials <= 0 or not 0 <= successes <= trials:
+        raise ValueError("Musí platit 0 <= successes <= trials a trials > 0.")
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def simulate(first, second, start, hold):
+    """
+    Pro každý vzorek rozhodne, zda sada procesů skončí v deadlocku.
+
+    Model odpovídá procesu Deadlock.Process se strategií 'timeout' a release_on_finish=True:
+    proces v čase start zamkne první prostředek, po době hold požádá o druhý a po jeho získání
+    oba uvolní. Zamčený prostředek dostane při uvolnění ten čekající, který o něj požádal nejdříve.
+    Všechny vzorky se simulují současně: v každém kroku se v každém vzorku zpracuje nejbližší
+    událost, takže kroků je nejvýše 3 * počet procesů. Deadlock nastal právě tehdy, když se simulace
+    zastaví a některý proces nedokončil (čekající procesy pak tvoří cyklus).
+
+    :param first: Indexy prvních prostředků, pole tvaru (vzorky, procesy)
+    :param second: Indexy druhých prostředků, pole tvaru (vzorky, procesy)
+    :param start: Časy startu procesů, pole tvaru (vzorky, procesy)
+    :param hold: Doby mezi zamčením prvního a žádostí o druhý prostředek, pole tvaru (vzorky, procesy)
+    :return: Pole typu bool tvaru (vzorky,)
+    :raises ImportError: Pokud není nainstalována knihovna NumPy
+    """
+    _require_numpy()
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    hold = np.asarray(hold, dtype=np.float64)
+    samples, processes = first.shape
+    resources = int(max(first.max(), second.max())) + 1
+
+    owner = np.full((samples, resources), -1, dtype=np.int64)
+    phase = np.zeros((samples, processes), dtype=np.int8)
+    next_time = np.array(start, dtype=np.float64, copy=True)
+    waiting_for = np.full((samples, processes), -1, dtype=np.int64)
+    requested_at = np.full((samples, processes), np.inf)
+    done = np.zeros((samples, processes), dtype=bool)
+    rows = np.arange(samples)
+
+    def advance(s, i, t):
+        # Získání prvního prostředku -> žádost o druhý po době hold; získání druhého -> dokončení
+        current = phase[s, i]
+        next_time[s, i] = np.where(current == _FIRST, t + hold[s, i], t)
+        phase[s, i] = current + 1
+
+    def grant(s, resource, t):
+        # Předá uvolněný prostředek nejdříve čekajícímu procesu
+        score = np.where(waiting_for[s] == resource[:, None], requested_at[s], np.inf)
+        waiter = score.argmin(axis=1)
+        found = np.isfinite(score[np.arange(len(s)), waiter])
+        s, waiter, resource, t = s[found], waiter[found], resource[found], t[found]
+        owner[s, resource] = waiter
+        waiting_for[s, waiter] = -1
+        requested_at[s, waiter] = np.inf
+        advance(s, waiter, t)
+
+    while True:
+        process = next_time.argmin(axis=1)
+        now = next_time[rows, process]
+        active = np.isfinite(now)
+        if not active.any():
+            break
+        s, i, t = rows[active], process[active], now[active]
+        current = phase[s, i]
+
+        request = current != _FINISH
+        if request.any():
+            rs, ri, rt = s[request], i[request], t[request]
+            resource = np.where(current[request] == _FIRST, first[rs, ri], second[rs, ri])
+            free = owner[rs, resource] == -1
+            owner[rs[free], resource[free]] = ri[free]
+            advance(rs[free], ri[free], rt[free])
+            blocked = ~free
+            waiting_for[rs[blocked], ri[blocked]] = resource[blocked]
+            requested_at[rs[blocked], ri[blocked]] = rt[blocked]
+            next_time[rs[blocked], ri[blocked]] = np.inf
+
+        finish = ~request
+        if finish.any():
+            fs, fi, ft = s[finish], i[finish], t[finish]
+            done[fs, fi] = True
+            next_time[fs, fi] = np.inf
+            for resource in (second[fs, fi], first[fs, fi]):
+                owner[fs, resource] = -1
+                grant(fs, resource, ft)
+
+    return ~done.all(axis=1)
+
+
+def draw_timings(rng, samples, processes, hold=1.0, hold_spread=0.5, jitter=1.0):
+    """
+    Vylosuje časy startu a doby držení.
+
+    :param rng: Generátor numpy.random.Generator
+    :param samples: Počet vzorků
+    :param processes: Počet procesů
+    :param hold: Střední doba držení prvního prostředku v sekundách
+    :param hold_spread: Relativní rozptyl doby držení (doba je rovnoměrně v hold * (1 ± hold_spread))
+    :param jitter: Rozptyl časů startu v sekundách (start je rovnoměrně v [0, jitter])
+    :return: Dvojice polí (start, hold) tvaru (vzorky, procesy)
+    :raises ValueError: Pokud jsou parametry mimo povolený rozsah
+    """
+    if hold < 0 or not 0 <= hold_spread <= 1 or jitter < 0:
+        raise ValueError("Musí platit hold >= 0, 0 <= hold_spread <= 1 a jitter >= 0.")
+    size = (samples, processes)
+    start = rng.uniform(0.0, jitter, size) if jitter > 0 else np.zeros(size)
+    holds = rng.uniform(hold * (1 - hold_spread), hold * (1 + hold_spread), size)
+    return start, holds
+
+
+def section_arrays(section):
+    """
+    Převede sekci konfigurace ve formátu 'deadlock_livelock' na indexy prostředků.
+
+    :param section: Sekce konfigurace s klíči 'resources' a 'processes'
+    :return: Trojice (názvy procesů, pole prvních prostředků, pole druhých prostředků)
+    :raises KeyError: Pokud v konfiguraci chybí povinná pole
+    :raises ValueError: Pokud proces odkazuje na neexistující prostředek nebo sekce nemá procesy
+    """
+    if 'resources' not in section or 'processes' not in section:
+        raise KeyError("Chybí 'resources' nebo 'processes' v sekci 'deadlock_livelock' v konfiguraci.")
+    if not section['processes']:
+        raise ValueError("Sekce konfigurace neobsahuje žádné procesy.")
+    index = {key: position for position, key in enumerate(section['resources'])}
+    names, first, second = [], [], []
+    for p in section['processes']:
+        if 'name' not in p or 'resource1' not in p or 'resource2' not in p:
+            raise KeyError("Chybí povinná pole pro proces: 'name', 'resource1' nebo 'resource2'.")
+        if p['resource1'] not in index or p['resource2'] not in index:
+            raise ValueError(f"Prostředky pro proces '{p['name']}' nejsou správně definovány.")
+        names.append(p['name'])
+        first.append(index[p['resource1']])
+        second.append(index[p['resource2']])
+    return names, np.array(first), np.array(second)
+
+
+def _estimate(draw, samples, chunk_size):
+    """
+    Spočítá deadlocky ve vzorcích losovaných po dávkách funkcí draw(počet).
+    """
+    if not isinstance(samples, int) or samples < 1:
+        raise ValueError("Počet vzorků musí být kladné celé číslo.")
+    start_time = time.time()
+    deadlocks = 0
+    remaining = samples
+    while remaining:
+        size = min(chunk_size, remaining)
+        deadlocks += int(simulate(*draw(size)).sum())
+        remaining -= size
+    low, high = wilson_interval(deadlocks, samples)
+    return {
+        "samples": samples,
+        "deadlocks": deadlocks,
+        "probability": deadlocks / samples,
+        "ci_low": low,
+        "ci_high": high,
+        "elapsed": time.time() - start_time,
+    }
+
+
+def estimate(section, samples=1_000_000, hold=1.0, hold_spread=0.5, jitter=1.0, random_order=True,
+             seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Odhadne pravděpodobnost deadlocku sady procesů z konfigurace při náhodném časování.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param samples: Počet vzorků
+    :param hold: Střední doba držení prvního prostředku v sekundách
+    :param hold_spread: Relativní rozptyl doby držení
+    :param jitter: Rozptyl časů startu v sekundách
+    :param random_order: Pokud je True, každý proces v každém vzorku zamyká své prostředky v náhodném pořadí
+    :param seed: Semínko generátoru náhodných čísel
+    :param chunk_size: Počet vzorků zpracovaných najednou
+    :return: Slovník s pravděpodobností deadlocku a 95% intervalem spolehlivosti
+    :raises ImportError: Pokud není nainstalována knihovna NumPy
+    """
+    _require_numpy()
+    names, first, second = section_arrays(section)
+    rng = np.random.default_rng(seed)
+
+    def draw(size):
+        firsts = np.broadcast_to(first, (size, len(names)))
+        seconds = np.broadcast_to(second, (size, len(names)))
+        if random_order:
+            swap = rng.random((size, len(names))) < 0.5
+            firsts, seconds = np.where(swap, seconds, firsts), np.where(swap, firsts, seconds)
+        return (firsts, seconds) + draw_timings(rng, size, len(names), hold, hold_spread, jitter)
+
+    result = _estimate(draw, samples, chunk_size)
+    result.update({"processes": len(names), "hold": hold, "jitter": jitter, "random_order": random_order})
+    return result
+
+
+def sweep(process_counts=(2, 3, 4, 6, 8), jitters=(0.0, 0.5, 1.0, 2.0, 4.0), samples=200_000, hold=1.0,
+          hold_spread=0.5, resources=None, seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Odhadne pravděpodobnost deadlocku v závislosti na počtu procesů a rozptylu časů startu.
+    Každý proces v každém vzorku zamyká dva různé náhodně zvolené prostředky v náhodném pořadí.
+
+    :param process_counts: Počty procesů
+    :param jitters: Rozptyly časů startu v sekundách
+    :param samples: Počet vzorků pro každou kombinaci
+    :param hold: Střední doba držení prvního prostředku v sekundách
+    :param hold_spread: Relativní rozptyl doby držení
+    :param resources: Počet prostředků (výchozí stejný jako počet procesů, alespoň 2)
+    :param seed: Semínko generátoru náhodných čísel
+    :param chunk_size: Počet vzorků zpracovaných najednou
+    :return: Seznam výsledků s klíči 'processes', 'resources', 'jitter' a metrikami z estimate
+    :raises ImportError: Pokud není nainstalována knihovna NumPy
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    results = []
+    for processes in process_counts:
+        count = max(2, resources or processes)
+        for jitter in jitters:
+            def draw(size):
+                firsts = rng.integers(0, count, (size, processes))
+                seconds = (firsts + rng.integers(1, count, (size, processes))) % count
+                return (firsts, seconds) + draw_timings(rng, size, processes, hold, hold_spread, jitter)
+
+            result = _estimate(draw, samples, chunk_size)
+            result.update({"processes": processes, "resources": count, "jitter": jitter, "hold": hold})
+            results.append(result)
+    return results
+
+
+def validate(section, samples=10, hold=0.2, hold_spread=0.5, jitter=0.4, timeout=1.5, seed=None):
+    """
+    Porovná vektorovou simulaci s vláknovými procesy Deadlock.Process na stejných vylosovaných časech.
+    Vláknové procesy používají strategii 'timeout' s release_on_finish=True; deadlock detekují
+    vypršením časového limitu, který musí být výrazně delší než doby držení.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock' (malá, běh trvá sekundy na vzorek)
+    :param samples: Počet porovnaných vzorků
+    :param hold: Střední doba držení prvního prostředku v sekundách
+    :param hold_spread: Relativní rozptyl doby držení
+    :param jitter: Rozptyl časů startu v sekundách
+    :param timeout: Časový limit vláknových procesů v sekundách
+    :param seed: Semínko generátoru náhodných čísel
+    :return: Slovník s počtem vzorků, mírou shody a seznamem neshod
+    :raises ImportError: Pokud není nainstalována knihovna NumPy
+    """
+    _require_numpy()
+    names, first, second = section_arrays(section)
+    rng = np.random.default_rng(seed)
+    starts, holds = draw_timings(rng, samples, len(names), hold, hold_spread, jitter)
+    predicted = simulate(np.broadcast_to(first, starts.shape), np.broadcast_to(second, starts.shape), starts, holds)
+
+    mismatches = []
+    for sample in range(samples):
+        threaded = run_threaded(section, starts[sample].tolist(), holds[sample].tolist(), timeout)
+        if threaded != bool(predicted[sample]):
+            mismatches.append({"sample": sample, "predicted": bool(predicted[sample]), "threaded": threaded,
+                               "start": starts[sample].tolist(), "hold": holds[sample].tolist()})
+    return {"samples": samples, "agreement": 1 - len(mismatches) / samples, "mismatches": mismatches}
+
+
+def run_threaded(section, starts, holds, timeout=1.5):
+    """
+    Spustí procesy z konfigurace jako vlákna se zadanými časy startu a dobami držení.
+
+    :param section: Sekce konfigurace ve formátu 'deadlock_livelock'
+    :param starts: Časy startu procesů v sekundách
+    :param holds: Doby držení prvního prostředku v sekundách
+    :param timeout: Časový limit čekání na prostředek v sekundách
+    :return: True, pokud některý proces detekoval deadlock
+    """
+    resources = {key: Deadlock.Resource(value['name'], FixedTimeout(timeout))
+                 for key, value in section['resources'].items()}
+    processes = [Deadlock.Process(p['name'], resources[p['resource1']], resources[p['resource2']],
+                                  hold_time=hold, start_delay=start, release_on_finish=True)
+                 for p, start, hold in zip(section['processes'], starts, holds)]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    return any(process.deadlock_detected for process in processes)
+
+
+if __name__ == "__main__":
+    try:
+        samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+        print(f"{'Procesy':>8}{'Jitter (s)':>12}{'P(deadlock)':>14}{'95% interval':>22}{'Čas (s)':>10}")
+        for r in sweep(samples=samples, seed=1):
+            interval = f"[{r['ci_low']:.4f}, {r['ci_high']:.4f}]"
+            print(f"{r['processes']:>8}{r['jitter']:>12}{r['probability']:>14.4f}{interval:>22}{r['elapsed']:>10.2f}")
+
+        with open('../config/config.json', 'r') as f:
+            config = json.load(f)
+        check = validate(config['deadlock_livelock'], seed=1)
+        print(f"\nShoda s vláknovou simulací (deadlock_livelock): {check['agreement']:.0%} z {check['samples']} vzorků")
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,227 @@
+import contextlib
+import linecache
+import os
+import re
+import sys
+import threading
+import time
+
+SAMPLE_INTERVAL = 0.01  # Výchozí perioda vzorkování v sekundách (100 Hz)
+STATES = ("running", "runnable", "sleep", "lock_wait", "output_wait")
+BLOCKING_CALL = re.compile(r"\.(acquire|wait|join)\(|\bsleep\(|^\s*with\s")  # Řádek, na kterém vlákno může čekat
+
+
+def thread_cpu_time(ident):
+    """
+    Vrátí spotřebovaný procesorový čas vlákna.
+
+    :param ident: Identifikátor vlákna (threading.Thread.ident)
+    :return: Procesorový čas v sekundách, nebo None, pokud platforma hodiny vláken neposkytuje
+             (např. Windows) nebo vlákno již skončilo
+    """
+    if not hasattr(time, "pthread_getcpuclockid"):
+        return None
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (OSError, OverflowError):
+        return None
+
+
+def classify(frame):
+    """
+    Určí, na co vlákno čeká, podle jeho nejvnitřnějšího rámce zásobníku.
+
+    Řádek se zámkem výstupu (output_lock) znamená čekání na výstup. Řádek s blokujícím voláním
+    (acquire, wait, join, sleep, příkaz with) znamená čekání na zámek, pokud je na zásobníku nějaká
+    funkce acquire (např. Resource.acquire, i když uvnitř strategie zamykání spí), jinak spánek,
+    pokud je volání nebo některá funkce na zásobníku sleep nebo Event.wait (periodické čekání hlídače),
+    a jinak opět čekání na synchronizační primitivum.
+    Ostatní řádky jsou kód Pythonu, který může běžet, jakmile vlákno získá GIL.
+
+    :param frame: Nejvnitřnější rámec vlákna (z sys._current_frames())
+    :return: 'output_wait', 'lock_wait', 'sleep' nebo 'runnable'
+    """
+    line = linecache.getline(frame.f_code.co_filename, frame.f_lineno)
+    if "output_lock" in line:
+        return "output_wait"
+    call = BLOCKING_CALL.search(line)
+    if call is None:
+        return "runnable"
+    names = []
+    while frame is not None:
+        names.append(getattr(frame.f_code, "co_qualname", frame.f_code.co_name))
+        frame = frame.f_back
+    if any(name.rpartition(".")[2] == "acquire" for name in names):
+        return "lock_wait"
+    if "sleep(" in call.group() or "Event.wait" in names or any(name.rpartition(".")[2] == "sleep" for name in names):
+        return "sleep"
+    return "lock_wait"
+
+
+def stack_names(frame):
+    """
+    Vrátí zásobník vlákna od nejvnějšího rámce jako seznam názvů 'Modul.funkce'.
+    Zaváděcí rámce modulu threading (Thread._bootstrap, Thread.run) se vynechají.
+
+    :param frame: Nejvnitřnější rámec vlákna
+    :return: Seznam názvů rámců
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        names.append(f"{module}.{getattr(code, 'co_qualname', code.co_name)}")
+        frame = frame.f_back
+    names.reverse()
+    while names and names[0].startswith("threading."):
+        names.pop(0)
+    return names
+
+
+class Profiler(threading.Thread):
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        """
+        Inicializuje vzorkovací profiler vláken simulace.
+
+        Profiler s danou periodou čte zásobníky všech vláken (sys._current_frames()) a jejich procesorový
+        čas (hodiny vláken). Čas mezi dvěma vzorky rozdělí takto: spotřebovaný procesorový čas je 'running',
+        zbytek připadne stavu podle zásobníku (viz classify). Vlákno, které nečeká na zámek ani nespí,
+        a přesto neběželo, čekalo na GIL ('runnable'). Bez hodin vláken se takový čas počítá jako 'running'.
+
+        Vzorkují se všechna vlákna kromě samotného profileru, tedy i vlákno, které profiler vytvořilo
+        (u generátoru zátěže v něm běží generování příchodů).
+
+        :param interval: Perioda vzorkování v sekundách
+        :raises ValueError: Pokud perioda není kladné číslo
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Perioda vzorkování musí být kladné číslo.")
+        threading.Thread.__init__(self, name="Profiler", daemon=True)
+        self.interval = interval
+        self.samples = 0  # Počet provedených vzorkování
+        self.stacks = {}  # (vlákno, rámce..., [stav]) -> doba v sekundách
+        self.totals = {}  # Název vlákna -> stav -> doba v sekundách
+        self._last = {}  # Identifikátor vlákna -> (čas vzorku, procesorový čas)
+        self._stopped = threading.Event()
+
+    def run(self):
+        """
+        Vzorkuje vlákna, dokud není profiler zastaven.
+        """
+        self.sample()
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        """
+        Zastaví vzorkování a započítá úsek od posledního vzorku.
+        """
+        self._stopped.set()
+        self.join()
+        self.sample()
+
+    def sample(self):
+        """
+        Provede jedno vzorkování všech sledovaných vláken.
+        """
+        frames = sys._current_frames()
+        now = time.perf_counter()
+        for thread in threading.enumerate():
+            ident = thread.ident
+            if ident == self.ident or ident not in frames:
+                continue
+            cpu = thread_cpu_time(ident)
+            previous = self._last.get(ident)
+            self._last[ident] = (now, cpu)
+            if previous is None:
+                continue  # První vzorek vlákna jen určí výchozí čas
+
+            elapsed = now - previous[0]
+            if cpu is None or previous[1] is None:
+                running = elapsed
+            else:
+                running = min(max(cpu - previous[1], 0.0), elapsed)
+            frame = frames[ident]
+            stack = (thread.name.replace(";", ":"),) + tuple(stack_names(frame))
+            self._add(stack, "running", running)
+            self._add(stack, classify(frame), elapsed - running)
+        self.samples += 1
+
+    def _add(self, stack, state, seconds):
+        """
+        Připočte dobu ke stavu vlákna a k jeho zásobníku.
+        """
+        if seconds <= 0:
+            return
+        key = stack + (f"[{state}]",)
+        self.stacks[key] = self.stacks.get(key, 0.0) + seconds
+        states = self.totals.setdefault(stack[0], dict.fromkeys(STATES, 0.0))
+        states[state] += seconds
+
+    def collapsed(self):
+        """
+        Vrátí profil ve formátu collapsed stacks (vstup pro flamegraph.pl, speedscope nebo inferno).
+        Každý řádek obsahuje rámce oddělené středníkem (vlákno, funkce, stav) a dobu v mikrosekundách.
+
+        :return: Seznam řádků seřazený podle zásobníku
+        """
+        lines = []
+        for stack, seconds in sorted(self.stacks.items()):
+            weight = round(seconds * 1_000_000)
+            if weight > 0:
+                lines.append(f"{';'.join(stack)} {weight}")
+        return lines
+
+    def write_collapsed(self, path):
+        """
+        Zapíše profil ve formátu collapsed stacks do souboru.
+
+        :param path: Cesta k souboru
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+    def summary(self):
+        """
+        :return: Slovník název vlákna -> stav -> doba v sekundách (zaokrouhleno na mikrosekundy)
+        """
+        return {name: {state: round(seconds, 6) for state, seconds in states.items()}
+                for name, states in sorted(self.totals.items())}
+
+
+@contextlib.contextmanager
+def profiling(path=None, interval=SAMPLE_INTERVAL):
+    """
+    Po dobu bloku vzorkuje vlákna simulace a na konci zapíše profil ve formátu collapsed stacks.
+
+    :param path: Cesta k souboru s profilem, nebo None bez zápisu
+    :param interval: Perioda vzorkování v sekundách
+    :return: Instance Profiler (po skončení bloku obsahuje celý profil)
+    """
+    profiler = Profiler(interval)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        if path is not None:
+            profiler.write_collapsed(path)
+
+
+if __name__ == "__main__":
+    try:
+        try:
+            from . import Deadlock
+        except ImportError:
+            import Deadlock
+
+        config = Deadlock.load_config('../config/config.json')
+        path = sys.argv[1] if len(sys.argv) > 1 else "deadlock.folded"
+        with profiling(path) as profiler:
+            Deadlock.run_scenario(config['deadlock_livelock'], strategy="timeout", hold_time=0.5)
+        for name, states in profiler.summary().items():
+            print(name, states)
+        print(f"Profil zapsán do {path} ({profiler.samples} vzorků)")
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,266 @@
+import concurrent.futures
+import contextlib
+import os
+import random
+import sys
+import time
+
+try:
+    from . import Deadlock, Livelock, Starvation
+except ImportError:
+    import Deadlock, Livelock, Starvation
+
+# Scénáře, jejichž procesy se ovlivňují pouze přes sdílené prostředky. Inverze priorit sdílí
+# procesor a zátěžový generátor jediný prostředek, proto je rozdělit nelze.
+SCENARIOS = {
+    "deadlock": Deadlock.run_scenario,
+    "livelock": Livelock.run_scenario,
+    "starvation": Starvation.run_scenario,
+}
+RESOURCE_KEYS = ("resource1", "resource2", "resource")  # Odkazy procesu na prostředky
+
+
+class UnionFind:
+    def __init__(self):
+        """
+        Inicializuje strukturu disjunktních množin se zkracováním cest a spojováním podle velikosti.
+        """
+        self.parent = {}
+        self.size = {}
+
+    def find(self, item):
+        """
+        Vrátí zástupce množiny, do které prvek patří. Neznámý prvek tvoří vlastní množinu.
+
+        :param item: Prvek
+        :return: Zástupce množiny
+        """
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+            return item
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a, b):
+        """
+        Spojí množiny prvků a a b.
+
+        :param a: První prvek
+        :param b: Druhý prvek
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+
+def partition(section):
+    """
+    Rozdělí sekci konfigurace na nezávislé části (shardy): procesy ve dvou různých částech
+    nikdy nesdílí prostředek. Komponenty souvislosti grafu procesů a prostředků se hledají
+    pomocí union-find nad odkazy 'resource1', 'resource2' a 'resource'.
+
+    Části zachovávají pořadí procesů z konfigurace. Prostředky, které žádný proces nepoužívá,
+    se vynechají; ostatní klíče sekce se zkopírují do každé části.
+
+    :param section: Sekce konfigurace s klíči 'resources' a 'processes'
+    :return: Seznam sekcí konfigurace, jedna pro každou komponentu
+    :raises KeyError: Pokud v konfiguraci chybí povinná pole
+    """
+    if 'resources' not in section or 'processes' not in section:
+        raise KeyError("Chybí 'resources' nebo 'processes' v sekci konfigurace.")
+
+    components = UnionFind()
+    references = []
+    for index, process in enumerate(section['processes']):
+        refs = [process[key] for key in RESOURCE_KEYS if key in process]
+        # Proces bez odkazů na prostředky tvoří vlastní část
+        node = ("resource", refs[0]) if refs else ("process", index)
+        for ref in refs[1:]:
+            components.union(node, ("resource", ref))
+        references.append((node, refs))
+
+    shards = {}
+    for process, (node, refs) in zip(section['processes'], references):
+        root = components.find(node)
+        if root not in shards:
+            shard = {key: value for key, value in section.items() if key not in ('resources', 'processes')}
+            shard['resources'] = {}
+            shard['processes'] = []
+            shards[root] = shard
+        shard = shards[root]
+        shard['processes'].append(process)
+        for ref in refs:
+            if ref in section['resources']:
+                shard['resources'][ref] = section['resources'][ref]
+    return list(shards.values())
+
+
+def balance(shards, workers):
+    """
+    Rozdělí části mezi pracovní procesy tak, aby měly co nejpodobnější počet procesů simulace
+    (největší části se přidělují jako první pracovnímu procesu s nejmenší zátěží). Části jednoho
+    pracovního procesu se sloučí do jedné sekce a běží souběžně, jako by nebyly rozdělené.
+
+    :param shards: Seznam sekcí z partition
+    :param workers: Počet pracovních procesů
+    :return: Seznam nejvýše workers neprázdných sekcí
+    """
+    batches = [[] for _ in range(min(workers, len(shards)))]
+    loads = [0] * len(batches)
+    for shard in sorted(shards, key=lambda shard: len(shard['processes']), reverse=True):
+        index = loads.index(min(loads))
+        batches[index].append(shard)
+        loads[index] += len(shard['processes'])
+
+    merged = []
+    for batch in batches:
+        section = {key: value for key, value in batch[0].items() if key not in ('resources', 'processes')}
+        section['resources'] = {}
+        section['processes'] = []
+        for shard in batch:
+            section['resources'].update(shard['resources'])
+            section['processes'].extend(shard['processes'])
+        merged.append(section)
+    return merged
+
+
+def run_sharded(scenario, section, workers=None, verbose=False, **options):
+    """
+    Rozdělí scénář na nezávislé části, rozloží je mezi pracovní procesy
+    a výsledky sloučí do jednoho výsledku ve stejném tvaru jako run_scenario.
+
+    Události simulace (Events) zůstávají v pracovních procesech; časovou osu ani průběžné
+    události proto sharding neposkytuje.
+
+    :param scenario: Název scénáře ('deadlock', 'livelock' nebo 'starvation')
+    :param section: Sekce konfigurace scénáře
+    :param workers: Počet pracovních procesů (výchozí počet jader)
+    :param verbose: Pokud je True, výpisy simulace jdou na standardní chybový výstup, jinak se zahodí
+    :param options: Další argumenty pro run_scenario daného scénáře
+    :return: Sloučený výsledek s klíči 'shards', 'workers' a 'worker_elapsed' navíc
+    :raises ValueError: Pokud scénář nelze rozdělit nebo počet procesů není kladný
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Scénář '{scenario}' nelze rozdělit na nezávislé části.")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("Počet pracovních procesů musí být kladné celé číslo.")
+
+    shards = partition(section)
+    batches = balance(shards, workers or os.cpu_count() or 1)
+    start_time = time.time()
+    if not batches:
+        results = []
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(batches)) as executor:
+            futures = [executor.submit(_run_shard, scenario, batch, verbose, options) for batch in batches]
+            results = [future.result() for future in futures]
+    elapsed = time.time() - start_time
+
+    merged = merge_results(scenario, results, elapsed)
+    merged["shards"] = len(shards)
+    merged["workers"] = len(batches)
+    merged["worker_elapsed"] = [result["elapsed"] for result in results]
+    return merged
+
+
+def _run_shard(scenario, shard, verbose, options):
+    """
+    Spustí části přidělené jednomu pracovnímu procesu.
+    """
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(sys.stderr if verbose else devnull):
+            return SCENARIOS[scenario](shard, **options)
+
+
+def merge_results(scenario, results, elapsed):
+    """
+    Sloučí výsledky pracovních procesů. Verdikt platí, pokud nastal v kterékoli části;
+    počty se sčítají a poměrové metriky se přepočítají z celkových počtů a doby běhu.
+
+    :param scenario: Název scénáře
+    :param results: Výsledky run_scenario pracovních procesů
+    :param elapsed: Celková doba běhu v sekundách
+    :return: Sloučený výsledek
+    """
+    processes = sum(result["processes"] for result in results)
+    if scenario == "deadlock":
+        completed = sum(result["completed"] for result in results)
+        restarts = sum(result["restarts"] for result in results)
+        aborts = sum(result["aborts"] for result in results)
+        return {
+            "strategy": results[0]["strategy"] if results else None,
+            "deadlock_detected": any(result["deadlock_detected"] for result in results),
+            "processes": processes,
+            "completed": completed,
+            "restarts": restarts,
+            "aborts": aborts,
+            "abort_rate": aborts / (aborts + completed) if aborts + completed else 0.0,
+            "throughput": completed / elapsed if elapsed > 0 else 0.0,
+            "elapsed": elapsed,
+        }
+    if scenario == "livelock":
+        detections = {}
+        for result in results:
+            detections.update(result["detections"])
+        return {
+            "livelock_detected": any(result["livelock_detected"] for result in results),
+            "processes": processes,
+            "livelocked": [name for result in results for name in result["livelocked"]],
+            "detections": detections,
+            "elapsed": elapsed,
+        }
+    starved = [name for result in results for name in result["starved"]]
+    return {
+        "starvation_detected": bool(starved),
+        "processes": processes,
+        "starved": starved,
+        "elapsed": elapsed,
+    }
+
+
+def generate_section(groups, processes_per_group=4, resources_per_group=3, seed=None):
+    """
+    Vygeneruje velký scénář ve formátu 'deadlock_livelock' složený z nezávislých skupin.
+    Každý proces zamyká dva různé náhodné prostředky své skupiny.
+
+    :param groups: Počet nezávislých skupin
+    :param processes_per_group: Počet procesů ve skupině
+    :param resources_per_group: Počet prostředků ve skupině (alespoň 2)
+    :param seed: Semínko generátoru náhodných čísel
+    :return: Sekce konfigurace
+    :raises ValueError: Pokud jsou parametry mimo povolený rozsah
+    """
+    if groups < 1 or processes_per_group < 1 or resources_per_group < 2:
+        raise ValueError("Skupin a procesů musí být alespoň 1 a prostředků ve skupině alespoň 2.")
+
+    rng = random.Random(seed)
+    section = {"resources": {}, "processes": []}
+    for group in range(groups):
+        keys = [f"g{group}_r{index}" for index in range(resources_per_group)]
+        for key in keys:
+            section["resources"][key] = {"name": f"Resource {key}"}
+        for index in range(processes_per_group):
+            resource1, resource2 = rng.sample(keys, 2)
+            section["processes"].append({"name": f"Process g{group}_{index}",
+                                         "resource1": resource1, "resource2": resource2})
+    return section
+
+
+if __name__ == "__main__":
+    try:
+        groups = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+        section = generate_section(groups, seed=1)
+        print(f"Skupin: {groups}, procesů: {len(section['processes'])}, částí: {len(partition(section))}")
+        for workers in sorted({1, os.cpu_count() or 1}):
+            result = run_sharded("deadlock", section, workers=workers, strategy="wound-wait", hold_time=0.05)
+            print(f"Pracovních procesů: {workers:>3}, doba běhu: {result['elapsed']:.2f} s, "
+                  f"dokončeno: {result['completed']}, deadlock: {result['deadlock_detected']}")
+    except Exception as e:
+        print(f"CHYBA: {e}")
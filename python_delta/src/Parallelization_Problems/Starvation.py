@@ -1,9 +1,23 @@
 import threading
 import time
 import json
+import sys
+
+try:
+    from . import Cancellation, Events
+    from .Cancellation import Cancelled
+except ImportError:
+    import Cancellation, Events
+    from Cancellation import Cancelled
 
 output_lock = threading.Lock()  # Synchronizační zámek pro výstup
 
+# Protokoly řešení inverze priorit:
+#   none        - držitel zdroje běží se svou vlastní prioritou
+#   inheritance - držitel zdědí prioritu nejprioritnějšího čekajícího procesu
+#   ceiling     - držitel po dobu držení běží s prioritou stropu zdroje
+PROTOCOLS = ("none", "inheritance", "ceiling")
+
 
 def load_config(config_file):
     """
@@ -35,58 +49,343 @@ def load_config(config_file):
 
 
 class Resource:
-    def __init__(self, name):
+    def __init__(self, name, protocol="none", ceiling=None, timeout_policy=None):
         """
         Inicializuje zdroj se specifikovaným názvem.
 
         Argumenty:
             name (str): Název zdroje.
+            protocol (str): Protokol řešení inverze priorit ('none', 'inheritance' nebo 'ceiling').
+            ceiling (int): Prioritní strop zdroje (nejvyšší priorita jeho uživatelů), povinný pro 'ceiling'.
+            timeout_policy: Politika časového limitu (např. Timeouts.AdaptiveTimeout), nebo None pro 5 sekund.
 
         Výjimky:
-            ValueError: Pokud název zdroje není neprázdný řetězec.
+            ValueError: Pokud název zdroje není neprázdný řetězec, je protokol či strop neplatný
+                nebo politika nemá metody timeout() a observe().
         """
         if not isinstance(name, str):
             raise ValueError("Název zdroje musí být řetězec.")
         if not name.strip():
             raise ValueError("Název zdroje nesmí být prázdný nebo pouze mezery.")
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Neznámý protokol '{protocol}'. Podporované: {', '.join(PROTOCOLS)}.")
+        if protocol == "ceiling" and (not isinstance(ceiling, int) or ceiling < 1):
+            raise ValueError("Protokol 'ceiling' vyžaduje strop ve formě kladného celého čísla.")
+        if timeout_policy is not None and not (hasattr(timeout_policy, "timeout") and hasattr(timeout_policy, "observe")):
+            raise ValueError("Politika časového limitu musí mít metody timeout() a observe().")
 
         self.name = name
         self.lock = threading.Lock()
-
-    def acquire(self, process_name):
+        self.protocol = protocol
+        self.ceiling = ceiling
+        self.holder = None  # Proces, který zdroj drží (pouze pro acquire_as/release_as)
+        self.waiters = []  # Procesy zablokované na zdroji
+        self._state = threading.Condition()
+        self.timeout_policy = timeout_policy
+        self.waiting = 0  # Počet procesů čekajících v acquire()
+        self.acquired_at = None  # Čas posledního zamčení (pro měření doby držení)
+        self._waiting_lock = threading.Lock()
+
+    def acquire(self, process_name, timeout=None, token=None):
         """
         Uzamkne zdroj, pokud je zámek dostupný.
 
         Argumenty:
             process_name (str): Název procesu, který se pokouší zdroj uzamknout.
+            timeout (float): Časový limit v sekundách (výchozí podle politiky zdroje, jinak 5 sekund).
+            token (CancellationToken): Token zrušení běhu, nebo None.
 
         Výjimky:
             ValueError: Pokud název procesu není neprázdný řetězec.
+            TimeoutError: Pokud se zdroj nepodaří uzamknout během časového limitu.
             Exception: Pokud při uzamykání zdroje nastane chyba.
+            Cancelled: Pokud byl běh během čekání zrušen.
         """
         try:
             if not isinstance(process_name, str) or not process_name.strip():
                 raise ValueError(f"Název procesu musí být neprázdný řetězec. Zadané: {process_name}")
 
-            self.lock.acquire(timeout=5)
+            if timeout is None:
+                timeout = self.timeout_policy.timeout(self.waiting) if self.timeout_policy else 5
+
+            Events.emit("wait", process_name, self.name)
+            with self._waiting_lock:
+                self.waiting += 1
+            try:
+                acquired = Cancellation.acquire(self.lock, timeout, token)
+            finally:
+                with self._waiting_lock:
+                    self.waiting -= 1
+            if acquired:
+                self.acquired_at = time.time()
+                Events.emit("acquired", process_name, self.name)
+            else:
+                Events.emit("timeout", process_name, self.name)
+                raise TimeoutError(f"{process_name}: vypršel časový limit při uzamykání zdroje '{self.name}'.")
+        except TimeoutError:
+            raise
         except Exception as e:
             raise Exception(f"Chyba při uzamykání zdroje '{self.name}' procesem '{process_name}': {e}")
 
-    def release(self):
+    def release(self, process_name=None):
         """
         Uvolní zámek zdroje.
 
+        Argumenty:
+            process_name (str): Název procesu, který zdroj uvolňuje.
+
         Výjimky:
             RuntimeError: Pokud zámek není aktuálně uzamčen.
         """
         try:
+            if self.lock.locked():
+                Events.emit("released", process_name, self.name)
+                if self.timeout_policy is not None and self.acquired_at is not None:
+                    self.timeout_policy.observe(time.time() - self.acquired_at)
+            self.acquired_at = None
             self.lock.release()
         except RuntimeError:
             raise RuntimeError(f"Pokusu o uvolnění zámku zdroje '{self.name}' se nezdařilo, zámek není uzamčen.")
 
+    def acquire_as(self, process):
+        """
+        Uzamkne zdroj pro proces podle zvoleného protokolu inverze priorit.
+        Čeká bez časového limitu; uvolněný zdroj dostane čekající proces s nejvyšší efektivní prioritou.
+
+        Argumenty:
+            process (InversionProcess): Proces, který se pokouší zdroj uzamknout.
+
+        Výjimky:
+            Cancelled: Pokud byl běh procesu během čekání zrušen.
+        """
+        Events.emit("wait", process.name, self.name)
+        unregister = process.token.on_cancel(self._wake) if process.token is not None else None
+        with self._state:
+            self.waiters.append(process)
+            try:
+                while self.holder is not None or self._next_waiter() is not process:
+                    Cancellation.check(process.token)
+                    if self.protocol == "inheritance" and self.holder is not None:
+                        self.holder.boost(process.effective_priority)
+                    self._state.wait()
+                Cancellation.check(process.token)
+            finally:
+                self.waiters.remove(process)
+                if unregister is not None:
+                    unregister()
+
+            self.lock.acquire()
+            self.holder = process
+            Events.emit("acquired", process.name, self.name)
+            if self.protocol == "ceiling":
+                process.boost(self.ceiling)
+
+    def release_as(self, process):
+        """
+        Uvolní zdroj držený procesem a vrátí procesu jeho základní prioritu.
+
+        Argumenty:
+            process (InversionProcess): Proces, který zdroj drží.
+
+        Výjimky:
+            RuntimeError: Pokud proces zdroj nedrží.
+        """
+        with self._state:
+            if self.holder is not process:
+                raise RuntimeError(f"Proces '{process.name}' nedrží zdroj '{self.name}'.")
+            Events.emit("released", process.name, self.name)
+            self.holder = None
+            self.lock.release()
+            process.restore_priority()
+            self._state.notify_all()
+
+    def _wake(self):
+        """
+        Probudí procesy čekající na zdroj, aby zaznamenaly zrušení běhu.
+        """
+        with self._state:
+            self._state.notify_all()
+
+    def _next_waiter(self):
+        """
+        Vrátí čekající proces s nejvyšší efektivní prioritou (při shodě ten, který čeká nejdéle).
+        """
+        return min(self.waiters, key=lambda p: p.effective_priority) if self.waiters else None
+
+
+class CPU:
+    def __init__(self, quantum=0.01):
+        """
+        Inicializuje simulovaný jednoprocesorový plánovač s preemptivním prioritním plánováním.
+        V každém kvantu běží připravený proces s nejvyšší efektivní prioritou.
+
+        Argumenty:
+            quantum (float): Délka časového kvanta v sekundách.
+
+        Výjimky:
+            ValueError: Pokud kvantum není kladné číslo.
+        """
+        if not isinstance(quantum, (int, float)) or quantum <= 0:
+            raise ValueError("Kvantum musí být kladné číslo.")
+
+        self.quantum = quantum
+        self.ready = []  # Procesy připravené k běhu v pořadí příchodu
+        self.condition = threading.Condition()
+
+    def execute(self, process, duration):
+        """
+        Provede na procesoru práci procesu v délce duration sekund.
+        Proces běží pouze tehdy, když je připraveným procesem s nejvyšší efektivní prioritou.
+
+        Argumenty:
+            process (InversionProcess): Proces, který chce běžet.
+            duration (float): Délka práce v sekundách.
+
+        Výjimky:
+            Cancelled: Pokud byl běh procesu zrušen.
+        """
+        token = process.token
+        remaining = duration
+        unregister = token.on_cancel(self.reschedule) if token is not None else None
+        with self.condition:
+            self.ready.append(process)
+        try:
+            while remaining > 0:
+                with self.condition:
+                    self.condition.wait_for(lambda: self._running() is process or (token is not None and token.cancelled))
+                step = min(self.quantum, remaining)
+                Cancellation.sleep(step, token)
+                remaining -= step
+        finally:
+            if unregister is not None:
+                unregister()
+            with self.condition:
+                self.ready.remove(process)
+                self.condition.notify_all()
+
+    def reschedule(self):
+        """
+        Probudí čekající procesy, aby znovu vyhodnotily, kdo má běžet (např. po změně priority).
+        """
+        with self.condition:
+            self.condition.notify_all()
+
+    def _running(self):
+        """
+        Vrátí připravený proces s nejvyšší efektivní prioritou (při shodě ten, který přišel dříve).
+        """
+        return min(self.ready, key=lambda p: p.effective_priority) if self.ready else None
+
+
+class InversionProcess(threading.Thread):
+    def __init__(self, name, cpu, priority, resource=None, start=0.0, work=0.0, critical=0.0, token=None):
+        """
+        Inicializuje proces scénáře inverze priorit.
+        Proces po startu provede práci bez zdroje (work) a poté, pokud má zdroj,
+        jej uzamkne a provede kritickou sekci (critical).
+
+        Argumenty:
+            name (str): Název procesu.
+            cpu (CPU): Simulovaný procesor, o který procesy soutěží.
+            priority (int): Základní priorita procesu (nižší hodnota znamená vyšší prioritu).
+            resource (Resource): Zdroj používaný v kritické sekci, nebo None.
+            start (float): Zpoždění startu procesu v sekundách.
+            work (float): Délka práce bez zdroje v sekundách.
+            critical (float): Délka kritické sekce v sekundách.
+            token (CancellationToken): Token zrušení běhu, nebo None.
+
+        Výjimky:
+            ValueError: Pokud je některý z parametrů neplatný.
+        """
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Název procesu musí být neprázdný řetězec.")
+        if not isinstance(cpu, CPU):
+            raise ValueError("Procesor musí být instancí třídy CPU.")
+        if not isinstance(priority, int) or priority < 1:
+            raise ValueError("Priorita musí být kladné celé číslo.")
+        if resource is not None and not isinstance(resource, Resource):
+            raise ValueError("Zdroj musí být instancí třídy Resource.")
+        for value in (start, work, critical):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise ValueError("Časy procesu musí být nezáporná čísla.")
+
+        threading.Thread.__init__(self)
+
+        self.name = name
+        self.cpu = cpu
+        self.priority = priority
+        self.effective_priority = priority
+        self.resource = resource
+        self.start_delay = start
+        self.work = work
+        self.critical = critical
+        self.wait_time = 0.0  # Doba čekání na zdroj v sekundách
+        self.token = token
+        self.cancelled = False
+
+    def boost(self, priority):
+        """
+        Zvýší efektivní prioritu procesu, pokud je zadaná priorita vyšší (menší číslo).
+
+        Argumenty:
+            priority (int): Požadovaná efektivní priorita.
+        """
+        if priority < self.effective_priority:
+            self.effective_priority = priority
+            with output_lock:
+                print(f'{self.name}: priorita zvýšena na {priority}')
+            self.cpu.reschedule()
+
+    def restore_priority(self):
+        """
+        Vrátí procesu jeho základní prioritu.
+        """
+        if self.effective_priority != self.priority:
+            self.effective_priority = self.priority
+            self.cpu.reschedule()
+
+    def run(self):
+        """
+        Spustí proces: počká na start, provede práci a kritickou sekci nad zdrojem.
+        Při zrušení běhu tokenem proces uvolní zdroj, pokud jej drží, a okamžitě skončí.
+        """
+        try:
+            self._run()
+        except Cancelled:
+            self.cancelled = True
+            if self.resource is not None and self.resource.holder is self:
+                self.resource.release_as(self)
+            with output_lock:
+                print(f'{self.name}: běh zrušen')
+
+    def _run(self):
+        """
+        Provede práci a kritickou sekci procesu.
+        """
+        Cancellation.sleep(self.start_delay, self.token)
+        with output_lock:
+            print(f'{self.name} (priorita {self.priority}): start')
+
+        if self.work:
+            self.cpu.execute(self, self.work)
+
+        if self.resource is not None:
+            start_time = time.time()
+            self.resource.acquire_as(self)
+            self.wait_time = time.time() - start_time
+            with output_lock:
+                print(f'{self.name}: uzamkl {self.resource.name} (čekal {self.wait_time:.2f} s)')
+            self.cpu.execute(self, self.critical)
+            self.resource.release_as(self)
+            with output_lock:
+                print(f'{self.name}: uvolnil {self.resource.name}')
+
+        with output_lock:
+            print(f'{self.name}: dokončil práci')
+
 
 class Process(threading.Thread):
-    def __init__(self, name, resource, priority=1):
+    def __init__(self, name, resource, priority=1, token=None):
         """
         Inicializuje proces se zadaným názvem, přidruženým zdrojem a prioritou.
 
@@ -94,6 +393,7 @@ class Process(threading.Thread):
             name (str): Název procesu.
             resource (Resource): Zdroj, který se proces pokusí uzamknout.
             priority (int): Priorita procesu (nižší hodnota znamená vyšší prioritu).
+            token (CancellationToken): Token zrušení běhu, nebo None.
 
         Výjimky:
             ValueError: Pokud je název procesu, zdroj nebo priorita neplatná.
@@ -112,12 +412,35 @@ class Process(threading.Thread):
         self.priority = priority
         self.starved = False
         self.attempts = 0
+        self.token = token
+        self.held = []  # Zdroje, které proces právě drží
+        self.cancelled = False
 
     def run(self):
         """
         Spustí proces, který se pokouší uzamknout zdroj až čtyřikrát.
 
         Pokud proces nemůže zdroj uzamknout kvůli vyhladovění, přestane se pokoušet.
+        Při zrušení běhu tokenem proces uvolní držený zdroj a okamžitě skončí.
+        """
+        try:
+            self._run()
+        except Cancelled:
+            self.cancelled = True
+            self.release_held()
+            with output_lock:
+                print(f'{self.name}: běh zrušen')
+
+    def release_held(self):
+        """
+        Uvolní zdroje, které proces drží (např. po zrušení běhu).
+        """
+        while self.held:
+            self.held.pop().release(self.name)
+
+    def _run(self):
+        """
+        Opakuje pokusy o uzamknutí zdroje a vyhodnotí vyhladovění.
         """
         try:
             while self.attempts < 4:
@@ -129,16 +452,25 @@ class Process(threading.Thread):
 
                 try:
                     if self.priority == 1:
-                        self.resource.acquire(self.name)
+                        try:
+                            self.resource.acquire(self.name, token=self.token)
+                        except TimeoutError as e:
+                            # Zdroj drží jiný proces; pokus se započítá a zdroj se neuvolňuje
+                            with output_lock:
+                                print(e)
+                            self.attempts += 1
+                            continue
+                        self.held.append(self.resource)
 
                         with output_lock:
                             print(f'{self.name}: uzamkl {self.resource.name}')
-                        time.sleep(3)
-                        self.resource.release()
+                        Cancellation.sleep(3, self.token)
+                        self.held.remove(self.resource)
+                        self.resource.release(self.name)
                         with output_lock:
                             print(f'{self.name}: uvolnil {self.resource.name}')
                     else:
-                        time.sleep(2)
+                        Cancellation.sleep(2, self.token)
 
                     self.attempts += 1
 
@@ -150,6 +482,7 @@ class Process(threading.Thread):
             if self.attempts >= 4 and self.priority > 1:
                 with output_lock:
                     print(f'{self.name}: byl vyhladován (nemožnost uzamknout zdroj).')
+                Events.emit("starved", self.name)
                 self.starved = True
             else:
                 self.starved = False
@@ -159,42 +492,178 @@ class Process(threading.Thread):
             self.starved = True
 
 
-if __name__ == "__main__":
-    try:
-        config = load_config('../config/config.json')
+def build_processes(section, timeout_policy=None, token=None):
+    """
+    Vytvoří zdroje a procesy podle sekce 'starvation' konfigurace.
 
-        if "starvation" not in config:
-            raise KeyError("V konfiguraci chybí sekce 'starvation'.")
+    Argumenty:
+        section (dict): Sekce 'starvation' s klíči 'resources' a 'processes'.
+        timeout_policy: Třída politiky časového limitu vytvořená pro každý zdroj, nebo None.
+        token (CancellationToken): Token zrušení běhu sdílený všemi procesy, nebo None.
+
+    Návratová hodnota:
+        list: Seznam nespuštěných procesů.
+
+    Výjimky:
+        KeyError: Pokud v konfiguraci chybí povinná pole.
+        ValueError: Pokud proces odkazuje na neexistující zdroj.
+    """
+    # Vytvoření resources na základě konfigurace
+    resources = {}
+    for resource_name, resource_config in section["resources"].items():
+        if "name" not in resource_config:
+            raise KeyError(f"Zdroj '{resource_name}' postrádá v konfiguraci 'name'.")
+        resources[resource_name] = Resource(resource_config["name"],
+                                            timeout_policy=timeout_policy() if timeout_policy else None)
+
+    # Vytvoření procesů na základě konfigurace
+    processes = []
+    for process_config in section["processes"]:
+        if "name" not in process_config or "resource" not in process_config or "priority" not in process_config:
+            raise KeyError("Konfigurace procesu musí obsahovat 'name', 'resource' a 'priority'.")
+        process_name = process_config["name"]
+        resource_name = process_config["resource"]
+        priority = process_config["priority"]
+
+        if resource_name not in resources:
+            raise ValueError(f"Zdroj '{resource_name}' nebyl nalezen pro proces '{process_name}'.")
+
+        process = Process(process_name, resources[resource_name], priority, token)
+        processes.append(process)
+    return processes
+
+
+def run_scenario(section, timeout_policy=None, token=None):
+    """
+    Spustí scénář vyhladovění a vrátí jeho výsledek.
+
+    Argumenty:
+        section (dict): Sekce 'starvation' s klíči 'resources' a 'processes'.
+        timeout_policy: Třída politiky časového limitu vytvořená pro každý zdroj, nebo None.
+        token (CancellationToken): Token zrušení běhu, nebo None.
 
-        # Vytvoření resources na základě konfigurace
-        resources = {}
-        for resource_name, resource_config in config["starvation"]["resources"].items():
-            if "name" not in resource_config:
-                raise KeyError(f"Zdroj '{resource_name}' postrádá v konfiguraci 'name'.")
-            resources[resource_name] = Resource(resource_config["name"])
+    Návratová hodnota:
+        dict: Verdikt, seznam vyhladovělých procesů a doba běhu.
+    """
+    processes = build_processes(section, timeout_policy, token)
 
-        # Vytvoření procesů na základě konfigurace
-        processes = []
-        for process_config in config["starvation"]["processes"]:
-            if "name" not in process_config or "resource" not in process_config or "priority" not in process_config:
-                raise KeyError("Konfigurace procesu musí obsahovat 'name', 'resource' a 'priority'.")
-            process_name = process_config["name"]
-            resource_name = process_config["resource"]
-            priority = process_config["priority"]
+    start_time = time.time()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
 
-            if resource_name not in resources:
-                raise ValueError(f"Zdroj '{resource_name}' nebyl nalezen pro proces '{process_name}'.")
+    starved = [process.name for process in processes if process.starved]
+    return {
+        "starvation_detected": bool(starved),
+        "processes": len(processes),
+        "starved": starved,
+        "elapsed": time.time() - start_time,
+    }
 
-            process = Process(process_name, resources[resource_name], priority)
-            processes.append(process)
 
-        for process in processes:
-            process.start()
+def run_inversion(section, protocol="none", token=None):
+    """
+    Spustí scénář inverze priorit ze sekce 'starvation' konfigurace.
 
-        for process in processes:
-            process.join()
+    Argumenty:
+        section (dict): Sekce 'starvation' s klíči 'resources' a 'inversion'.
+        protocol (str): Protokol řešení inverze priorit pro všechny zdroje.
+        token (CancellationToken): Token zrušení běhu sdílený všemi procesy, nebo None.
+
+    Návratová hodnota:
+        dict: Doby čekání na zdroj podle názvů procesů.
+
+    Výjimky:
+        KeyError: Pokud v konfiguraci chybí povinná pole.
+        ValueError: Pokud proces odkazuje na neexistující zdroj.
+    """
+    if "inversion" not in section or "processes" not in section["inversion"]:
+        raise KeyError("V sekci 'starvation' chybí 'inversion' se seznamem 'processes'.")
+    process_configs = section["inversion"]["processes"]
+
+    resources = {}
+    for resource_name, resource_config in section["resources"].items():
+        if "name" not in resource_config:
+            raise KeyError(f"Zdroj '{resource_name}' postrádá v konfiguraci 'name'.")
+        # Strop zdroje je nejvyšší priorita procesu, který jej používá
+        users = [p["priority"] for p in process_configs if p.get("resource") == resource_name]
+        resources[resource_name] = Resource(resource_config["name"], protocol, min(users) if users else 1)
+
+    cpu = CPU()
+    processes = []
+    for process_config in process_configs:
+        if "name" not in process_config or "priority" not in process_config:
+            raise KeyError("Konfigurace procesu musí obsahovat 'name' a 'priority'.")
+        resource_name = process_config.get("resource")
+        if resource_name is not None and resource_name not in resources:
+            raise ValueError(f"Zdroj '{resource_name}' nebyl nalezen pro proces '{process_config['name']}'.")
+        processes.append(InversionProcess(
+            process_config["name"], cpu, process_config["priority"],
+            resources.get(resource_name),
+            process_config.get("start", 0.0), process_config.get("work", 0.0), process_config.get("critical", 0.0),
+            token))
+
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    return {process.name: process.wait_time for process in processes}
+
+
+def compare_protocols(section, protocols=PROTOCOLS, repeats=1, token=None):
+    """
+    Porovná nejhorší dobu čekání procesů s nejvyšší prioritou pro zadané protokoly.
+    Po zrušení běhu tokenem se další protokoly nespouští.
+
+    Argumenty:
+        section (dict): Sekce 'starvation' s klíči 'resources' a 'inversion'.
+        protocols (tuple): Protokoly, které se mají porovnat.
+        repeats (int): Počet opakování scénáře pro každý protokol.
+        token (CancellationToken): Token zrušení běhu, nebo None.
+
+    Návratová hodnota:
+        list: Slovníky s klíči 'protocol', 'worst_wait' a 'reduction' (zkrácení oproti prvnímu protokolu).
+    """
+    top_priority = min(p["priority"] for p in section["inversion"]["processes"] if p.get("resource"))
+    top_names = {p["name"] for p in section["inversion"]["processes"]
+                 if p.get("resource") and p["priority"] == top_priority}
+
+    results = []
+    for protocol in protocols:
+        worst = 0.0
+        for _ in range(repeats):
+            waits = run_inversion(section, protocol, token)
+            worst = max([worst] + [waits[name] for name in top_names])
+        results.append({"protocol": protocol, "worst_wait": worst})
+        if token is not None and token.cancelled:
+            break
+
+    baseline = results[0]["worst_wait"]
+    for result in results:
+        result["reduction"] = 1 - result["worst_wait"] / baseline if baseline > 0 else 0.0
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        config = load_config('../config/config.json')
+
+        if "starvation" not in config:
+            raise KeyError("V konfiguraci chybí sekce 'starvation'.")
+
+        # Volitelný argument 'inversion' spustí porovnání protokolů inverze priorit
+        if len(sys.argv) > 1 and sys.argv[1] == "inversion":
+            results = compare_protocols(config["starvation"])
+            with output_lock:
+                print(f"\n{'Protokol':<14}{'Nejhorší čekání (s)':>22}{'Zkrácení':>10}")
+                for r in results:
+                    print(f"{r['protocol']:<14}{r['worst_wait']:>22.2f}{r['reduction']:>10.0%}")
+            sys.exit(0)
 
-        starving_processes = [process.name for process in processes if process.starved]
+        result = run_scenario(config["starvation"])
+        starving_processes = result["starved"]
 
         if starving_processes:
             with output_lock:
@@ -0,0 +1,180 @@
+import math
+import random
+import sys
+import threading
+
+try:
+    from .Workload import sample_service_time
+except ImportError:
+    from Workload import sample_service_time
+
+DEFAULT_TIMEOUT = 5  # Původní pevný časový limit v sekundách
+
+
+class FixedTimeout:
+    def __init__(self, seconds=DEFAULT_TIMEOUT):
+        """
+        Inicializuje pevný časový limit (původní chování simulací).
+
+        :param seconds: Časový limit v sekundách
+        :raises ValueError: Pokud časový limit není kladné číslo
+        """
+        if not isinstance(seconds, (int, float)) or seconds <= 0:
+            raise ValueError("Časový limit musí být kladné číslo.")
+        self.seconds = seconds
+
+    def timeout(self, waiters=0):
+        """
+        Vrátí časový limit pro nového čekajícího.
+
+        :param waiters: Počet procesů, které již na prostředek čekají
+        :return: Časový limit v sekundách
+        """
+        return self.seconds
+
+    def observe(self, hold_time):
+        """
+        Pevný limit se z pozorování neučí.
+
+        :param hold_time: Doba držení prostředku v sekundách
+        """
+
+
+class AdaptiveTimeout:
+    def __init__(self, alpha=0.2, k=4.0, minimum=0.05, maximum=30.0, initial=DEFAULT_TIMEOUT, warmup=3):
+        """
+        Inicializuje adaptivní časový limit odvozený z nedávných dob držení prostředku.
+
+        Udržuje exponenciálně vážený klouzavý průměr (EWMA) a rozptyl dob držení.
+        Čekající dostane limit (waiters + 1) * (průměr + k * směrodatná odchylka),
+        protože před ním může být ještě držitel a všichni dříve čekající.
+
+        :param alpha: Váha nového pozorování v EWMA (0 < alpha <= 1)
+        :param k: Počet směrodatných odchylek nad průměrem
+        :param minimum: Nejmenší vrácený limit v sekundách
+        :param maximum: Největší vrácený limit v sekundách
+        :param initial: Limit používaný, dokud není dostatek pozorování
+        :param warmup: Počet pozorování potřebných pro adaptivní limit
+        :raises ValueError: Pokud jsou parametry mimo povolený rozsah
+        """
+        if not isinstance(alpha, (int, float)) or not 0 < alpha <= 1:
+            raise ValueError("Parametr alpha musí být v intervalu (0, 1].")
+        if not isinstance(k, (int, float)) or k < 0:
+            raise ValueError("Parametr k musí být nezáporné číslo.")
+        if not isinstance(minimum, (int, float)) or not isinstance(maximum, (int, float)) or not 0 < minimum <= maximum:
+            raise ValueError("Musí platit 0 < minimum <= maximum.")
+        if not isinstance(initial, (int, float)) or initial <= 0:
+            raise ValueError("Počáteční limit musí být kladné číslo.")
+        if not isinstance(warmup, int) or warmup < 1:
+            raise ValueError("Počet zahřívacích pozorování musí být kladné celé číslo.")
+
+        self.alpha = alpha
+        self.k = k
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial
+        self.warmup = warmup
+        self.mean = 0.0
+        self.variance = 0.0
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def timeout(self, waiters=0):
+        """
+        Vrátí časový limit pro nového čekajícího.
+
+        :param waiters: Počet procesů, které již na prostředek čekají
+        :return: Časový limit v sekundách
+        """
+        with self._lock:
+            if self.samples < self.warmup:
+                return self.initial
+            per_holder = self.mean + self.k * math.sqrt(self.variance)
+        return min(self.maximum, max(self.minimum, (waiters + 1) * per_holder))
+
+    def observe(self, hold_time):
+        """
+        Započítá dobu držení prostředku do průměru a rozptylu.
+
+        :param hold_time: Doba držení prostředku v sekundách
+        """
+        with self._lock:
+            if self.samples == 0:
+                self.mean = hold_time
+                self.variance = 0.0
+            else:
+                diff = hold_time - self.mean
+                increment = self.alpha * diff
+                self.mean += increment
+                self.variance = (1 - self.alpha) * (self.variance + diff * increment)
+            self.samples += 1
+
+
+def evaluate(policy, holds, deadlock_rate=0.05, seed=None):
+    """
+    Vyhodnotí politiku časového limitu nad posloupností dob držení.
+
+    Pro každé držení přijde čekající v náhodném okamžiku držení. S pravděpodobností deadlock_rate
+    je držitel v deadlocku (prostředek nikdy neuvolní) a limit určuje latenci detekce;
+    jinak je vypršení limitu před uvolněním prostředku falešný poplach.
+
+    :param policy: Instance FixedTimeout nebo AdaptiveTimeout
+    :param holds: Doby držení v sekundách
+    :param deadlock_rate: Pravděpodobnost, že držitel je v deadlocku
+    :param seed: Semínko generátoru náhodných čísel
+    :return: Slovník s mírou falešných poplachů a průměrnou a maximální latencí detekce
+    """
+    rng = random.Random(seed)
+    false_positives = 0
+    waits = 0
+    latencies = []
+    for hold in holds:
+        limit = policy.timeout()
+        if rng.random() < deadlock_rate:
+            latencies.append(limit)
+            continue
+        remaining = hold * rng.random()
+        waits += 1
+        if limit < remaining:
+            false_positives += 1
+        policy.observe(hold)
+
+    return {
+        "false_positive_rate": false_positives / waits if waits else 0.0,
+        "detection_latency_mean": sum(latencies) / len(latencies) if latencies else None,
+        "detection_latency_max": max(latencies) if latencies else None,
+        "deadlocks": len(latencies),
+    }
+
+
+def compare(hold_means=(0.05, 1.0, 8.0), samples=5000, distribution="exponential", deadlock_rate=0.05, seed=1):
+    """
+    Porovná pevný limit 5 s s adaptivním limitem pro krátké, střední a dlouhé doby držení.
+
+    :param hold_means: Střední doby držení v sekundách
+    :param samples: Počet držení pro každou střední dobu
+    :param distribution: Rozdělení dob držení ('exponential', 'constant' nebo 'uniform')
+    :param deadlock_rate: Pravděpodobnost, že držitel je v deadlocku
+    :param seed: Semínko generátoru náhodných čísel
+    :return: Seznam výsledků s klíči 'hold_mean', 'policy' a metrikami z evaluate
+    """
+    results = []
+    for mean in hold_means:
+        rng = random.Random(seed)
+        holds = [sample_service_time(rng, {"distribution": distribution, "mean": mean}) for _ in range(samples)]
+        for name, policy in (("fixed", FixedTimeout()), ("adaptive", AdaptiveTimeout())):
+            result = evaluate(policy, holds, deadlock_rate, seed)
+            result.update({"hold_mean": mean, "policy": name})
+            results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+        print(f"{'Držení (s)':<12}{'Politika':<10}{'Falešné poplachy':>18}{'Latence detekce (s)':>21}")
+        for r in compare(samples=samples):
+            latency = "-" if r["detection_latency_mean"] is None else f"{r['detection_latency_mean']:.3f}"
+            print(f"{r['hold_mean']:<12}{r['policy']:<10}{r['false_positive_rate']:>18.2%}{latency:>21}")
+    except Exception as e:
+        print(f"CHYBA: {e}")
@@ -0,0 +1,148 @@
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+
+try:
+    from . import Events
+except ImportError:
+    import Events
+
+INSTANT_KINDS = ("timeout", "restart", "backoff", "deadlock", "livelock", "starved")
+
+
+class Tracer:
+    def __init__(self):
+        """
+        Inicializuje posluchače, který z událostí simulace skládá časovou osu
+        ve formátu Chrome Trace Event (lze otevřít v Perfetto nebo chrome://tracing).
+
+        Každé vlákno je samostatná stopa. Čekání na prostředek a jeho držení jsou úseky,
+        timeouty, ústupy, restarty a verdikty jsou okamžité události a šipky spojují
+        uvolnění prostředku s čekajícím, kterého odblokovalo.
+        """
+        self.events = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._threads = {}  # ident vlákna -> název stopy
+        self._waits = {}  # (vlákno, prostředek) -> začátek čekání
+        self._holds = {}  # prostředek -> (vlákno, začátek držení, proces)
+        self._flows = {}  # prostředek -> id šipky od posledního uvolnění
+        self._flow_ids = itertools.count(1)
+
+    def __call__(self, event):
+        """
+        Zpracuje jednu událost simulace (viz Events.emit).
+
+        :param event: Událost ve formátu slovníku
+        """
+        kind = event["kind"]
+        tid = event["thread"]
+        resource = event["resource"]
+        ts = self._micros(event["ts"])
+
+        with self._lock:
+            if tid not in self._threads:
+                self._threads[tid] = event["thread_name"]
+
+            if kind == "wait":
+                self._waits[(tid, resource)] = ts
+            elif kind == "acquired":
+                start = self._waits.pop((tid, resource), None)
+                if start is not None:
+                    self._slice(f"čekání na {resource}", "wait", tid, start, ts, event)
+                    flow = self._flows.pop(resource, None)
+                    if flow is not None:
+                        self.events.append({"name": "uvolnění", "cat": "flow", "ph": "f", "bp": "e",
+                                            "id": flow, "pid": 1, "tid": tid, "ts": ts})
+                self._holds[resource] = (tid, ts, event["process"])
+            elif kind == "released":
+                hold = self._holds.pop(resource, None)
+                if hold is not None:
+                    self._slice(f"drží {resource}", "hold", hold[0], hold[1], ts, {"process": hold[2]})
+                flow = next(self._flow_ids)
+                self._flows[resource] = flow
+                self.events.append({"name": "uvolnění", "cat": "flow", "ph": "s",
+                                    "id": flow, "pid": 1, "tid": tid, "ts": ts})
+            elif kind in ("timeout", "restart"):
+                # Čekání skončilo bez získání prostředku
+                ended = [key for key in self._waits
+                         if key[0] == tid and (kind == "restart" or key[1] == resource)]
+                for key in ended:
+                    self._slice(f"čekání na {key[1]}", "wait", tid, self._waits.pop(key), ts, event)
+                self._instant(kind, tid, ts, event)
+            elif kind in INSTANT_KINDS:
+                self._instant(kind, tid, ts, event)
+
+    def finish(self):
+        """
+        Uzavře úseky, které při konci simulace stále trvají (např. prostředky držené v deadlocku).
+        """
+        now = self._micros(time.perf_counter())
+        with self._lock:
+            for (tid, resource), start in self._waits.items():
+                self._slice(f"čekání na {resource}", "wait", tid, start, now, {"unfinished": True})
+            for resource, (tid, start, process) in self._holds.items():
+                self._slice(f"drží {resource}", "hold", tid, start, now, {"process": process, "unfinished": True})
+            self._waits.clear()
+            self._holds.clear()
+
+    def to_dict(self):
+        """
+        Vrátí časovou osu jako slovník ve formátu JSON Object Format.
+
+        :return: Slovník s klíči 'traceEvents' a 'displayTimeUnit'
+        """
+        with self._lock:
+            metadata = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "Simulace"}}]
+            metadata += [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+                         for tid, name in self._threads.items()]
+            return {"traceEvents": metadata + list(self.events), "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        """
+        Uloží časovou osu do souboru.
+
+        :param path: Cesta k výstupnímu JSON souboru
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    def _micros(self, timestamp):
+        return round((timestamp - self._start) * 1_000_000, 1)
+
+    def _slice(self, name, category, tid, start, end, event):
+        args = {key: value for key, value in event.items()
+                if key not in ("kind", "ts", "thread", "thread_name", "resource")}
+        self.events.append({"name": name, "cat": category, "ph": "X", "pid": 1, "tid": tid,
+                            "ts": start, "dur": max(end - start, 0), "args": args})
+
+    def _instant(self, kind, tid, ts, event):
+        args = {key: value for key, value in event.items()
+                if key not in ("kind", "ts", "thread", "thread_name")}
+        self.events.append({"name": kind, "cat": "verdict" if kind in ("deadlock", "livelock", "starved") else kind,
+                            "ph": "i", "s": "t", "pid": 1, "tid": tid, "ts": ts, "args": args})
+
+
+@contextlib.contextmanager
+def tracing(path=None):
+    """
+    Po dobu bloku zaznamenává události simulace; na konci uzavře otevřené úseky
+    a pokud je zadána cesta, uloží časovou osu do souboru.
+
+    :param path: Cesta k výstupnímu JSON souboru, nebo None
+    :return: Instance Tracer
+    """
+    tracer = Tracer()
+    Events.subscribe(tracer)
+    try:
+        yield tracer
+    finally:
+        Events.unsubscribe(tracer)
+        tracer.finish()
+        if path is not None:
+            tracer.save(path)
@@ -0,0 +1,446 @@
+import threading
+import heapq
+import math
+import random
+import time
+import json
+import sys
+
+try:
+    from . import Cancellation, Events
+    from .Cancellation import Cancelled
+except ImportError:
+    import Cancellation, Events
+    from Cancellation import Cancelled
+
+output_lock = threading.Lock()  # Synchronizační zámek pro výstup
+
+DISTRIBUTIONS = ("exponential", "constant", "uniform")  # Rozdělení doby obsluhy
+RESERVOIR_SIZE = 10000  # Maximální počet uchovaných dob čekání na prioritu (pro percentily)
+DEFAULT_SERVICE = {"mean": 0.1}  # Doba obsluhy třídy bez klíče 'service' (exponenciální, 100 ms)
+STARVATION_RATIO = 0.25  # Podíl neobsloužených procesů, od kterého je priorita považována za vyhladovělou
+
+
+def load_config(config_file):
+    """
+    Načte konfiguraci ze zadaného JSON souboru.
+
+    Argumenty:
+        config_file (str): Cesta ke konfiguračnímu souboru.
+
+    Návratová hodnota:
+        dict: Načtená konfigurace.
+
+    Výjimky:
+        FileNotFoundError: Pokud konfigurační soubor není nalezen.
+        ValueError: Pokud konfigurační soubor nelze dekódovat.
+    """
+    try:
+        with open(config_file, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Konfigurační soubor '{config_file}' nebyl nalezen.")
+    except json.JSONDecodeError:
+        raise ValueError(f"Nelze dekódovat JSON z konfiguračního souboru '{config_file}'.")
+
+
+def validate_service(service):
+    """
+    Ověří rozdělení doby obsluhy.
+
+    Argumenty:
+        service (dict): Rozdělení ve tvaru {"distribution": ..., "mean": ...}.
+
+    Výjimky:
+        ValueError: Pokud je rozdělení neznámé nebo střední hodnota není kladná.
+    """
+    if not isinstance(service, dict):
+        raise ValueError("Doba obsluhy musí být zadána slovníkem s klíči 'distribution' a 'mean'.")
+    distribution = service.get("distribution", "exponential")
+    mean = service.get("mean")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Neznámé rozdělení '{distribution}'. Podporované: {', '.join(DISTRIBUTIONS)}.")
+    if not isinstance(mean, (int, float)) or mean <= 0:
+        raise ValueError("Střední doba obsluhy musí být kladné číslo.")
+
+
+def sample_service_time(rng, service):
+    """
+    Vylosuje dobu obsluhy podle zadaného rozdělení.
+
+    Argumenty:
+        rng (random.Random): Generátor náhodných čísel.
+        service (dict): Rozdělení ve tvaru {"distribution": ..., "mean": ...}.
+
+    Návratová hodnota:
+        float: Doba obsluhy v sekundách.
+
+    Výjimky:
+        ValueError: Pokud je rozdělení neznámé nebo střední hodnota není kladná.
+    """
+    validate_service(service)
+    distribution = service.get("distribution", "exponential")
+    mean = service["mean"]
+
+    if distribution == "exponential":
+        return rng.expovariate(1 / mean)
+    if distribution == "uniform":
+        return rng.uniform(0, 2 * mean)
+    return mean
+
+
+def percentile(values, q):
+    """
+    Vrátí q-tý percentil (metodou nejbližšího pořadí) ze seznamu hodnot.
+
+    Argumenty:
+        values (list): Hodnoty.
+        q (float): Percentil v rozsahu 0 až 100.
+
+    Návratová hodnota:
+        float: Hodnota percentilu, nebo None pro prázdný seznam.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PriorityResource:
+    def __init__(self, name):
+        """
+        Inicializuje zdroj, který při uvolnění přidělí zámek čekajícímu s nejvyšší prioritou.
+        Při shodě priorit rozhoduje pořadí příchodu.
+
+        Argumenty:
+            name (str): Název zdroje.
+
+        Výjimky:
+            ValueError: Pokud název zdroje není neprázdný řetězec.
+        """
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Název zdroje musí být neprázdný řetězec.")
+
+        self.name = name
+        self._condition = threading.Condition()
+        self._busy = False
+        self._waiting = []  # Halda dvojic (priorita, pořadové číslo)
+        self._closed = False
+
+    def acquire(self, priority, seq):
+        """
+        Zablokuje volajícího, dokud mu není zdroj přidělen nebo dokud není zdroj uzavřen.
+
+        Argumenty:
+            priority (int): Priorita žadatele (nižší hodnota znamená vyšší prioritu).
+            seq (int): Pořadové číslo příchodu žadatele.
+
+        Návratová hodnota:
+            bool: True, pokud byl zdroj přidělen, False, pokud byl zdroj uzavřen.
+        """
+        entry = (priority, seq)
+        Events.emit("wait", f"Proces {seq}", self.name, priority=priority)
+        with self._condition:
+            heapq.heappush(self._waiting, entry)
+            while not self._closed and (self._busy or self._waiting[0] != entry):
+                self._condition.wait()
+            if self._closed:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                return False
+            heapq.heappop(self._waiting)
+            self._busy = True
+            Events.emit("acquired", f"Proces {seq}", self.name, priority=priority)
+            return True
+
+    def release(self, process_name=None):
+        """
+        Uvolní zdroj a probudí čekající.
+
+        Argumenty:
+            process_name (str): Název procesu, který zdroj uvolňuje.
+        """
+        Events.emit("released", process_name, self.name)
+        with self._condition:
+            self._busy = False
+            self._condition.notify_all()
+
+    def close(self):
+        """
+        Uzavře zdroj; všichni čekající se vrátí bez přidělení.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+class _Job:
+    __slots__ = ("priority", "seq", "arrival", "service")
+
+    def __init__(self, priority, seq, arrival, service):
+        self.priority = priority
+        self.seq = seq
+        self.arrival = arrival
+        self.service = service
+
+
+class _PriorityStats:
+    __slots__ = ("arrived", "completed", "rejected", "waits", "seen")
+
+    def __init__(self):
+        self.arrived = 0
+        self.completed = 0
+        self.rejected = 0
+        self.waits = []  # Rezervoár dob čekání omezené velikosti
+        self.seen = 0
+
+
+class WorkloadGenerator:
+    def __init__(self, resource, classes, duration, workers=16, max_backlog=1000, seed=None, token=None):
+        """
+        Inicializuje generátor zátěže s Poissonovými příchody procesů.
+
+        Každá třída procesů má prioritu, intenzitu příchodů (procesů za sekundu) a rozdělení
+        doby obsluhy. Procesy obsluhuje pevná sada pracovních vláken, která se po dokončení
+        procesu znovu použijí, takže paměť zůstává omezená i při dlouhém běhu. Nepřevzaté procesy
+        čekají ve frontě podle priority, takže přednost platí i před procesy, které ještě nedošly
+        ke zdroji.
+
+        Argumenty:
+            resource (PriorityResource): Sdílený zdroj, o který procesy soutěží.
+            classes (list): Třídy procesů ve tvaru {"priority": 1, "rate": 5.0, "service": {...}}.
+            duration (float): Délka okna, ve kterém přicházejí procesy, v sekundách.
+            workers (int): Počet pracovních vláken (souběžně rozpracovaných procesů).
+            max_backlog (int): Maximální délka fronty nepřevzatých procesů; další jsou odmítnuty.
+            seed (int): Semínko generátoru náhodných čísel.
+            token (CancellationToken): Token zrušení běhu, nebo None.
+
+        Výjimky:
+            ValueError: Pokud je některý z parametrů neplatný.
+        """
+        if not isinstance(resource, PriorityResource):
+            raise ValueError("Zdroj musí být instancí třídy PriorityResource.")
+        if not classes:
+            raise ValueError("Generátor zátěže potřebuje alespoň jednu třídu procesů.")
+        for workload_class in classes:
+            if not isinstance(workload_class.get("priority"), int) or workload_class["priority"] < 1:
+                raise ValueError("Priorita musí být kladné celé číslo.")
+            if not isinstance(workload_class.get("rate"), (int, float)) or workload_class["rate"] <= 0:
+                raise ValueError("Intenzita příchodů musí být kladné číslo.")
+            validate_service(workload_class.get("service", DEFAULT_SERVICE))
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            raise ValueError("Délka běhu musí být kladné číslo.")
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Počet pracovních vláken musí být kladné celé číslo.")
+        if not isinstance(max_backlog, int) or max_backlog < 1:
+            raise ValueError("Maximální délka fronty musí být kladné celé číslo.")
+
+        self.resource = resource
+        self.classes = classes
+        self.duration = duration
+        self.workers = workers
+        self.max_backlog = max_backlog
+        self.rng = random.Random(seed)
+        self.token = token
+        self.cancelled = False
+        self._reservoir_rng = random.Random(seed)  # Samostatný generátor, aby výběr neovlivnil příchody
+
+        self._backlog = []  # Halda trojic (priorita, pořadové číslo, proces)
+        self._backlog_condition = threading.Condition()
+        self.elapsed = None  # Skutečná délka běhu v sekundách (kratší než duration při zrušení)
+        self._stopped = False
+        self._stats = {c["priority"]: _PriorityStats() for c in classes}
+        self._stats_lock = threading.Lock()
+
+    def run(self):
+        """
+        Spustí zátěž na dobu duration sekund a vrátí souhrnné statistiky.
+        Při zrušení běhu tokenem se příchody zastaví, rozpracované procesy uvolní zdroj
+        a vrátí se statistiky do okamžiku zrušení.
+
+        Návratová hodnota:
+            dict: Statistiky podle priorit (viz report).
+        """
+        self._start_time = time.time()
+        workers = [threading.Thread(target=self._worker, name=f"Worker {i + 1}", daemon=True)
+                   for i in range(self.workers)]
+        for worker in workers:
+            worker.start()
+
+        try:
+            self._generate_arrivals()
+        except Cancelled:
+            self.cancelled = True
+        finally:
+            self.elapsed = min(self.duration, time.time() - self._start_time)
+            # Pracovní vlákna se ukončí i při neočekávané chybě, jinak by zůstala viset
+            with self._backlog_condition:
+                self._stopped = True
+                self._backlog_condition.notify_all()
+            self.resource.close()
+            for worker in workers:
+                worker.join()
+        return self.report()
+
+    def report(self):
+        """
+        Vrátí statistiky po prioritách: počty příchodů, dokončení, odmítnutí a nedokončených procesů,
+        propustnost a percentily doby čekání na zdroj. Propustnost se počítá ze skutečné délky běhu,
+        takže zrušený běh ji nepodhodnotí.
+
+        Návratová hodnota:
+            dict: Statistiky podle priorit.
+        """
+        elapsed = self.elapsed or self.duration
+        report = {}
+        for priority, stats in sorted(self._stats.items()):
+            report[priority] = {
+                "arrived": stats.arrived,
+                "completed": stats.completed,
+                "rejected": stats.rejected,
+                "unfinished": stats.arrived - stats.completed - stats.rejected,
+                "throughput": stats.completed / elapsed,
+                "wait_p50": percentile(stats.waits, 50),
+                "wait_p95": percentile(stats.waits, 95),
+                "wait_p99": percentile(stats.waits, 99),
+                "wait_max": max(stats.waits) if stats.waits else None,
+            }
+        return report
+
+    def _generate_arrivals(self):
+        """
+        Vkládá procesy do fronty v časech daných sloučenými Poissonovými procesy všech tříd.
+        """
+        next_arrivals = [(self.rng.expovariate(c["rate"]), i) for i, c in enumerate(self.classes)]
+        heapq.heapify(next_arrivals)
+        seq = 0
+        while next_arrivals[0][0] < self.duration:
+            arrival, index = heapq.heappop(next_arrivals)
+            workload_class = self.classes[index]
+            heapq.heappush(next_arrivals, (arrival + self.rng.expovariate(workload_class["rate"]), index))
+
+            delay = self._start_time + arrival - time.time()
+            if delay > 0:
+                Cancellation.sleep(delay, self.token)
+
+            job = _Job(workload_class["priority"], seq, self._start_time + arrival,
+                       sample_service_time(self.rng, workload_class.get("service", DEFAULT_SERVICE)))
+            seq += 1
+            stats = self._stats[job.priority]
+            with self._backlog_condition:
+                with self._stats_lock:
+                    stats.arrived += 1
+                    if len(self._backlog) >= self.max_backlog:
+                        stats.rejected += 1
+                        continue
+                heapq.heappush(self._backlog, (job.priority, job.seq, job))
+                self._backlog_condition.notify()
+
+        remaining = self._start_time + self.duration - time.time()
+        if remaining > 0:
+            Cancellation.sleep(remaining, self.token)
+
+    def _worker(self):
+        """
+        Pracovní vlákno: opakovaně převezme z fronty proces s nejvyšší prioritou, získá zdroj,
+        obslouží proces a zdroj uvolní.
+        """
+        while True:
+            with self._backlog_condition:
+                while not self._backlog and not self._stopped:
+                    self._backlog_condition.wait()
+                if self._stopped:
+                    return
+                job = heapq.heappop(self._backlog)[2]
+
+            if not self.resource.acquire(job.priority, job.seq):
+                return
+            wait = time.time() - job.arrival
+            try:
+                Cancellation.sleep(job.service, self.token)
+            except Cancelled:
+                self.resource.release(f"Proces {job.seq}")
+                return
+            self.resource.release(f"Proces {job.seq}")
+            self._record(job.priority, wait)
+
+    def _record(self, priority, wait):
+        """
+        Zaznamená dokončený proces; doby čekání se uchovávají rezervoárovým výběrem omezené velikosti.
+        """
+        stats = self._stats[priority]
+        with self._stats_lock:
+            stats.completed += 1
+            stats.seen += 1
+            if len(stats.waits) < RESERVOIR_SIZE:
+                stats.waits.append(wait)
+            else:
+                index = self._reservoir_rng.randrange(stats.seen)
+                if index < RESERVOIR_SIZE:
+                    stats.waits[index] = wait
+
+
+def run_workload(section, seed=None, token=None):
+    """
+    Spustí generátor zátěže podle sekce 'starvation' konfigurace.
+
+    Argumenty:
+        section (dict): Sekce 'starvation' s klíči 'resources' a 'workload'.
+        seed (int): Semínko generátoru náhodných čísel.
+        token (CancellationToken): Token zrušení běhu, nebo None.
+
+    Návratová hodnota:
+        dict: Statistiky podle priorit.
+
+    Výjimky:
+        KeyError: Pokud v konfiguraci chybí povinná pole.
+    """
+    if "workload" not in section:
+        raise KeyError("V sekci 'starvation' chybí 'workload'.")
+    workload = section["workload"]
+    for key in ("resource", "duration", "classes"):
+        if key not in workload:
+            raise KeyError(f"Konfigurace zátěže musí obsahovat '{key}'.")
+    if workload["resource"] not in section.get("resources", {}):
+        raise KeyError(f"Zdroj '{workload['resource']}' nebyl v konfiguraci nalezen.")
+
+    resource = PriorityResource(section["resources"][workload["resource"]]["name"])
+    generator = WorkloadGenerator(resource, workload["classes"], workload["duration"],
+                                  workload.get("workers", 16), workload.get("max_backlog", 1000),
+                                  seed if seed is not None else workload.get("seed"), token)
+    return generator.run()
+
+
+if __name__ == "__main__":
+    try:
+        config = load_config('../config/config.json')
+
+        if "starvation" not in config:
+            raise KeyError("V konfiguraci chybí sekce 'starvation'.")
+
+        seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        report = run_workload(config["starvation"], seed)
+
+        def fmt(value):
+            return "-" if value is None else f"{value:.3f}"
+
+        with output_lock:
+            print(f"{'Priorita':<9}{'Příchody':>9}{'Hotovo':>8}{'Odmítnuto':>10}{'Nedokončeno':>12}"
+                  f"{'Propustnost/s':>14}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+            for priority, stats in report.items():
+                print(f"{priority:<9}{stats['arrived']:>9}{stats['completed']:>8}{stats['rejected']:>10}"
+                      f"{stats['unfinished']:>12}{stats['throughput']:>14.2f}{fmt(stats['wait_p50']):>8}"
+                      f"{fmt(stats['wait_p95']):>8}{fmt(stats['wait_p99']):>8}{fmt(stats['wait_max']):>8}")
+
+            starving = [priority for priority, stats in report.items()
+                        if stats["arrived"] and stats["unfinished"] / stats["arrived"] > STARVATION_RATIO]
+            if starving:
+                print(f"\nSTARVATION DETEKOVÁN: Více než {STARVATION_RATIO:.0%} procesů s prioritou "
+                      f"{', '.join(map(str, starving))} nebylo během běhu obslouženo.")
+            else:
+                print("\nVyhladovění nebylo detekováno.")
+
+    except Exception as e:
+        with output_lock:
+            print(f"CHYBA: {e}")
@@ -0,0 +1,125 @@
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.Parallelization_Problems.Acquisition import (BlockingAcquire, HybridAcquire, PollingAcquire, SpinAcquire,
+                                                      benchmark, crossover, plot_crossover)
+from src.Parallelization_Problems.Deadlock import Resource
+
+class TestAcquisition(unittest.TestCase):
+    """
+    Jednotkové testy pro strategie zamykání prostředků.
+    Tato třída testuje spinování, blokování a hybridní zamykání, přizpůsobení rozpočtu pokusů,
+    použití strategie ve třídě Resource a měření latence a ceny.
+    """
+
+    def release_later(self, lock, delay):
+        """
+        Uvolní zámek po delay sekundách z jiného vlákna.
+        """
+        timer = threading.Timer(delay, lock.release)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_strategies_acquire_and_time_out(self):
+        """
+        Test, že všechny strategie (včetně výchozí pauzy PollingAcquire 1 s) zamknou volný zámek
+        a po vypršení limitu nad drženým zámkem vrátí False bez výrazného překročení limitu.
+        """
+        for strategy in (PollingAcquire(), PollingAcquire(0.01), SpinAcquire(), BlockingAcquire(),
+                         HybridAcquire(spins=10)):
+            lock = threading.Lock()
+            self.assertTrue(strategy.acquire(lock, timeout=0.1))
+            start = time.time()
+            self.assertFalse(strategy.acquire(lock, timeout=0.05))
+            self.assertLess(time.time() - start, 0.2)
+
+    def test_polling_acquire_wakes_before_deadline(self):
+        """
+        Test, že výchozí PollingAcquire s limitem, který není násobkem pauzy, vrátí False po uplynutí
+        limitu, a ne až po další celé pauze.
+        """
+        strategy = PollingAcquire()
+        lock = threading.Lock()
+        lock.acquire()
+        start = time.time()
+        self.assertFalse(strategy.acquire(lock, timeout=1.3))
+        self.assertGreaterEqual(time.time() - start, 1.3)
+        self.assertLess(time.time() - start, 1.5)
+
+    def test_hybrid_parks_until_release(self):
+        """
+        Test, že hybridní zamykání po vyčerpání pokusů čeká blokujícím způsobem a zámek získá po uvolnění.
+        """
+        strategy = HybridAcquire(spins=5)
+        lock = threading.Lock()
+        lock.acquire()
+        self.release_later(lock, 0.1)
+
+        self.assertTrue(strategy.acquire(lock, timeout=2))
+        self.assertEqual(strategy.parks, 1)
+
+    def test_adaptive_budget(self):
+        """
+        Test, že adaptivní rozpočet pokusů po dlouhých drženích klesne a po rychlých zamčeních zůstane malý.
+        """
+        strategy = HybridAcquire(spins=64, adaptive=True)
+        for _ in range(5):
+            lock = threading.Lock()
+            lock.acquire()
+            self.release_later(lock, 0.02)
+            strategy.acquire(lock, timeout=1)
+        self.assertLess(strategy.spins, 64)
+
+        for _ in range(20):
+            strategy.acquire(threading.Lock())
+        self.assertLessEqual(strategy.spins, 3)
+        with self.assertRaises(ValueError):
+            HybridAcquire(spins=-1)
+
+    def test_resource_uses_strategy(self):
+        """
+        Test, že prostředek s blokujícím zamykáním získá uvolněný prostředek ihned, ne až po sekundové pauze.
+        """
+        resource = Resource("Resource 1", acquisition=BlockingAcquire())
+        resource.acquire("Process 1")
+        threading.Timer(0.05, resource.release, args=("Process 1",)).start()
+
+        start = time.time()
+        resource.acquire("Process 2", timeout=2)
+        self.assertLess(time.time() - start, 0.5)
+        resource.release("Process 2")
+        with self.assertRaises(ValueError):
+            Resource("Resource 2", acquisition=object())
+
+    def test_benchmark(self):
+        """
+        Test, že měření vrátí výsledek pro každou kombinaci a bod zlomu lze určit z výsledků.
+        """
+        results = benchmark(strategies=("spin", "block"), holds=(0.0, 0.001), threads=(2,), iterations=5)
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r["latency_mean"] >= 0 and r["cpu_per_acquire"] >= 0 for r in results))
+        self.assertIn(2, crossover(results))
+        with self.assertRaises(ValueError):
+            benchmark(strategies=("unknown",))
+
+    @unittest.skipUnless(importlib.util.find_spec("matplotlib"), "vyžaduje matplotlib")
+    def test_plot_crossover(self):
+        """
+        Test, že graf bodu zlomu se uloží do souboru ve formátu podle přípony.
+        """
+        results = benchmark(strategies=("spin", "block"), holds=(0.0, 0.001), threads=(2, 4), iterations=5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crossover.svg")
+            plot_crossover(results, path)
+            with open(path, encoding="utf-8") as f:
+                self.assertIn("<svg", f.read())
+        with self.assertRaises(ValueError):
+            plot_crossover(results, "crossover.svg", metric="throughput")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from src.Parallelization_Problems.Cache import ResultCache, cache_key, replay
+from src.Parallelization_Problems.CLI import main
+
+class TestCache(unittest.TestCase):
+    """
+    Jednotkové testy pro cache výsledků opakovatelných běhů.
+    Tato třída testuje klíč z normalizované konfigurace, vyřazování nejdéle nepoužitých záznamů,
+    přehrání záznamu událostí a opakovaný běh z příkazové řádky.
+    """
+
+    def setUp(self):
+        """
+        Vytvoří dočasný adresář cache pro každý test.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_key_normalization(self):
+        """
+        Test, že na pořadí klíčů konfigurace nezáleží, ale na semínku a volbách ano.
+        """
+        a = cache_key({"x": 1, "y": [1, 2]}, "deadlock", 1, {"strategy": "timeout"})
+        b = cache_key({"y": [1, 2], "x": 1}, "deadlock", 1, {"strategy": "timeout"})
+
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, cache_key({"x": 1, "y": [1, 2]}, "deadlock", 2, {"strategy": "timeout"}))
+        self.assertNotEqual(a, cache_key({"x": 1, "y": [1, 2]}, "deadlock", 1, {"strategy": "wait-die"}))
+        with self.assertRaises(ValueError):
+            cache_key({}, "deadlock", None)
+
+    def test_lru_eviction(self):
+        """
+        Test, že při překročení velikosti se smaže nejdéle nepoužitý záznam, ne naposledy čtený.
+        """
+        cache = ResultCache(self.directory, max_bytes=10 ** 6)
+        events = [{"kind": "wait", "process": f"P{i}", "t": i} for i in range(50)]
+        cache.put("a", {"n": 1}, events)
+        entry_size = cache.size()
+        cache.max_bytes = 2 * entry_size + entry_size // 2
+        cache.put("b", {"n": 2}, events)
+        past = time.time() - 10
+        os.utime(os.path.join(self.directory, "a.json.gz"), (past, past))
+        os.utime(os.path.join(self.directory, "b.json.gz"), (past - 10, past - 10))
+
+        self.assertEqual(cache.get("a")["result"], {"n": 1})  # Čtení obnoví čas použití
+        cache.put("c", {"n": 3}, events)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+
+    def test_replay_speed(self):
+        """
+        Test, že přehrání zachová pořadí událostí a dodrží zrychlený čas.
+        """
+        events = [{"kind": "wait", "process": "P", "t": 0.0}, {"kind": "acquired", "process": "P", "t": 0.4}]
+        received = []
+
+        start = time.perf_counter()
+        replay(events, speed=2.0, sink=received.append)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([e["kind"] for e in received], ["wait", "acquired"])
+        self.assertNotIn("t", received[0])
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 0.4)
+
+    def test_cli_repeat_run_from_cache(self):
+        """
+        Test, že druhý běh se stejným semínkem vrátí uložený výsledek a přehraje uložené události.
+        """
+        handle, config_file = tempfile.mkstemp(suffix=".json", dir=self.directory)
+        with os.fdopen(handle, "w") as f:
+            json.dump({"starvation": {
+                "resources": {"r1": {"name": "R1"}},
+                "workload": {"resource": "r1", "duration": 0.2, "workers": 2, "classes": [
+                    {"priority": 1, "rate": 20, "service": {"distribution": "constant", "mean": 0.001}},
+                ]}}}, f)
+        argv = ["--config", config_file, "--scenario", "workload", "--seed", "7", "--cache",
+                "--cache-dir", os.path.join(self.directory, "cache"), "--events", "--format", "jsonl"]
+
+        runs = []
+        for _ in range(2):
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(argv), 0)
+            runs.append([json.loads(line) for line in stdout.getvalue().splitlines()])
+
+        first, second = runs[0][-1], runs[1][-1]
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(first["result"], second["result"])
+        self.assertGreater(len(runs[0]), 1)
+        self.assertEqual([e["kind"] for e in runs[0][:-1]], [e["kind"] for e in runs[1][:-1]])
+
+    def test_cli_rejects_cache_without_seed(self):
+        """
+        Test, že příkazová řádka odmítne cache bez semínka místo tichého běhu bez cache.
+        """
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(main(["--scenario", "deadlock", "--cache"]), 2)
+        self.assertIn("--seed", stderr.getvalue())
+
+    def test_cli_rejects_cache_for_threaded_scenarios(self):
+        """
+        Test, že příkazová řádka odmítne cache u vláknových scénářů, jejichž výsledek semínko neurčuje.
+        """
+        for argv in (["--scenario", "deadlock"], ["--scenario", "livelock", "--backend", "sharded"]):
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main(argv + ["--seed", "1", "--cache"]), 2)
+            self.assertIn("plánování vláken", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
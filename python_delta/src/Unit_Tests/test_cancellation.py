@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from src.Parallelization_Problems import Deadlock, Livelock, Starvation
+from src.Parallelization_Problems.Cancellation import Cancelled, CancellationToken
+from src.Parallelization_Problems.CLI import build_parser, honours_token
+
+SECTION = {
+    "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+    "processes": [
+        {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+        {"name": "Process 2", "resource1": "r2", "resource2": "r1"},
+    ],
+}
+
+class TestCancellation(unittest.TestCase):
+    """
+    Jednotkové testy pro kooperativní zrušení běhu.
+    Tato třída testuje probuzení blokovaných čekání, uvolnění držených prostředků
+    a rychlé ukončení vláken scénářů.
+    """
+
+    def cancel_later(self, token, delay=0.3):
+        """
+        Zruší běh tokenu po delay sekundách z jiného vlákna.
+        """
+        timer = threading.Timer(delay, token.cancel)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_token_wakes_sleep_and_lock(self):
+        """
+        Test, že zrušení okamžitě ukončí spánek i čekání na zamčený zámek a zavolá zaregistrované funkce.
+        """
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: calls.append(1))
+        lock = threading.Lock()
+        lock.acquire()
+        self.cancel_later(token, 0.1)
+
+        start = time.time()
+        with self.assertRaises(Cancelled):
+            token.acquire(lock)
+        self.assertLess(time.time() - start, 0.5)
+        with self.assertRaises(Cancelled):
+            token.sleep(10)
+        token.cancel()
+        self.assertEqual(calls, [1])
+
+    def test_deadlock_releases_resources(self):
+        """
+        Test, že zrušení scénáře v deadlocku probudí procesy čekající na prostředek,
+        uvolní oba prostředky a scénář skončí dříve než timeout.
+        """
+        token = CancellationToken()
+        processes = Deadlock.build_processes(SECTION, hold_time=0.1, token=token)
+        self.cancel_later(token)
+
+        start = time.time()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertLess(time.time() - start, 1.0)
+        self.assertTrue(all(process.cancelled for process in processes))
+        self.assertFalse(processes[0].resource1.lock.locked())
+        self.assertFalse(processes[0].resource2.lock.locked())
+
+    def test_scenarios_join_quickly(self):
+        """
+        Test, že zrušené scénáře livelocku a vyhladovění skončí krátce po zrušení.
+        """
+        starvation = {
+            "resources": {"r": {"name": "Resource"}},
+            "processes": [{"name": "High", "resource": "r", "priority": 1},
+                          {"name": "Low", "resource": "r", "priority": 2}],
+        }
+        for run in (lambda token: Livelock.run_scenario(SECTION, watchdog=True, token=token),
+                    lambda token: Starvation.run_scenario(starvation, token=token)):
+            token = CancellationToken()
+            self.cancel_later(token)
+            start = time.time()
+            run(token)
+            self.assertLess(time.time() - start, 1.0)
+
+    def test_signals_only_for_cancellable_runs(self):
+        """
+        Test, že příkazová řádka přebírá signály jen pro běhy, které token zrušení kontrolují;
+        Monte Carlo a backendy 'sharded' a 'array' se signálem ukončí okamžitě jako dřív.
+        """
+        parser = build_parser()
+        self.assertTrue(honours_token(parser.parse_args(["--scenario", "deadlock"])))
+        self.assertTrue(honours_token(parser.parse_args(["--scenario", "workload"])))
+        for argv in (["--scenario", "montecarlo"], ["--scenario", "deadlock", "--backend", "sharded"],
+                     ["--scenario", "deadlock", "--backend", "array"]):
+            self.assertFalse(honours_token(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from src.Parallelization_Problems.CLI import main
+
+CLI_FILE = os.path.join(os.path.dirname(__file__), "..", "Parallelization_Problems", "CLI.py")
+
+CONFIG = {
+    "deadlock_livelock": {
+        "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+        "processes": [
+            {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+            {"name": "Process 2", "resource1": "r2", "resource2": "r1"},
+        ],
+    },
+    "starvation": {
+        "resources": {"r1": {"name": "Resource 1"}},
+        "processes": [],
+        "workload": {"resource": "r1", "duration": 0.3, "workers": 2, "classes": [
+            {"priority": 1, "rate": 20, "service": {"distribution": "constant", "mean": 0.001}},
+        ]},
+    },
+}
+
+class TestCLI(unittest.TestCase):
+    """
+    Jednotkové testy pro spouštění simulací z příkazové řádky.
+    Tato třída testuje strojově čitelný výstup, explicitní cestu ke konfiguraci
+    a to, že příkazová řádka nenačítá tkinter.
+    """
+
+    def setUp(self):
+        """
+        Vytvoří dočasný konfigurační soubor pro každý test.
+        """
+        handle, self.config_file = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump(CONFIG, f)
+
+    def tearDown(self):
+        os.remove(self.config_file)
+
+    def run_cli(self, *argv):
+        """
+        Spustí main() se zadanými argumenty a vrátí návratový kód a zachycený standardní výstup.
+        """
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            code = main(["--config", self.config_file, *argv])
+        return code, stdout.getvalue()
+
+    def test_jsonl_output(self):
+        """
+        Test, že formát jsonl vypíše jeden záznam na řádek a semínko se u opakování zvyšuje.
+        """
+        code, output = self.run_cli("--scenario", "workload", "--seed", "5", "--repeat", "2", "--format", "jsonl")
+
+        self.assertEqual(code, 0)
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual([r["seed"] for r in records], [5, 6])
+        self.assertIn("1", records[0]["result"]["priorities"])
+
+    def test_json_output_deadlock(self):
+        """
+        Test, že scénář deadlocku se strategií wound-wait vrátí výsledek jako jeden JSON dokument
+        a výpisy simulace se do standardního výstupu nedostanou.
+        """
+        code, output = self.run_cli("--scenario", "deadlock", "--strategy", "wound-wait", "--hold-time", "0.1")
+
+        self.assertEqual(code, 0)
+        result = json.loads(output)["runs"][0]["result"]
+        self.assertFalse(result["deadlock_detected"])
+        self.assertEqual(result["completed"], 2)
+
+    def test_missing_config(self):
+        """
+        Test, že neexistující konfigurační soubor vrátí nenulový návratový kód.
+        """
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            code = main(["--config", self.config_file + ".missing", "--scenario", "workload"])
+        self.assertEqual(code, 1)
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_script_does_not_import_tkinter(self):
+        """
+        Test, že spuštění CLI.py jako skriptu funguje z libovolného adresáře a nenačte tkinter.
+        """
+        code = ("import runpy, sys; sys.argv = [sys.argv[1], '--config', sys.argv[2], '--scenario', 'workload'];"
+                "\ntry:\n    runpy.run_path(sys.argv[0], run_name='__main__')\nexcept SystemExit:\n    pass"
+                "\nprint('tkinter' in sys.modules)")
+        completed = subprocess.run([sys.executable, "-c", code, CLI_FILE, self.config_file],
+                                   capture_output=True, text=True, cwd=tempfile.gettempdir(), timeout=60)
+
+        self.assertEqual(completed.stdout.strip().splitlines()[-1], "False")
+        self.assertIn('"runs"', completed.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
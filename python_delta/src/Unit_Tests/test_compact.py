@@ -0,0 +1,86 @@
+import unittest
+from src.Parallelization_Problems.Compact import CompactTables, run_scenario, simulate
+
+SECTION = {
+    "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+    "processes": [
+        {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+        {"name": "Process 2", "resource1": "r2", "resource2": "r1"},
+    ],
+}
+
+class TestCompact(unittest.TestCase):
+    """
+    Jednotkové testy pro kompaktní tabulky procesů a prostředků.
+    Tato třída testuje krokovou simulaci bez vláken, hledání cyklů čekání,
+    pohledy na řádky tabulek a velikost tabulek.
+    """
+
+    def test_opposite_order_deadlocks(self):
+        """
+        Test, že dva procesy zamykající prostředky v opačném pořadí uváznou stejně jako ve vláknové simulaci.
+        """
+        result = run_scenario(SECTION)
+
+        self.assertTrue(result["deadlock_detected"])
+        self.assertEqual((result["completed"], result["aborts"], result["cycle_processes"]), (0, 2, 2))
+
+    def test_shared_order_completes(self):
+        """
+        Test, že procesy zamykající prostředky ve stejném pořadí s uvolněním po dokončení všechny dokončí.
+        """
+        tables = CompactTables(3, 2)
+        for i in range(3):
+            tables.first[i], tables.second[i] = 0, 1
+
+        result = simulate(tables, hold_ticks=2, timeout_ticks=50, release_on_finish=True)
+
+        self.assertEqual((result["completed"], result["deadlocked"], result["cycle_processes"]), (3, 0, 0))
+        self.assertFalse(tables.resource(0).locked())
+
+    def test_freed_resource_ends_cycle_walk(self):
+        """
+        Test, že řetěz čekání končí u prostředku uvolněného v tomtéž kroku a nezapočítá falešný cyklus.
+        Process 2 uvolní r0 po dokončení a Process 3 se pak zablokuje na r1 držícím Process 1, který
+        na r0 stále čeká; bez zastavení by index NONE (-1) přečetl řádek posledního procesu.
+        """
+        tables = CompactTables(4, 4)
+        for i, (a, b) in enumerate([(1, 0), (0, 2), (3, 1), (3, 1)]):
+            tables.first[i], tables.second[i] = a, b
+
+        result = simulate(tables, hold_ticks=2, timeout_ticks=2, release_on_finish=True)
+
+        self.assertEqual((result["completed"], result["deadlocked"], result["cycle_processes"]), (3, 1, 0))
+
+    def test_views(self):
+        """
+        Test, že pohledy čtou aktuální stav z tabulek a nemají slovník atributů.
+        """
+        tables = CompactTables.from_section(SECTION)
+        simulate(tables, hold_ticks=1, timeout_ticks=5)
+
+        process = tables.process(0)
+        self.assertEqual(process.name, "Process 1")
+        self.assertTrue(process.deadlock_detected)
+        self.assertEqual(process.resource1.holder.name, "Process 1")
+        self.assertEqual(process.resource2.name, "Resource 2")
+        self.assertFalse(hasattr(process, "__dict__"))
+        with self.assertRaises(IndexError):
+            tables.process(2)
+        with self.assertRaises(KeyError):
+            CompactTables.from_section({"resources": {}, "processes": SECTION["processes"]})
+
+    def test_generated_tables_are_compact(self):
+        """
+        Test, že vygenerované tabulky zabírají nejvýše desítky bajtů na proces a každý proces zamyká dva různé prostředky.
+        """
+        tables = CompactTables.generate(10_000, 5_000, seed=1)
+
+        self.assertLess(tables.nbytes(), 40 * 10_000)
+        self.assertTrue(all(a != b for a, b in zip(tables.first, tables.second)))
+        result = simulate(tables, hold_ticks=2, timeout_ticks=10, release_on_finish=True, jitter_ticks=50, seed=1)
+        self.assertEqual(result["completed"] + result["deadlocked"], 10_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
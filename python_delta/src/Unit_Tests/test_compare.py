@@ -0,0 +1,103 @@
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+from src.Parallelization_Problems.Compare import FIELDS, compare, main, run_policy, write_csv
+
+SECTION = {
+    "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+    "processes": [
+        {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+        {"name": "Process 2", "resource1": "r1", "resource2": "r2"},
+        {"name": "Process 3", "resource1": "r1", "resource2": "r2"},
+    ],
+}
+POLICIES = ("timeout-release", "wait-die", "wound-wait")
+
+class TestCompare(unittest.TestCase):
+    """
+    Jednotkové testy pro porovnání politik řízení souběhu.
+    Tato třída testuje běh stejné zátěže se všemi politikami a stejnými semínky,
+    porovnání strategií zamykání, souhrnnou tabulku a zápis do CSV.
+    """
+
+    def test_compare_policies(self):
+        """
+        Test, že každá politika proběhne se stejnými semínky a souhrn obsahuje propustnost,
+        latence, přerušení a čas procesoru.
+        """
+        rows, runs = compare(SECTION, POLICIES, repetitions=2, seed=7, hold_time=0.01)
+
+        self.assertEqual([row["policy"] for row in rows], list(POLICIES))
+        for policy in POLICIES:
+            self.assertEqual([run["seed"] for run in runs if run["policy"] == policy], [7, 8])
+        # Semínko určuje zpoždění startů: stejné pro všechny politiky, různé pro různá opakování
+        for seed in (7, 8):
+            delays = [run["start_delays"] for run in runs if run["seed"] == seed]
+            self.assertTrue(all(d == delays[0] for d in delays))
+        self.assertNotEqual(runs[0]["start_delays"], runs[-1]["start_delays"])
+        for row in rows:
+            self.assertEqual(set(row), set(FIELDS))
+            self.assertEqual(row["runs"], 2)
+            self.assertEqual(row["completed"], 3)
+            self.assertEqual(row["deadlocks"], 0)
+            self.assertGreater(row["throughput"], 0)
+            self.assertLessEqual(row["latency_mean"], row["latency_p99"])
+            self.assertLessEqual(row["latency_p95"], row["latency_p99"])
+            self.assertGreaterEqual(row["cpu_time"], 0)
+
+    def test_run_policy_latencies(self):
+        """
+        Test, že latence dokončených procesů rostou, protože procesy zamykají prostředky ve stejném pořadí.
+        """
+        result = run_policy(SECTION, "wait-die", hold_time=0.05, seed=1)
+        self.assertEqual(result["completed"], 3)
+        self.assertEqual(len(result["latencies"]), 3)
+        self.assertEqual(result["latencies"], sorted(result["latencies"]))
+        self.assertGreaterEqual(result["latencies"][-1], 0.05)
+        with self.assertRaises(ValueError):
+            run_policy(SECTION, "banker")
+        with self.assertRaises(ValueError):
+            compare(SECTION, POLICIES, repetitions=0)
+        with self.assertRaises(ValueError):
+            run_policy(SECTION, "wait-die", acquisition="unknown")
+
+    def test_compare_acquisitions(self):
+        """
+        Test, že příkazová řádka porovná zadané strategie zamykání a do CSV zapíše řádek pro každou dvojici
+        politiky a strategie.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "compare.csv")
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(main(["--generate", "1", "--policies", "wait-die,wound-wait",
+                                       "--acquisitions", "poll,block", "--repetitions", "1",
+                                       "--hold-time", "0.01", "--csv", path]), 0)
+            with open(path, newline="", encoding="utf-8") as f:
+                records = list(csv.DictReader(f))
+        self.assertEqual([(r["policy"], r["acquisition"]) for r in records],
+                         [("wait-die", "poll"), ("wound-wait", "poll"), ("wait-die", "block"), ("wound-wait", "block")])
+        self.assertIn("block", stdout.getvalue())
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["--generate", "1", "--acquisitions", "unknown"]), 1)
+
+    def test_write_csv(self):
+        """
+        Test zápisu souhrnu do souboru CSV.
+        """
+        rows, _ = compare(SECTION, ("wound-wait",), repetitions=1, hold_time=0.01)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "compare.csv")
+            write_csv(rows, path)
+            with open(path, newline="", encoding="utf-8") as f:
+                records = list(csv.DictReader(f))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["policy"], "wound-wait")
+        self.assertEqual(list(records[0]), FIELDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
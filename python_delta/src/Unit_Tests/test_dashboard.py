@@ -0,0 +1,115 @@
+import signal
+import sys
+import time
+import unittest
+from src.Parallelization_Problems.Dashboard import (FINISHED, QUEUE_SIZE, QUEUED, STOP_TIMEOUT, STOPPED, Run,
+                                                    RunPool, verdict)
+
+# Simulace, která vypíše mnoho řádků průběhu a na konec záznam s výsledkem
+CHATTY = ("import json, sys\n"
+          "for i in range(2000):\n"
+          "    print(f'řádek {i}', file=sys.stderr)\n"
+          "print(json.dumps({'run': 0, 'result': {'deadlock_detected': True}}))\n")
+
+class TestDashboard(unittest.TestCase):
+    """
+    Jednotkové testy pro souběžné běhy v GUI.
+    Tato třída testuje omezenou frontu výstupu běhu, spravedlivé rozdělení vykreslovaných řádků,
+    sdílený fond s omezeným počtem běhů a verdikty.
+    """
+
+    def test_bounded_queue_keeps_record(self):
+        """
+        Test, že výřečný běh zaplní nejvýše QUEUE_SIZE řádků, zbytek jen spočítá a výsledek neztratí.
+        """
+        run = Run("chatty", [sys.executable, "-c", CHATTY])
+        run.execute()
+
+        self.assertEqual(run.state, FINISHED)
+        self.assertEqual(run.returncode, 0)
+        self.assertEqual(run.lines.qsize(), QUEUE_SIZE)
+        self.assertEqual(run.dropped, 2000 - QUEUE_SIZE)
+        self.assertEqual(run.take(3), ["řádek 0\n", "řádek 1\n", "řádek 2\n"])
+        self.assertEqual(run.verdict(), "DEADLOCK")
+        self.assertGreater(run.elapsed, 0)
+
+    def test_drain_is_fair(self):
+        """
+        Test, že výřečný běh nevyčerpá rozpočet snímku a nevyčerpaný díl tichého běhu připadne ostatním.
+        """
+        pool = RunPool(workers=1)
+        self.addCleanup(pool.shutdown)
+        chatty, quiet, idle = Run("chatty", []), Run("quiet", []), Run("idle", [])
+        pool.runs.extend([chatty, quiet, idle])
+        for i in range(400):
+            chatty.lines.put(f"c{i}\n")
+        for i in range(10):
+            quiet.lines.put(f"q{i}\n")
+
+        batches = pool.drain(100)
+        self.assertEqual(len(batches[quiet]), 10)
+        self.assertEqual(len(batches[chatty]), 90)
+        self.assertNotIn(idle, batches)
+        self.assertEqual(batches[chatty][0], "c0\n")
+
+    def test_pool_limits_parallel_runs(self):
+        """
+        Test, že fond spustí nejvýše zadaný počet běhů a zastavený čekající běh se vůbec nespustí.
+        """
+        pool = RunPool(workers=1)
+        self.addCleanup(pool.shutdown)
+        command = [sys.executable, "-c", "import time; time.sleep(30)"]
+        first = pool.submit(Run("first", command))
+        second = pool.submit(Run("second", command))
+
+        deadline = time.time() + 10
+        while first.process is None and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(second.state, QUEUED)
+        second.stop()
+        first.stop()
+        self.assertEqual(first.state, STOPPED)
+        self.assertIsNotNone(first.process.wait(timeout=5))
+        self.assertIsNone(second.process)
+        self.assertEqual(second.verdict(), "zastaveno")
+        with self.assertRaises(ValueError):
+            RunPool(workers=0)
+
+    @unittest.skipIf(sys.platform == "win32", "SIGTERM nelze ignorovat")
+    def test_stop_does_not_block(self):
+        """
+        Test, že zastavení všech běhů se vrátí ihned i u procesů, které SIGTERM ignorují,
+        a ty jsou po STOP_TIMEOUT ukončeny násilně.
+        """
+        pool = RunPool(workers=2)
+        self.addCleanup(pool.shutdown)
+        command = [sys.executable, "-c", "import signal, sys, time\n"
+                   "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+                   "print('ready', file=sys.stderr, flush=True)\n"
+                   "time.sleep(30)\n"]
+        runs = [pool.submit(Run(f"run {i}", command)) for i in range(2)]
+        deadline = time.time() + 10
+        while any(run.lines.empty() for run in runs) and time.time() < deadline:
+            time.sleep(0.01)
+
+        start = time.time()
+        pool.stop_all()
+        self.assertLess(time.time() - start, 0.2)
+        for run in runs:
+            self.assertEqual(run.process.wait(timeout=STOP_TIMEOUT + 5), -signal.SIGKILL)
+            self.assertEqual(run.state, STOPPED)
+
+    def test_verdicts(self):
+        """
+        Test textu verdiktů jednotlivých scénářů.
+        """
+        self.assertEqual(verdict({"result": {"livelock_detected": True}}), "LIVELOCK")
+        self.assertEqual(verdict({"result": {"starvation_detected": True, "starved": ["P3"]}}), "VYHLADOVĚNÍ (P3)")
+        self.assertEqual(verdict({"cancelled": True, "result": {"deadlock_detected": True}}), "zrušeno")
+        protocols = [{"protocol": "none", "worst_wait": 4.0}, {"protocol": "inheritance", "worst_wait": 1.0}]
+        self.assertEqual(verdict({"result": {"protocols": protocols}}), "nejkratší čekání: inheritance (1.00 s)")
+        self.assertEqual(verdict({"result": {"deadlock_detected": False}}), "bez problému")
+
+
+if __name__ == '__main__':
+    unittest.main()
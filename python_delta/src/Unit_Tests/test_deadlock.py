@@ -1,7 +1,7 @@
 import unittest
 import threading
 import time
-from src.Parallelization_Problems.Deadlock import Resource, Process
+from src.Parallelization_Problems.Deadlock import Resource, Process, run_scenario
 
 class TestDeadlock(unittest.TestCase):
     """
@@ -169,5 +169,77 @@ class TestDeadlock(unittest.TestCase):
         self.assertTrue(process1.deadlock_detected, "Deadlock nebyl detekován v procesu 1.")
         self.assertTrue(process2.deadlock_detected, "Deadlock nebyl detekován v procesu 2.")
 
+    def test_invalid_strategy(self):
+        """
+        Test pro neznámou strategii získávání prostředků.
+        Tento test kontroluje, že proces s neznámou strategií nelze vytvořit.
+        """
+        resource1 = Resource("Resource 1")
+        resource2 = Resource("Resource 2")
+        with self.assertRaises(ValueError):
+            Process("Process 1", resource1, resource2, strategy="unknown")
+
+    def test_wait_die_prevents_deadlock(self):
+        """
+        Test strategie wait-die.
+        Tento test zajišťuje, že procesy zamykající zdroje v opačném pořadí deadlock nezpůsobí,
+        mladší proces se restartuje a oba procesy práci dokončí a zdroje uvolní.
+        """
+        resource1 = Resource("Resource 1")
+        resource2 = Resource("Resource 2")
+        process1 = Process("Process 1", resource1, resource2, strategy="wait-die", hold_time=0.2)
+        process2 = Process("Process 2", resource2, resource1, strategy="wait-die", hold_time=0.2)
+
+        process1.start()
+        process2.start()
+        process1.join()
+        process2.join()
+
+        self.assertTrue(process1.completed and process2.completed)
+        self.assertFalse(process1.deadlock_detected or process2.deadlock_detected)
+        self.assertEqual(process1.restarts, 0)  # Starší proces se nikdy nerestartuje
+        self.assertGreater(process2.restarts, 0)
+        self.assertFalse(resource1.lock.locked())
+        self.assertFalse(resource2.lock.locked())
+
+    def test_wound_wait_prevents_deadlock(self):
+        """
+        Test strategie wound-wait.
+        Tento test zajišťuje, že starší proces zraní mladšího držitele zdroje a oba procesy práci dokončí.
+        """
+        resource1 = Resource("Resource 1")
+        resource2 = Resource("Resource 2")
+        process1 = Process("Process 1", resource1, resource2, strategy="wound-wait", hold_time=0.2)
+        process2 = Process("Process 2", resource2, resource1, strategy="wound-wait", hold_time=0.2)
+
+        process1.start()
+        process2.start()
+        process1.join()
+        process2.join()
+
+        self.assertTrue(process1.completed and process2.completed)
+        self.assertEqual(process1.restarts, 0)
+        self.assertGreater(process2.restarts, 0)
+
+    def test_run_scenario_metrics(self):
+        """
+        Test metrik vrácených funkcí run_scenario.
+        Tento test kontroluje počet dokončených procesů, restarty a míru přerušení pro strategii wound-wait.
+        """
+        section = {
+            "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+            "processes": [
+                {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+                {"name": "Process 2", "resource1": "r2", "resource2": "r1"},
+            ],
+        }
+        result = run_scenario(section, strategy="wound-wait", hold_time=0.2)
+
+        self.assertFalse(result["deadlock_detected"])
+        self.assertEqual(result["completed"], 2)
+        self.assertEqual(result["aborts"], result["restarts"])
+        self.assertGreater(result["throughput"], 0)
+        self.assertLess(result["abort_rate"], 1)
+
 if __name__ == "__main__":
     unittest.main()
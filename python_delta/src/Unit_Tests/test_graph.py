@@ -0,0 +1,87 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import tempfile
+from src.Parallelization_Problems.Graph import WaitForGraph
+from src.Parallelization_Problems.CLI import main
+
+def event(kind, process=None, resource=None):
+    return {"kind": kind, "process": process, "resource": resource}
+
+class TestGraph(unittest.TestCase):
+    """
+    Jednotkové testy pro graf čekání zobrazovaný v GUI.
+    Tato třída testuje detekci cyklů, hlášení změněných prvků pro inkrementální překreslení
+    a průběžný výpis událostí z příkazové řádky.
+    """
+
+    def test_cycle_detected_and_broken(self):
+        """
+        Test, že vzájemné čekání dvou procesů vytvoří cyklus a vypršení čekání jej zruší.
+        """
+        graph = WaitForGraph()
+        for e in (event("acquired", "P1", "R1"), event("acquired", "P2", "R2"), event("wait", "P1", "R2")):
+            graph.apply(e)
+        self.assertEqual(graph.cycles, {})
+
+        dirty = graph.apply(event("wait", "P2", "R1"))
+        self.assertEqual(set(graph.cycles), {"P1", "P2"})
+        self.assertTrue(graph.edge_in_cycle(("hold", "R1")))
+        self.assertTrue({("wait", "P1"), ("wait", "P2"), ("hold", "R1"), ("hold", "R2")} <= dirty)
+
+        graph.apply(event("timeout", "P2", "R1"))
+        self.assertEqual(graph.cycles, {})
+        self.assertFalse(graph.edge_in_cycle(("wait", "P1")))
+
+    def test_only_changed_items_reported(self):
+        """
+        Test, že událost jednoho procesu ve velkém grafu hlásí jen jeho uzel a hrany.
+        """
+        graph = WaitForGraph()
+        for i in range(500):
+            graph.apply(event("wait", f"P{i}", f"R{i % 50}"))
+
+        dirty = graph.apply(event("acquired", "P7", "R7"))
+        self.assertEqual(dirty, {("wait", "P7"), ("hold", "R7")})
+
+        dirty = graph.apply(event("starved", "P8"))
+        self.assertEqual(dirty, {("p", "P8")})
+        self.assertEqual(graph.flags["P8"], "starved")
+
+    def test_cli_event_stream(self):
+        """
+        Test, že příkazová řádka s --events vypíše události před záznamem s výsledkem
+        a z událostí lze sestavit graf, ve kterém po dokončení nikdo nic nedrží.
+        """
+        handle, config_file = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump({"deadlock_livelock": {
+                "resources": {"r1": {"name": "R1"}, "r2": {"name": "R2"}},
+                "processes": [
+                    {"name": "P1", "resource1": "r1", "resource2": "r2"},
+                    {"name": "P2", "resource1": "r2", "resource2": "r1"},
+                ]}}, f)
+        self.addCleanup(os.remove, config_file)
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            code = main(["--config", config_file, "--scenario", "deadlock", "--strategy", "wound-wait",
+                         "--hold-time", "0.1", "--events", "--format", "jsonl"])
+        self.assertEqual(code, 0)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        events = [r for r in records if r.get("type") == "event"]
+        self.assertEqual(records[-1]["scenario"], "deadlock")
+        self.assertIn("acquired", {e["kind"] for e in events})
+
+        graph = WaitForGraph()
+        for e in events:
+            graph.apply(e)
+        self.assertEqual(set(graph.processes), {"P1", "P2"})
+        self.assertEqual(graph.holders, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from src.Parallelization_Problems.Livelock import Resource, Process
+import time
+from src.Parallelization_Problems.Livelock import Resource, Process, Watchdog
 
 class TestResource(unittest.TestCase):
     """
@@ -56,5 +57,56 @@ class TestResource(unittest.TestCase):
         # Ověřujeme, zda byl livelock detekován
         self.assertTrue(process1.livelock_detected or process2.livelock_detected)
 
+    def test_watchdog_flags_changes_without_progress(self):
+        """
+        Test hlídače pokroku.
+        Tento test ručně mění čítače dvou procesů: proces, který mění stav bez pokroku, je označen
+        jako livelock, zatímco proces, který zároveň postupuje, označen není.
+        """
+        watchdog = Watchdog(interval=0.02, window=0.2, min_changes=5)
+        stuck = Process("Process 1", Resource("Resource 1"), Resource("Resource 2"), watchdog)
+        working = Process("Process 2", Resource("Resource 3"), Resource("Resource 4"), watchdog)
+        watchdog.start()
+
+        for _ in range(20):
+            stuck.state_changes += 1
+            working.state_changes += 1
+            working.progress += 1
+            time.sleep(0.01)
+        watchdog.stop()
+        watchdog.join()
+
+        self.assertTrue(stuck.livelock_detected)
+        self.assertFalse(working.livelock_detected)
+        self.assertIn("Process 1", watchdog.detections)
+
+    def test_watchdog_detects_livelock_before_retry_budget(self):
+        """
+        Test detekce livelocku hlídačem ve skutečném scénáři.
+        Hlídač ohlásí livelock již po prvním neúspěšném cyklu, tedy dříve než po třech pokusech.
+        """
+        resource1 = Resource("Resource 1")
+        resource2 = Resource("Resource 2")
+        watchdog = Watchdog(interval=0.25)
+        process1 = Process("Process 1", resource1, resource2, watchdog)
+        process2 = Process("Process 2", resource2, resource1, watchdog)
+
+        watchdog.start()
+        process1.start()
+        process2.start()
+        process1.join()
+        process2.join()
+        watchdog.stop()
+
+        self.assertTrue(process1.livelock_detected and process2.livelock_detected)
+        self.assertLess(max(watchdog.detections.values()), 10)
+
+    def test_invalid_watchdog(self):
+        """
+        Test, že hlídač s oknem kratším než perioda vzorkování nelze vytvořit.
+        """
+        with self.assertRaises(ValueError):
+            Watchdog(interval=1, window=0.5)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+from src.Parallelization_Problems import Events
+from src.Parallelization_Problems.Metrics import MetricsCollector, exporting
+
+class TestMetrics(unittest.TestCase):
+    """
+    Jednotkové testy pro export metrik.
+    Tato třída testuje počítání událostí ve shardech vláken, textový formát Prometheus,
+    HTTP server a zápis snímku do souboru.
+    """
+
+    def test_collector_counts_events(self):
+        """
+        Test, že sběrač sečte získání, čekání, držitele a verdikty z více vláken.
+        """
+        collector = MetricsCollector()
+
+        def worker(name):
+            collector({"kind": "wait", "ts": 1.0, "process": name, "resource": "R"})
+            collector({"kind": "acquired", "ts": 1.002, "process": name, "resource": "R"})
+            collector({"kind": "released", "ts": 1.003, "process": name, "resource": "R"})
+
+        threads = [threading.Thread(target=worker, args=(f"P{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        collector({"kind": "wait", "ts": 2.0, "process": "Q", "resource": "R"})
+        collector({"kind": "acquired", "ts": 2.0, "process": "Q", "resource": "S"})
+        collector({"kind": "deadlock", "ts": 2.0, "process": "Q", "resource": None})
+
+        state = collector.snapshot()
+        self.assertEqual(state["acquired"], {"R": 4, "S": 1})
+        self.assertEqual(state["blocked"], {"R": 1})
+        self.assertEqual(state["holders"], {"S": "Q"})
+        self.assertEqual(state["histograms"]["R"]["count"], 4)
+        self.assertEqual(state["histograms"]["R"]["counts"][1], 4)  # Všechna čekání do 5 ms
+        self.assertEqual(state["verdicts"]["deadlock"], 1)
+
+    def test_finished_threads_are_folded(self):
+        """
+        Test, že shardy skončených vláken se při čtení přičtou k souhrnu a odeberou, takže počet shardů
+        neroste s počtem vláken a opakované čtení nic nezapočte dvakrát.
+        """
+        collector = MetricsCollector()
+
+        def worker(name):
+            collector({"kind": "wait", "ts": 1.0, "process": name, "resource": "R"})
+            collector({"kind": "acquired", "ts": 1.002, "process": name, "resource": "R"})
+            collector({"kind": "backoff", "ts": 1.003, "process": name, "resource": None})
+
+        for _ in range(5):  # Nový fond vláken pro každý běh
+            threads = [threading.Thread(target=worker, args=(f"P{i}",)) for i in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            collector.snapshot()
+            self.assertEqual(len(collector._shards), 0)
+
+        for state in (collector.snapshot(), collector.snapshot()):
+            self.assertEqual(state["acquired"], {"R": 100})
+            self.assertEqual(state["histograms"]["R"]["count"], 100)
+            self.assertEqual(state["backoffs"], 100)
+            self.assertEqual(state["blocked"], {})
+
+    def test_render_prometheus_format(self):
+        """
+        Test, že výstup obsahuje kumulativní histogram s +Inf a escapované hodnoty štítků.
+        """
+        collector = MetricsCollector(buckets=(0.1, 1.0))
+        collector({"kind": "wait", "ts": 0.0, "process": "P", "resource": 'R "1"'})
+        collector({"kind": "acquired", "ts": 0.5, "process": "P", "resource": 'R "1"'})
+
+        text = collector.render()
+        self.assertIn('parallelization_wait_seconds_bucket{resource="R \\"1\\"",le="0.1"} 0', text)
+        self.assertIn('parallelization_wait_seconds_bucket{resource="R \\"1\\"",le="+Inf"} 1', text)
+        self.assertIn('parallelization_holder{resource="R \\"1\\"",process="P"} 1', text)
+        self.assertIn("# TYPE parallelization_wait_seconds histogram", text)
+        with self.assertRaises(ValueError):
+            MetricsCollector(buckets=(1.0, 0.1))
+
+    def test_server_and_snapshot(self):
+        """
+        Test, že během bloku exporting lze metriky stáhnout přes HTTP a na konci se zapíše snímek.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.prom")
+            with exporting(port=0, path=path, interval=60) as (collector, server):
+                Events.emit("acquired", "P", "R")
+                with urllib.request.urlopen(server.url, timeout=5) as response:
+                    body = response.read().decode("utf-8")
+                    self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+            self.assertIn('parallelization_acquire_total{resource="R"} 1', body)
+            with open(path, encoding="utf-8") as f:
+                self.assertIn('parallelization_acquire_total{resource="R"} 1', f.read())
+        self.assertFalse(Events.enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from src.Parallelization_Problems.MonteCarlo import estimate, np, run_threaded, simulate, wilson_interval
+
+SECTION = {
+    "resources": {"r1": {"name": "Resource 1"}, "r2": {"name": "Resource 2"}},
+    "processes": [
+        {"name": "Process 1", "resource1": "r1", "resource2": "r2"},
+        {"name": "Process 2", "resource1": "r2", "resource2": "r1"},
+    ],
+}
+
+class TestMonteCarlo(unittest.TestCase):
+    """
+    Jednotkové testy pro Monte Carlo odhad pravděpodobnosti deadlocku.
+    Tato třída testuje interval spolehlivosti, vektorovou simulaci proti analytickému výsledku
+    a shodu s vláknovými procesy Deadlock.Process.
+    """
+
+    def test_wilson_interval(self):
+        """
+        Test, že Wilsonův interval obsahuje odhad a pro nulový počet úspěchů začíná v nule.
+        """
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low + high, 1.0)
+        self.assertLess(low, 0.5)
+        self.assertEqual(wilson_interval(0, 10)[0], 0.0)
+        self.assertGreater(wilson_interval(0, 10)[1], 0.0)
+        with self.assertRaises(ValueError):
+            wilson_interval(3, 2)
+
+    @unittest.skipUnless(np, "vyžaduje NumPy")
+    def test_estimate_matches_analytic_probability(self):
+        """
+        Test, že pro dva procesy s opačným pořadím, dobou držení 1 s a startem rovnoměrně v [0, 2] s
+        odpovídá odhad analytické pravděpodobnosti P(|s1 - s2| < 1) = 0.75.
+        """
+        result = estimate(SECTION, samples=200_000, hold=1.0, hold_spread=0.0, jitter=2.0,
+                          random_order=False, seed=1)
+
+        self.assertLessEqual(result["ci_low"] - 0.005, 0.75)
+        self.assertGreaterEqual(result["ci_high"] + 0.005, 0.75)
+
+    def test_threaded_reference(self):
+        """
+        Test, že vláknové procesy uvolňující prostředky uváznou jen při překrývajícím se startu
+        a vektorová simulace (je-li k dispozici NumPy) dá stejný verdikt.
+        """
+        cases = [([0.0, 0.05], [0.3, 0.3], True), ([0.0, 0.6], [0.2, 0.2], False)]
+        for starts, holds, expected in cases:
+            self.assertEqual(run_threaded(SECTION, starts, holds, timeout=1.5), expected)
+            if np is not None:
+                predicted = simulate([[0, 1]], [[1, 0]], [starts], [holds])
+                self.assertEqual(bool(predicted[0]), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.Parallelization_Problems import Deadlock
+from src.Parallelization_Problems.Profiler import Profiler, profiling, thread_cpu_time
+
+class TestProfiler(unittest.TestCase):
+    """
+    Jednotkové testy pro vzorkovací profiler vláken.
+    Tato třída testuje rozdělení času vláken na spánek, čekání na zámek, čekání na výstup
+    a výpočet a zápis profilu ve formátu collapsed stacks.
+    """
+
+    def test_waiting_states(self):
+        """
+        Test, že profiler rozliší spánek, čekání na zámek a čekání na zámek výstupu.
+        """
+        lock = threading.Lock()
+
+        def sleeper():
+            time.sleep(0.4)
+
+        def locker():
+            with lock:
+                pass
+
+        def writer():
+            with Deadlock.output_lock:
+                pass
+
+        threads = [threading.Thread(target=target, name=target.__name__) for target in (sleeper, locker, writer)]
+        lock.acquire()
+        Deadlock.output_lock.acquire()
+        try:
+            with profiling(interval=0.01) as profiler:
+                for thread in threads:
+                    thread.start()
+                time.sleep(0.3)
+                lock.release()
+                Deadlock.output_lock.release()
+                for thread in threads:
+                    thread.join()
+        finally:
+            if lock.locked():
+                lock.release()
+            if Deadlock.output_lock.locked():
+                Deadlock.output_lock.release()
+
+        summary = profiler.summary()
+        self.assertGreater(summary["sleeper"]["sleep"], 0.2)
+        self.assertGreater(summary["locker"]["lock_wait"], 0.2)
+        self.assertGreater(summary["writer"]["output_wait"], 0.2)
+        # Vlákno, které profiler spustilo, se vzorkuje také (u zátěže v něm běží generátor příchodů)
+        self.assertGreater(summary[threading.current_thread().name]["sleep"], 0.2)
+        self.assertNotIn("Profiler", summary)
+
+    @unittest.skipIf(thread_cpu_time(threading.get_ident()) is None, "platforma neposkytuje hodiny vláken")
+    def test_cpu_bound_threads_split_running_and_runnable(self):
+        """
+        Test, že dvě výpočetní vlákna se o GIL dělí: část času běží a část čeká na GIL.
+        """
+        def spin():
+            end = time.perf_counter() + 0.5
+            while time.perf_counter() < end:
+                pass
+
+        threads = [threading.Thread(target=spin, name=f"Spin {i}") for i in range(2)]
+        with profiling(interval=0.01) as profiler:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for name in ("Spin 0", "Spin 1"):
+            states = profiler.summary()[name]
+            self.assertGreater(states["running"], 0.05)
+            self.assertGreater(states["runnable"], 0.05)
+
+    def test_collapsed_file(self):
+        """
+        Test formátu collapsed stacks: rámce oddělené středníkem, stav jako poslední rámec a kladná váha.
+        """
+        thread = threading.Thread(target=time.sleep, args=(0.2,), name="Sleeper;1")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.folded")
+            with profiling(path, interval=0.01) as profiler:
+                thread.start()
+                thread.join()
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+
+        self.assertTrue(lines)
+        self.assertEqual(lines, profiler.collapsed())
+        self.assertIn("Sleeper:1", {line.split(";", 1)[0] for line in lines})
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            frames = stack.split(";")
+            self.assertIn(frames[0], ("Sleeper:1", threading.current_thread().name))
+            self.assertRegex(frames[-1], r"^\[(running|runnable|sleep|lock_wait|output_wait)\]$")
+            self.assertGreater(int(weight), 0)
+        with self.assertRaises(ValueError):
+            Profiler(interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from src.Parallelization_Problems.Shard import balance, generate_section, partition, run_sharded
+
+class TestShard(unittest.TestCase):
+    """
+    Jednotkové testy pro rozdělení scénářů na nezávislé části.
+    Tato třída testuje hledání komponent přes sdílené prostředky, rozložení částí
+    mezi pracovní procesy a sloučení výsledků.
+    """
+
+    def test_partition_components(self):
+        """
+        Test, že procesy sdílející prostředek (i nepřímo) jsou ve stejné části a nepoužité prostředky se vynechají.
+        """
+        section = {
+            "resources": {key: {"name": key} for key in ("a", "b", "c", "x", "y", "unused")},
+            "processes": [
+                {"name": "P1", "resource1": "a", "resource2": "b"},
+                {"name": "Q1", "resource1": "x", "resource2": "y"},
+                {"name": "P2", "resource1": "b", "resource2": "c"},
+                {"name": "S", "resource": "c", "priority": 1},
+                {"name": "Q2", "resource1": "y", "resource2": "x"},
+            ],
+            "inversion": {"processes": []},
+        }
+
+        shards = partition(section)
+
+        self.assertEqual([[p["name"] for p in shard["processes"]] for shard in shards],
+                         [["P1", "P2", "S"], ["Q1", "Q2"]])
+        self.assertEqual(set(shards[0]["resources"]), {"a", "b", "c"})
+        self.assertEqual(set(shards[1]["resources"]), {"x", "y"})
+        self.assertIn("inversion", shards[1])
+
+    def test_balance(self):
+        """
+        Test, že části se rozloží mezi pracovní procesy rovnoměrně a žádný proces simulace se neztratí.
+        """
+        section = generate_section(10, processes_per_group=3, seed=1)
+        batches = balance(partition(section), 4)
+
+        self.assertEqual(len(batches), 4)
+        self.assertEqual(sorted(len(batch["processes"]) for batch in batches), [6, 6, 9, 9])
+        self.assertEqual(sum(len(batch["resources"]) for batch in batches), 30)
+
+    def test_run_sharded_merges_results(self):
+        """
+        Test, že sloučený výsledek sečte procesy ze všech částí a přenese verdikt deadlocku.
+        """
+        section = generate_section(3, processes_per_group=2, resources_per_group=2, seed=1)
+        result = run_sharded("deadlock", section, workers=2, strategy="wound-wait", hold_time=0.05)
+
+        self.assertEqual(result["processes"], 6)
+        self.assertEqual(result["completed"], 6)
+        self.assertFalse(result["deadlock_detected"])
+        self.assertEqual((result["shards"], result["workers"]), (3, 2))
+
+        with self.assertRaises(ValueError):
+            run_sharded("inversion", section)
+
+
+if __name__ == '__main__':
+    unittest.main()
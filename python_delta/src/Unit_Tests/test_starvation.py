@@ -1,6 +1,6 @@
 import unittest
 import time
-from src.Parallelization_Problems.Starvation import Resource, Process
+from src.Parallelization_Problems.Starvation import Resource, Process, compare_protocols
 
 class TestStarvation(unittest.TestCase):
     """
@@ -83,6 +83,36 @@ class TestStarvation(unittest.TestCase):
         # Počkáme, až proces dokončí svůj úkol
         process1.join()
 
+    def test_invalid_protocol(self):
+        """
+        Test, že zdroj s neznámým protokolem nebo protokol 'ceiling' bez stropu nelze vytvořit.
+        """
+        with self.assertRaises(ValueError):
+            Resource("Zdroj", protocol="unknown")
+        with self.assertRaises(ValueError):
+            Resource("Zdroj", protocol="ceiling")
+
+    def test_priority_inheritance_shortens_worst_wait(self):
+        """
+        Test scénáře inverze priorit se třemi úrovněmi.
+        Tento test kontroluje, že dědění priority i prioritní strop zkrátí čekání procesu s nejvyšší prioritou,
+        protože proces se střední prioritou již nemůže předběhnout držitele zdroje.
+        """
+        section = {
+            "resources": {"r1": {"name": "Resource 1"}},
+            "inversion": {"processes": [
+                {"name": "Low", "resource": "r1", "priority": 3, "start": 0.0, "critical": 0.3},
+                {"name": "Medium", "priority": 2, "start": 0.05, "work": 0.6},
+                {"name": "High", "resource": "r1", "priority": 1, "start": 0.1, "critical": 0.05},
+            ]},
+        }
+        none, inheritance, ceiling = compare_protocols(section)
+
+        self.assertGreater(none["worst_wait"], 0.6)
+        self.assertLess(inheritance["worst_wait"], 0.45)
+        self.assertLess(ceiling["worst_wait"], 0.45)
+        self.assertGreater(inheritance["reduction"], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import time
+from src.Parallelization_Problems.Timeouts import FixedTimeout, AdaptiveTimeout, compare
+from src.Parallelization_Problems.Livelock import Resource
+from src.Parallelization_Problems.Starvation import Resource as StarvationResource
+
+class TestTimeouts(unittest.TestCase):
+    """
+    Jednotkové testy pro pevné a adaptivní časové limity získávání zdrojů.
+    Tato třída testuje učení limitu z dob držení, jeho použití ve třídě Resource
+    a porovnání latence detekce a falešných poplachů s pevným limitem.
+    """
+
+    def test_fixed_timeout(self):
+        """
+        Test, že pevný limit vrací stále stejnou hodnotu a neplatný limit je odmítnut.
+        """
+        policy = FixedTimeout()
+        policy.observe(100)
+        self.assertEqual(policy.timeout(waiters=3), 5)
+        with self.assertRaises(ValueError):
+            FixedTimeout(0)
+
+    def test_adaptive_timeout_learns_short_holds(self):
+        """
+        Test, že adaptivní limit po zahřátí odpovídá krátkým dobám držení a roste s počtem čekajících.
+        """
+        policy = AdaptiveTimeout(warmup=3, minimum=0.01)
+        self.assertEqual(policy.timeout(), 5)  # Před zahřátím platí počáteční limit
+
+        for _ in range(20):
+            policy.observe(0.1)
+        self.assertAlmostEqual(policy.timeout(), 0.1, places=3)
+        self.assertAlmostEqual(policy.timeout(waiters=2), 0.3, places=3)
+
+    def test_adaptive_timeout_respects_bounds(self):
+        """
+        Test, že adaptivní limit nepřekročí zadané minimum a maximum.
+        """
+        policy = AdaptiveTimeout(minimum=0.5, maximum=2, warmup=1)
+        policy.observe(0.001)
+        self.assertEqual(policy.timeout(), 0.5)
+        policy = AdaptiveTimeout(minimum=0.5, maximum=2, warmup=1)
+        policy.observe(50)
+        self.assertEqual(policy.timeout(), 2)
+
+    def test_invalid_policy(self):
+        """
+        Test, že zdroj odmítne politiku bez metod timeout() a observe().
+        """
+        with self.assertRaises(ValueError):
+            Resource("Zdroj", timeout_policy=object())
+
+    def test_resource_uses_learned_timeout(self):
+        """
+        Test, že zdroj s adaptivní politikou se naučí krátké doby držení a čekající pak vyprší
+        po naučeném limitu, a ne až po celé pauze mezi pokusy o zamčení.
+        """
+        resource = Resource("Zdroj", timeout_policy=AdaptiveTimeout(warmup=2, minimum=0.05))
+        for _ in range(3):
+            resource.acquire("Proces 1")
+            time.sleep(0.02)
+            resource.release("Proces 1")
+
+        resource.acquire("Proces 1")
+        learned = resource.timeout_policy.timeout()
+        self.assertLess(learned, 0.5)
+        start_time = time.time()
+        with self.assertRaises(TimeoutError):
+            resource.acquire("Proces 2")
+        self.assertLess(time.time() - start_time, learned + 0.1)
+
+    def test_starvation_resource_raises_on_timeout(self):
+        """
+        Test, že zdroj scénáře vyhladovění po vypršení naučeného limitu vyvolá TimeoutError
+        a zámek zůstane držen původním procesem.
+        """
+        resource = StarvationResource("Zdroj", timeout_policy=AdaptiveTimeout(warmup=2, minimum=0.05))
+        for _ in range(3):
+            resource.acquire("A")
+            time.sleep(0.01)
+            resource.release("A")
+
+        resource.acquire("A")
+        with self.assertRaises(TimeoutError):
+            resource.acquire("B")
+        self.assertTrue(resource.lock.locked())
+        resource.release("A")
+        self.assertFalse(resource.lock.locked())
+
+    def test_compare_against_fixed_timeout(self):
+        """
+        Test, že adaptivní limit zkrátí latenci detekce při krátkých drženích
+        a sníží počet falešných poplachů při dlouhých drženích.
+        """
+        results = {(r["hold_mean"], r["policy"]): r for r in compare(hold_means=(0.05, 8.0), samples=2000)}
+
+        self.assertLess(results[(0.05, "adaptive")]["detection_latency_mean"],
+                        results[(0.05, "fixed")]["detection_latency_mean"])
+        self.assertLess(results[(8.0, "adaptive")]["false_positive_rate"],
+                        results[(8.0, "fixed")]["false_positive_rate"])
+
+
+if __name__ == '__main__':
+    unittest.main()
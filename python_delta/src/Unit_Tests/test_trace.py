@@ -0,0 +1,95 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+from src.Parallelization_Problems import Events
+from src.Parallelization_Problems.Trace import tracing
+from src.Parallelization_Problems.Livelock import Resource
+
+class TestTrace(unittest.TestCase):
+    """
+    Jednotkové testy pro export časové osy ve formátu Chrome Trace Event.
+    Tato třída testuje přihlašování posluchačů událostí, úseky čekání a držení,
+    šipky od uvolnění k odblokovanému procesu a uložení do souboru.
+    """
+
+    def test_emit_without_sinks_is_noop(self):
+        """
+        Test, že bez posluchačů nejsou události nikam doručeny a po odhlášení posluchač nic nedostane.
+        """
+        received = []
+        sink = received.append
+        Events.emit("wait", "P", "R")
+        Events.subscribe(sink)
+        Events.emit("wait", "P", "R")
+        Events.unsubscribe(sink)
+        Events.emit("wait", "P", "R")
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["process"], "P")
+        self.assertFalse(Events.enabled())
+
+    def test_wait_hold_and_flow(self):
+        """
+        Test, že čekání a držení zdroje vytvoří úseky a uvolnění zdroje je šipkou spojeno s čekajícím procesem.
+        """
+        resource = Resource("R")
+        with tracing() as tracer:
+            resource.acquire("Holder")
+
+            def waiter():
+                resource.acquire("Waiter", timeout=3)
+                resource.release("Waiter")
+
+            thread = threading.Thread(target=waiter, name="Waiter")
+            thread.start()
+            time.sleep(0.2)
+            resource.release("Holder")
+            thread.join()
+
+        events = tracer.to_dict()["traceEvents"]
+        slices = [e for e in events if e["ph"] == "X"]
+        self.assertEqual(len([e for e in slices if e["cat"] == "hold"]), 2)
+        # Držitel získal zdroj okamžitě, čekající čekal až do uvolnění
+        self.assertEqual(len([e for e in slices if e["cat"] == "wait" and e["dur"] > 100000]), 1)
+
+        flow_starts = {e["id"] for e in events if e["ph"] == "s"}
+        flow_ends = [e for e in events if e["ph"] == "f"]
+        self.assertEqual(len(flow_ends), 1)
+        self.assertIn(flow_ends[0]["id"], flow_starts)
+        self.assertEqual(flow_ends[0]["tid"], thread.ident)
+
+    def test_timeout_and_open_hold(self):
+        """
+        Test, že timeout je okamžitá událost a zdroj držený do konce záznamu je uzavřen jako nedokončený úsek.
+        """
+        resource = Resource("R")
+        with tracing() as tracer:
+            resource.acquire("Holder")
+            with self.assertRaises(TimeoutError):
+                resource.acquire("Waiter", timeout=0.1)
+
+        events = tracer.to_dict()["traceEvents"]
+        self.assertEqual([e["name"] for e in events if e["ph"] == "i"], ["timeout"])
+        open_holds = [e for e in events if e["ph"] == "X" and e["cat"] == "hold"]
+        self.assertTrue(open_holds[0]["args"]["unfinished"])
+
+    def test_save(self):
+        """
+        Test, že časová osa je uložena jako platný JSON s pojmenovanými stopami vláken.
+        """
+        path = os.path.join(tempfile.mkdtemp(), "trace.json")
+        with tracing(path):
+            Events.emit("livelock", "Process 1")
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        names = [e["args"]["name"] for e in data["traceEvents"] if e["name"] == "thread_name"]
+        self.assertEqual(names, [threading.current_thread().name])
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import threading
+import time
+from src.Parallelization_Problems.Cancellation import CancellationToken
+from src.Parallelization_Problems.Workload import PriorityResource, WorkloadGenerator, percentile, run_workload
+
+class TestWorkload(unittest.TestCase):
+    """
+    Jednotkové testy pro generátor zátěže s Poissonovými příchody.
+    Tato třída testuje přidělování zdroje podle priority, výpočet percentilů
+    a statistiky generátoru při běžné zátěži i při přetížení.
+    """
+
+    def test_percentile(self):
+        """
+        Test výpočtu percentilu metodou nejbližšího pořadí.
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertIsNone(percentile([], 50))
+
+    def test_priority_resource_grants_highest_priority_first(self):
+        """
+        Test, že uvolněný zdroj dostane čekající s nejvyšší prioritou, nikoli ten, kdo čeká nejdéle.
+        """
+        resource = PriorityResource("Zdroj")
+        self.assertTrue(resource.acquire(1, 0))
+        order = []
+
+        def waiter(priority, seq):
+            resource.acquire(priority, seq)
+            order.append(priority)
+            resource.release()
+
+        low = threading.Thread(target=waiter, args=(3, 1))
+        high = threading.Thread(target=waiter, args=(1, 2))
+        low.start()
+        time.sleep(0.05)
+        high.start()
+        time.sleep(0.05)
+        resource.release()
+        low.join()
+        high.join()
+
+        self.assertEqual(order, [1, 3])
+
+    def test_closed_resource_rejects_waiters(self):
+        """
+        Test, že uzavření zdroje probudí čekající a acquire vrátí False.
+        """
+        resource = PriorityResource("Zdroj")
+        resource.acquire(1, 0)
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(resource.acquire(2, 1)))
+        waiter.start()
+        time.sleep(0.05)
+        resource.close()
+        waiter.join(1)
+
+        self.assertEqual(results, [False])
+
+    def test_invalid_class(self):
+        """
+        Test, že třída procesů s nekladnou intenzitou příchodů nebo neznámým rozdělením doby obsluhy
+        je odmítnuta hned při vytvoření generátoru, dřív než se spustí pracovní vlákna.
+        """
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(PriorityResource("Zdroj"), [{"priority": 1, "rate": 0}], 1)
+        threads = threading.active_count()
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(PriorityResource("Zdroj"),
+                              [{"priority": 1, "rate": 5, "service": {"distribution": "pareto", "mean": 0.1}}], 1)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_light_load_serves_all_priorities(self):
+        """
+        Test, že při nízké zátěži jsou obslouženy procesy všech priorit.
+        """
+        section = {
+            "resources": {"r1": {"name": "Resource 1"}},
+            "workload": {"resource": "r1", "duration": 0.5, "workers": 4, "classes": [
+                {"priority": 1, "rate": 20, "service": {"distribution": "constant", "mean": 0.001}},
+                {"priority": 2, "rate": 20, "service": {"distribution": "constant", "mean": 0.001}},
+            ]},
+        }
+        report = run_workload(section, seed=7)
+
+        for stats in report.values():
+            self.assertGreater(stats["arrived"], 0)
+            self.assertEqual(stats["completed"] + stats["rejected"] + stats["unfinished"], stats["arrived"])
+            self.assertGreater(stats["throughput"], 0)
+
+    def test_overload_starves_low_priority(self):
+        """
+        Test, že při trvalém přetížení procesy s vysokou prioritou vyhladoví procesy s nízkou prioritou.
+        """
+        resource = PriorityResource("Zdroj")
+        generator = WorkloadGenerator(resource, [
+            {"priority": 1, "rate": 60, "service": {"distribution": "constant", "mean": 0.02}},
+            {"priority": 2, "rate": 20, "service": {"distribution": "constant", "mean": 0.02}},
+        ], duration=1.0, workers=32, seed=3)
+        report = generator.run()
+
+        self.assertGreater(report[2]["unfinished"], report[1]["unfinished"])
+        self.assertGreater(report[1]["completed"] / report[1]["arrived"],
+                           report[2]["completed"] / report[2]["arrived"])
+
+    def test_backlog_serves_high_priority_first(self):
+        """
+        Test, že proces s vysokou prioritou, který přijde za plnou frontou procesů s nízkou prioritou,
+        převezme jediné pracovní vlákno hned po dokončení rozpracovaného procesu.
+        """
+        resource = PriorityResource("Zdroj")
+        generator = WorkloadGenerator(resource, [
+            {"priority": 1, "rate": 5, "service": {"distribution": "constant", "mean": 0.05}},
+            {"priority": 2, "rate": 100, "service": {"distribution": "constant", "mean": 0.05}},
+        ], duration=1.0, workers=1, seed=5)
+        report = generator.run()
+
+        self.assertGreater(report[2]["unfinished"], 10)
+        self.assertGreater(report[1]["completed"], 0)
+        self.assertLess(report[1]["wait_max"], 0.15)
+        self.assertLess(report[1]["wait_max"], report[2]["wait_max"])
+
+    def test_cancelled_run_throughput(self):
+        """
+        Test, že propustnost zrušeného běhu se počítá ze skutečné délky běhu, ne z nastavené délky.
+        """
+        token = CancellationToken()
+        generator = WorkloadGenerator(PriorityResource("Zdroj"), [
+            {"priority": 1, "rate": 50, "service": {"distribution": "constant", "mean": 0.001}},
+        ], duration=10.0, workers=2, seed=1, token=token)
+        threading.Timer(0.3, token.cancel).start()
+        report = generator.run()
+
+        self.assertTrue(generator.cancelled)
+        self.assertLess(generator.elapsed, 1.0)
+        self.assertAlmostEqual(report[1]["throughput"], report[1]["completed"] / generator.elapsed)
+        self.assertGreater(report[1]["throughput"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()